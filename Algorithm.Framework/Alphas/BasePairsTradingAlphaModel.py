@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from enum import Enum
+from decimal import Decimal
 
 class BasePairsTradingAlphaModel(AlphaModel):
     '''This alpha model is designed to accept every possible pair combination
@@ -34,6 +35,8 @@ class BasePairsTradingAlphaModel(AlphaModel):
 
         self.pairs = dict()
         self.securities = set()
+        # one price feed per symbol, shared by all the pairs it is part of
+        self.ratios = self.PairRatios()
 
         self.name = f'{self.__class__.__name__}({self.lookback},{resolution},{Extensions.normalize_to_str(threshold)})'
 
@@ -92,7 +95,7 @@ class BasePairsTradingAlphaModel(AlphaModel):
                 if not self.has_passed_test(algorithm, asset_i, asset_j):
                     continue
 
-                pair = self.Pair(algorithm, asset_i, asset_j, self.prediction_interval, self.threshold)
+                pair = self.Pair(algorithm, asset_i, asset_j, self.prediction_interval, self.threshold, self.ratios)
                 self.pairs[pair_symbol] = pair
 
     def has_passed_test(self, algorithm, asset1, asset2):
@@ -105,6 +108,269 @@ class BasePairsTradingAlphaModel(AlphaModel):
             True if the statistical test for the pair is successful'''
         return True
 
+    class PairRatios:
+        '''Keeps the ratio of the prices of the pairs legs and its exponential moving average.
+        Each symbol has a single Identity indicator and consolidator, no matter how many pairs it is part of.
+        When a consolidator emits a bar, the ratios and means of the pairs of its symbol are updated at once.
+        A pair ratio is updated once both legs have a new price and the means are computed in decimal,
+        like the IndicatorExtensions.over and ExponentialMovingAverage composite of each pair would'''
+
+        RATIO = 'ratio'
+        MEAN = 'mean'
+        UPPER_THRESHOLD = 'upper_threshold'
+        LOWER_THRESHOLD = 'lower_threshold'
+
+        def __init__(self, period = 500):
+            '''Create a new set of pair ratios
+            Args:
+                period: The period of the exponential moving average of the ratios'''
+            self.period = period
+            self.smoothing_factor = Decimal(2) / (1 + period)
+            self.feeds = dict()
+
+            # per symbol
+            self.identities = np.zeros(0, dtype=object)
+            self.prices = np.zeros(0, dtype=object)
+            self.times = np.zeros(0, dtype=object)
+            self.free_symbols = []
+
+            # per pair
+            self.left = np.zeros(0, dtype=int)
+            self.right = np.zeros(0, dtype=int)
+            self.left_updated = np.zeros(0, dtype=bool)
+            self.right_updated = np.zeros(0, dtype=bool)
+            self.time = np.zeros(0, dtype=object)
+            self.ratio = np.zeros(0, dtype=object)
+            self.ratio_samples = np.zeros(0, dtype=int)
+            self.mean = np.zeros(0, dtype=object)
+            self.sum = np.zeros(0, dtype=object)
+            self.samples = np.zeros(0, dtype=int)
+            self.upper_factor = np.zeros(0, dtype=object)
+            self.lower_factor = np.zeros(0, dtype=object)
+            self.free_pairs = []
+
+        def add_pair(self, algorithm, asset1, asset2, threshold):
+            '''Adds a pair, creating the price feed of its legs if needed
+            Args:
+                algorithm: The algorithm instance
+                asset1: The first asset's symbol in the pair
+                asset2: The second asset's symbol in the pair
+                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
+            Returns:
+                The index of the pair'''
+            if not self.free_pairs:
+                self.grow_pairs()
+            index = self.free_pairs.pop()
+
+            self.left[index] = self.add_feed(algorithm, asset1, index)
+            self.right[index] = self.add_feed(algorithm, asset2, index)
+            self.left_updated[index] = self.right_updated[index] = False
+            self.time[index] = datetime.min
+            self.ratio[index] = self.mean[index] = self.sum[index] = Decimal(0)
+            self.ratio_samples[index] = self.samples[index] = 0
+            self.upper_factor[index] = Decimal(str(1 + threshold / 100))
+            self.lower_factor[index] = Decimal(str(1 - threshold / 100))
+            return index
+
+        def remove_pair(self, algorithm, index, asset1, asset2):
+            '''Removes a pair, removing the price feed of its legs if no other pair uses them'''
+            self.remove_feed(algorithm, asset1, index)
+            self.remove_feed(algorithm, asset2, index)
+            self.free_pairs.append(index)
+
+        def get_feed(self, symbol):
+            '''Gets the Identity indicator of the symbol and the consolidator it is registered to'''
+            feed = self.feeds[symbol]
+            return feed.identity, feed.consolidator
+
+        def get_value(self, field, index):
+            '''Gets the value of the ratio, the mean or a threshold of a pair'''
+            if field == self.RATIO:
+                return self.ratio[index]
+            if field == self.MEAN:
+                return self.mean[index]
+            factor = self.upper_factor if field == self.UPPER_THRESHOLD else self.lower_factor
+            return self.mean[index] * factor[index]
+
+        def get_samples(self, field, index):
+            '''Gets the number of updates of the ratio, the mean or a threshold of a pair'''
+            return self.ratio_samples[index] if field == self.RATIO else self.samples[index]
+
+        def is_ready(self, field, index):
+            '''Whether the ratio, the mean or a threshold of a pair is ready.
+            The ratio is ready once both legs have a price, the mean and thresholds after period ratios'''
+            if field == self.RATIO:
+                return self.identities[self.left[index]].is_ready and self.identities[self.right[index]].is_ready
+            return self.samples[index] >= self.period
+
+        def on_data_consolidated(self, feed, consolidated):
+            '''Keeps the new price of the symbol and updates the ratio and mean of its pairs whose other leg has a new price'''
+            self.prices[feed.index] = Decimal(str(consolidated.value))
+            self.times[feed.index] = consolidated.end_time
+
+            pairs = feed.get_pairs()
+            if len(pairs) == 0:
+                return
+
+            # the symbol is the first leg of some pairs and the second leg of the others
+            is_left = self.left[pairs] == feed.index
+            self.left_updated[pairs[is_left]] = True
+            self.right_updated[pairs[~is_left]] = True
+            ready = pairs[self.left_updated[pairs] & self.right_updated[pairs]]
+            if len(ready) == 0:
+                return
+            self.left_updated[ready] = self.right_updated[ready] = False
+            self.ratio_samples[ready] += 1
+
+            # like IndicatorExtensions.over, a zero denominator is a math error that leaves the ratio and its mean as they are
+            ready = ready[self.prices[self.right[ready]] != 0]
+            if len(ready) == 0:
+                return
+            ratio = self.prices[self.left[ready]] / self.prices[self.right[ready]]
+            samples = self.samples[ready] + 1
+
+            # the first value of the mean is the simple average of the first period ratios
+            warming_up = samples <= self.period
+            self.sum[ready[warming_up]] += ratio[warming_up]
+            mean = ratio * self.smoothing_factor + self.mean[ready] * (1 - self.smoothing_factor)
+            mean = np.where(samples == self.period, self.sum[ready] / self.period, mean)
+            mean = np.where(samples < self.period, Decimal(0), mean)
+
+            self.time[ready] = np.maximum(self.times[self.left[ready]], self.times[self.right[ready]])
+            self.ratio[ready] = ratio
+            self.mean[ready] = mean
+            self.samples[ready] = samples
+
+        def add_feed(self, algorithm, symbol, pair_index):
+            feed = self.feeds.get(symbol)
+            if feed is None:
+                # Created the Identity indicator for a given Symbol and
+                # the consolidator it is registered to. The consolidator reference
+                # will be used to remove it from SubscriptionManager
+                resolution = min([x.resolution for x in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol)])
+
+                name = algorithm.create_indicator_name(symbol, "close", resolution)
+                identity = Identity(name)
+
+                consolidator = algorithm.resolve_consolidator(symbol, resolution)
+                algorithm.register_indicator(symbol, identity, consolidator)
+
+                if not self.free_symbols:
+                    self.grow_symbols()
+                feed = self.PriceFeed(identity, consolidator, self.free_symbols.pop())
+                self.identities[feed.index] = identity
+                self.prices[feed.index] = Decimal(0)
+                self.times[feed.index] = datetime.min
+
+                feed.handler = lambda sender, consolidated: self.on_data_consolidated(feed, consolidated)
+                consolidator.data_consolidated += feed.handler
+                self.feeds[symbol] = feed
+
+            feed.add_pair(pair_index)
+            return feed.index
+
+        def remove_feed(self, algorithm, symbol, pair_index):
+            feed = self.feeds.get(symbol)
+            if feed is None:
+                return
+
+            feed.remove_pair(pair_index)
+            if not feed.pairs:
+                feed.consolidator.data_consolidated -= feed.handler
+                algorithm.subscription_manager.remove_consolidator(symbol, feed.consolidator)
+                self.identities[feed.index] = None
+                self.free_symbols.append(feed.index)
+                del self.feeds[symbol]
+
+        def grow_symbols(self):
+            size = len(self.prices)
+            new_size = max(16, size * 2)
+            for name in ['identities', 'prices', 'times']:
+                setattr(self, name, np.concatenate([getattr(self, name), np.zeros(new_size - size, dtype=object)]))
+            self.free_symbols.extend(reversed(range(size, new_size)))
+
+        def grow_pairs(self):
+            size = len(self.left)
+            new_size = max(16, size * 2)
+            for name in ['left', 'right', 'left_updated', 'right_updated', 'time', 'ratio', 'ratio_samples', 'mean', 'sum', 'samples', 'upper_factor', 'lower_factor']:
+                array = getattr(self, name)
+                setattr(self, name, np.concatenate([array, np.zeros(new_size - size, dtype=array.dtype)]))
+            self.free_pairs.extend(reversed(range(size, new_size)))
+
+        class PriceFeed:
+            '''The Identity indicator of a symbol, the consolidator it is registered to and the pairs using it'''
+            def __init__(self, identity, consolidator, index):
+                self.identity = identity
+                self.consolidator = consolidator
+                self.index = index
+                self.handler = None
+                self.pairs = []
+                self.pairs_array = None
+
+            def add_pair(self, pair_index):
+                self.pairs.append(pair_index)
+                self.pairs_array = None
+
+            def remove_pair(self, pair_index):
+                self.pairs.remove(pair_index)
+                self.pairs_array = None
+
+            def get_pairs(self):
+                '''Gets the indexes of the pairs using the symbol as an array'''
+                if self.pairs_array is None:
+                    self.pairs_array = np.array(self.pairs, dtype=int)
+                return self.pairs_array
+
+        class PairIndicator:
+            '''The ratio, the mean or a threshold of a pair, kept by the PairRatios along with those of the other pairs.
+            It exposes them like the indicator it replaces: name, current, samples, is_ready and comparisons'''
+            def __init__(self, name, ratios, index, field):
+                self.name = name
+                self.ratios = ratios
+                self.index = index
+                self.field = field
+
+            def get_value(self):
+                '''Gets the decimal value of the indicator'''
+                return self.ratios.get_value(self.field, self.index)
+
+            @property
+            def current(self):
+                return IndicatorDataPoint(self.ratios.time[self.index], float(self.get_value()))
+
+            @property
+            def samples(self):
+                return int(self.ratios.get_samples(self.field, self.index))
+
+            @property
+            def is_ready(self):
+                return bool(self.ratios.is_ready(self.field, self.index))
+
+            def compare_value(self, other):
+                if isinstance(other, BasePairsTradingAlphaModel.PairRatios.PairIndicator):
+                    return other.get_value()
+                if hasattr(other, 'current'):
+                    return Decimal(str(other.current.value))
+                return other
+
+            def __lt__(self, other):
+                return self.get_value() < self.compare_value(other)
+
+            def __le__(self, other):
+                return self.get_value() <= self.compare_value(other)
+
+            def __gt__(self, other):
+                return self.get_value() > self.compare_value(other)
+
+            def __ge__(self, other):
+                return self.get_value() >= self.compare_value(other)
+
+            def __float__(self):
+                return float(self.get_value())
+
+            def __str__(self):
+                return str(self.get_value())
+
     class Pair:
 
         class State(Enum):
@@ -112,54 +378,42 @@ class BasePairsTradingAlphaModel(AlphaModel):
             FLAT_RATIO = 0
             LONG_RATIO = 1
 
-        def __init__(self, algorithm, asset1, asset2, prediction_interval, threshold):
+        def __init__(self, algorithm, asset1, asset2, prediction_interval, threshold, ratios = None):
             '''Create a new pair
             Args:
                 algorithm: The algorithm instance that experienced the change in securities
                 asset1: The first asset's symbol in the pair
                 asset2: The second asset's symbol in the pair
                 prediction_interval: Period over which this insight is expected to come to fruition
-                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight'''
+                threshold: The percent [0, 100] deviation of the ratio from the mean before emitting an insight
+                ratios: The pair ratios shared with the other pairs of the model. If None, the pair keeps its own'''
             self.state = self.State.FLAT_RATIO
 
             self.algorithm = algorithm
             self.asset1 = asset1
             self.asset2 = asset2
 
-            # Created the Identity indicator for a given Symbol and
-            # the consolidator it is registered to. The consolidator reference
-            # will be used to remove it from SubscriptionManager
-            def create_identity_indicator(symbol: Symbol):
-                resolution = min([x.resolution for x in algorithm.subscription_manager.subscription_data_config_service.get_subscription_data_configs(symbol)])
-
-                name = algorithm.create_indicator_name(symbol, "close", resolution)
-                identity = Identity(name)
-
-                consolidator = algorithm.resolve_consolidator(symbol, resolution)
-                algorithm.register_indicator(symbol, identity, consolidator)
-
-                return identity, consolidator
-
-            self.asset1_price, self.identity_consolidator1 = create_identity_indicator(asset1);
-            self.asset2_price, self.identity_consolidator2 = create_identity_indicator(asset2);
-
-            self.ratio = IndicatorExtensions.over(self.asset1_price, self.asset2_price)
-            self.mean = IndicatorExtensions.of(ExponentialMovingAverage(500), self.ratio)
+            self.ratios = BasePairsTradingAlphaModel.PairRatios() if ratios is None else ratios
+            self.index = self.ratios.add_pair(algorithm, asset1, asset2, threshold)
 
-            upper = ConstantIndicator[IndicatorDataPoint]("ct", 1 + threshold / 100)
-            self.upper_threshold = IndicatorExtensions.times(self.mean, upper)
+            # The Identity indicators of the legs and the consolidators they are registered to,
+            # shared with the other pairs of the same symbols
+            self.asset1_price, self.identity_consolidator1 = self.ratios.get_feed(asset1)
+            self.asset2_price, self.identity_consolidator2 = self.ratios.get_feed(asset2)
 
-            lower = ConstantIndicator[IndicatorDataPoint]("ct", 1 - threshold / 100)
-            self.lower_threshold = IndicatorExtensions.times(self.mean, lower)
+            PairIndicator = BasePairsTradingAlphaModel.PairRatios.PairIndicator
+            self.ratio = PairIndicator(f'COMPOSE({self.asset1_price.name},{self.asset2_price.name})', self.ratios, self.index, self.ratios.RATIO)
+            self.mean = PairIndicator(f'EMA({self.ratios.period})', self.ratios, self.index, self.ratios.MEAN)
+            self.upper_threshold = PairIndicator(f'COMPOSE({self.mean.name},ct)', self.ratios, self.index, self.ratios.UPPER_THRESHOLD)
+            self.lower_threshold = PairIndicator(f'COMPOSE({self.mean.name},ct)', self.ratios, self.index, self.ratios.LOWER_THRESHOLD)
 
             self.prediction_interval = prediction_interval
 
         def dispose(self):
             '''
-            On disposal, remove the consolidators from the subscription manager
+            On disposal, remove the consolidators from the subscription manager if no other pair uses them
             '''
-            self.algorithm.subscription_manager.remove_consolidator(self.asset1, self.identity_consolidator1)
-            self.algorithm.subscription_manager.remove_consolidator(self.asset2, self.identity_consolidator2)
+            self.ratios.remove_pair(self.algorithm, self.index, self.asset1, self.asset2)
 
         def get_insight_group(self):
             '''Gets the insights group for the pair
@@ -68,19 +68,22 @@ class HistoricalReturnsAlphaModel(AlphaModel):
             self.cancel_insights(algorithm, removed.symbol)
 
         # initialize data for added securities
-        symbols = [ x.symbol for x in changes.added_securities ]
-        history = algorithm.history(symbols, self.lookback, self.resolution)
-        if history.empty: return
-
-        tickers = history.index.levels[0]
-        for ticker in tickers:
-            symbol = SymbolCache.get_symbol(ticker)
-
-            if symbol not in self._symbol_data_by_symbol:
-                symbol_data = SymbolData(symbol, self.lookback)
+        warm_up = IndicatorsWarmUp()
+        added = {}
+        for security in changes.added_securities:
+            symbol = security.symbol
+            if symbol not in self._symbol_data_by_symbol and symbol not in added:
+                added[symbol] = symbol_data = SymbolData(symbol, self.lookback)
+                symbol_data.warm_up_indicators(warm_up)
+
+        # a single history request for all the added symbols, the indicators are updated from C#
+        warmed_up = warm_up.warm_up(algorithm, self.lookback, self.resolution)
+
+        # only the symbols with history are tracked
+        for symbol, symbol_data in added.items():
+            if warmed_up.contains(symbol):
                 self._symbol_data_by_symbol[symbol] = symbol_data
                 symbol_data.register_indicators(algorithm, self.resolution)
-                symbol_data.warm_up_indicators(history.loc[ticker])
 
     def cancel_insights(self, algorithm, symbol):
         if not self.insight_collection.contains_key(symbol):
@@ -106,9 +109,8 @@ class SymbolData:
         if self.consolidator is not None:
             algorithm.subscription_manager.remove_consolidator(self.symbol, self.consolidator)
 
-    def warm_up_indicators(self, history):
-        for tuple in history.itertuples():
-            self.roc.update(tuple.Index, tuple.close)
+    def warm_up_indicators(self, warm_up):
+        warm_up.add(self.symbol, self.roc)
 
     @property
     def return_(self):
@@ -13,7 +13,6 @@
 
 from AlgorithmImports import *
 from Alphas.BasePairsTradingAlphaModel import BasePairsTradingAlphaModel
-from scipy.stats import pearsonr
 
 class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
     ''' This alpha model is designed to rank every pair combination by its pearson correlation
@@ -36,6 +35,10 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
         self.minimum_correlation = minimum_correlation
         self.best_pair = ()
 
+        # the symbols of the last screening and the correlation matrix of their log returns
+        self.screened_symbols = []
+        self.correlation = None
+
     def on_securities_changed(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed.
         Args:
@@ -54,23 +57,71 @@ class PearsonCorrelationPairsTradingAlphaModel(BasePairsTradingAlphaModel):
         history = algorithm.history(symbols, self.lookback, self.resolution)
 
         if not history.empty:
-            history = history.close.unstack(level=0)
+            df = self.get_price_dataframe(history.close.unstack(level=0))
+            self.set_correlation(symbols, df)
 
-            df = self.get_price_dataframe(history)
-            stop = len(df.columns)
+        best_pair = self.get_best_pair()
+        if best_pair is not None:
+            self.best_pair = best_pair
 
-            corr = dict()
+        super().on_securities_changed(algorithm, changes)
 
-            for i in range(0, stop):
-                for j in range(i+1, stop):
-                    if (j, i) not in corr:
-                        corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
+    def update_pairs(self, algorithm):
+        '''Only the best pair can pass the test, there's no need to go through every pair combination'''
+        if not self.best_pair:
+            return
 
-            corr = sorted(corr.items(), key = lambda kv: kv[1])
-            if corr[-1][1] >= self.minimum_correlation:
-                self.best_pair = (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+        asset1, asset2 = self.best_pair
+        if (asset1, asset2) in self.pairs or (asset2, asset1) in self.pairs:
+            return
 
-        super().on_securities_changed(algorithm, changes)
+        symbols = set(x.symbol for x in self.securities)
+        if asset1 not in symbols or asset2 not in symbols or not self.has_passed_test(algorithm, asset1, asset2):
+            return
+
+        self.pairs[(asset1, asset2)] = self.Pair(algorithm, asset1, asset2, self.prediction_interval, self.threshold, self.ratios)
+
+    def set_correlation(self, symbols, df):
+        '''Computes the correlation matrix of the log returns in one go
+        Args:
+            symbols: The sorted symbols of the securities
+            df: The log returns, one column per security'''
+        standardized_returns = self.standardize(df.values)
+        correlation = standardized_returns.T @ standardized_returns / len(df)
+
+        # keep the columns sorted by symbol, the pairs are made of (lower, higher) symbols
+        column_symbols = self.get_column_symbols(symbols, df.columns)
+        order = sorted(range(len(column_symbols)), key = lambda i: column_symbols[i])
+        self.screened_symbols = [column_symbols[i] for i in order]
+        self.correlation = correlation[np.ix_(order, order)]
+
+    def get_best_pair(self):
+        '''Gets the pair with the highest correlation, if it is at least the minimum correlation'''
+        if self.correlation is None or len(self.screened_symbols) < 2:
+            return None
+
+        rows, columns = np.triu_indices(len(self.screened_symbols), 1)
+        correlations = self.correlation[rows, columns]
+        if np.all(np.isnan(correlations)):
+            return None
+
+        maximum = np.nanmax(correlations)
+        if maximum < self.minimum_correlation:
+            return None
+
+        # on ties, the last pair in (i, j) order wins
+        k = np.flatnonzero(correlations == maximum)[-1]
+        return (self.screened_symbols[rows[k]], self.screened_symbols[columns[k]])
+
+    def get_column_symbols(self, symbols, columns):
+        '''Maps the data frame columns to the symbols'''
+        symbol_by_key = { str(symbol): symbol for symbol in symbols }
+        return [symbol_by_key.get(str(column), column) for column in columns]
+
+    def standardize(self, values):
+        '''Standardizes each column to zero mean and unit variance, constant columns are NaN'''
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (values - values.mean(axis=0)) / values.std(axis=0)
 
     def has_passed_test(self, algorithm, asset1, asset2):
         '''Check whether the assets pass a pairs trading test
@@ -70,19 +70,16 @@ class RsiAlphaModel(AlphaModel):
                 symbol_data.dispose()
 
         # initialize data for added securities
-        added_symbols = []
+        warm_up = IndicatorsWarmUp()
         for security in changes.added_securities:
             symbol = security.symbol
             if symbol not in self.symbol_data_by_symbol:
                 symbol_data = SymbolData(algorithm, symbol, self.period, self.resolution)
                 self.symbol_data_by_symbol[symbol] = symbol_data
-                added_symbols.append(symbol)
+                warm_up.add(symbol, symbol_data.consolidator)
 
-        if added_symbols:
-            history = algorithm.history[TradeBar](added_symbols, self.period, self.resolution)
-            for trade_bars in history:
-                for bar in trade_bars.values():
-                    self.symbol_data_by_symbol[bar.symbol].update(bar)
+        # a single history request for all the added symbols, the bars are pushed into the consolidators from C#
+        warm_up.warm_up(algorithm, self.period, self.resolution)
 
 
     def get_state(self, rsi, previous):
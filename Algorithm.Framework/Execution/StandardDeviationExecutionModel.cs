@@ -171,7 +171,7 @@ namespace QuantConnect.Algorithm.Framework.Execution
             }
 
             // confirm the security isn't currently a member of any universe
-            return !algorithm.UniverseManager.Any(kvp => kvp.Value.ContainsMember(symbol));
+            return !algorithm.UniverseManager.ContainsMember(symbol);
         }
 
         /// <summary>
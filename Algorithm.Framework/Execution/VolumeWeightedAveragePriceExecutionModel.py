@@ -92,7 +92,7 @@ class VolumeWeightedAveragePriceExecutionModel(ExecutionModel):
     def is_safe_to_remove(self, algorithm, symbol):
         '''Determines if it's safe to remove the associated symbol data'''
         # confirm the security isn't currently a member of any universe
-        return not any([kvp.value.contains_member(symbol) for kvp in algorithm.universe_manager])
+        return not algorithm.universe_manager.contains_member(symbol)
 
 class SymbolData:
     def __init__(self, algorithm, security):
@@ -0,0 +1,120 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using QuantConnect.Data;
+using QuantConnect.Data.Consolidators;
+using QuantConnect.Indicators;
+
+namespace QuantConnect.Algorithm.Framework
+{
+    /// <summary>
+    /// Warms up the indicators and consolidators of many symbols from a single history request.
+    /// The history is pushed into them from here, so models written in Python don't iterate it bar by bar
+    /// </summary>
+    public class IndicatorsWarmUp
+    {
+        private readonly Dictionary<Symbol, List<Action<BaseData>>> _updates = new();
+
+        /// <summary>
+        /// The symbols with at least one indicator or consolidator to warm up
+        /// </summary>
+        public IEnumerable<Symbol> Symbols => _updates.Keys;
+
+        /// <summary>
+        /// Adds an indicator to warm up, it will be updated with the end time of each bar and the selected value
+        /// </summary>
+        /// <param name="symbol">The symbol whose history updates the indicator</param>
+        /// <param name="indicator">The indicator to warm up</param>
+        /// <param name="selector">Selects a value from the bar to update the indicator, defaults to the bar value</param>
+        /// <returns>This instance, so calls can be chained</returns>
+        public IndicatorsWarmUp Add(Symbol symbol, IndicatorBase<IndicatorDataPoint> indicator, Func<IBaseData, decimal> selector = null)
+        {
+            selector ??= x => x.Value;
+            return Add(symbol, data => indicator.Update(data.EndTime, selector(data)));
+        }
+
+        /// <summary>
+        /// Adds a consolidator to warm up, the bars will be pushed into it along with the indicators registered to it
+        /// </summary>
+        /// <param name="symbol">The symbol whose history updates the consolidator</param>
+        /// <param name="consolidator">The consolidator to warm up</param>
+        /// <returns>This instance, so calls can be chained</returns>
+        public IndicatorsWarmUp Add(Symbol symbol, IDataConsolidator consolidator)
+        {
+            return Add(symbol, consolidator.Update);
+        }
+
+        /// <summary>
+        /// Requests the history of all the symbols at once and warms up their indicators and consolidators
+        /// </summary>
+        /// <param name="algorithm">The algorithm instance</param>
+        /// <param name="periods">The number of bars to request</param>
+        /// <param name="resolution">The resolution of the bars, defaults to the resolution of each security subscription</param>
+        /// <returns>The symbols that got at least one bar</returns>
+        public HashSet<Symbol> WarmUp(QCAlgorithm algorithm, int periods, Resolution? resolution = null)
+        {
+            if (_updates.Count == 0)
+            {
+                return new HashSet<Symbol>();
+            }
+            return WarmUp(algorithm.History(_updates.Keys, periods, resolution));
+        }
+
+        /// <summary>
+        /// Warms up the indicators and consolidators with the given history.
+        /// Trade bars are used when available, quote bars otherwise
+        /// </summary>
+        /// <param name="history">The history, in time order</param>
+        /// <returns>The symbols that got at least one bar</returns>
+        public HashSet<Symbol> WarmUp(IEnumerable<Slice> history)
+        {
+            var updated = new HashSet<Symbol>();
+            foreach (var slice in history)
+            {
+                foreach (var kvp in _updates)
+                {
+                    BaseData data = slice.Bars.TryGetValue(kvp.Key, out var tradeBar) ? tradeBar : null;
+                    if (data == null && slice.QuoteBars.TryGetValue(kvp.Key, out var quoteBar))
+                    {
+                        data = quoteBar;
+                    }
+                    if (data == null)
+                    {
+                        continue;
+                    }
+
+                    foreach (var update in kvp.Value)
+                    {
+                        update(data);
+                    }
+                    updated.Add(kvp.Key);
+                }
+            }
+            return updated;
+        }
+
+        private IndicatorsWarmUp Add(Symbol symbol, Action<BaseData> update)
+        {
+            if (!_updates.TryGetValue(symbol, out var updates))
+            {
+                _updates[symbol] = updates = new List<Action<BaseData>>();
+            }
+            updates.Add(update);
+            return this;
+        }
+    }
+}
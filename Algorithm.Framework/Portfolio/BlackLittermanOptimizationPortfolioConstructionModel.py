@@ -13,7 +13,7 @@
 
 from AlgorithmImports import *
 from Portfolio.MaximumSharpeRatioPortfolioOptimizer import MaximumSharpeRatioPortfolioOptimizer
-from itertools import groupby
+from Portfolio.RollingReturnsMoments import RollingReturnsMoments
 from numpy import dot, transpose
 from numpy.linalg import inv
 
@@ -66,6 +66,7 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         self.sign = lambda x: -1 if x < 0 else (1 if x > 0 else 0)
         self.symbol_data_by_symbol = {}
+        self.moments = RollingReturnsMoments(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -86,22 +87,40 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         # Get view vectors
         p, q = self.get_views(last_active_insights)
         if p is not None:
-            returns = dict()
-            # Updates the BlackLittermanSymbolData with insights
-            # Create a dictionary keyed by the symbols in the insights with an pandas.Series as value to create a data frame
-            for insight in last_active_insights:
-                symbol = insight.symbol
-                symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
-                if insight.magnitude is None:
-                    self.algorithm.set_run_time_error(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
-                    return targets
-                symbol_data.add(insight.generated_time_utc, insight.magnitude)
-                returns[symbol] = symbol_data.return_
-
-            returns = pd.DataFrame(returns)
-
-            # Calculate prior estimate of the mean and covariance
-            pi, sigma = self.get_equilibrium_return(returns)
+            symbols = dict()
+            # Symbols without data, never added by on_securities_changed, only get their returns for this call
+            temporary_symbol_data = []
+            try:
+                # Updates the BlackLittermanSymbolData with insights
+                for insight in last_active_insights:
+                    symbol = insight.symbol
+                    symbol_data = self.symbol_data_by_symbol.get(symbol)
+                    if symbol_data is None:
+                        symbol_data = self.BlackLittermanSymbolData(symbol, self.lookback, self.period, self.moments)
+                        temporary_symbol_data.append(symbol_data)
+                        self.symbol_data_by_symbol[symbol] = symbol_data
+                    if insight.magnitude is None:
+                        self.algorithm.set_run_time_error(ArgumentNullException('BlackLittermanOptimizationPortfolioConstructionModel does not accept \'None\' as Insight.magnitude. Please make sure your Alpha Model is generating Insights with the Magnitude property set.'))
+                        return targets
+                    symbol_data.add(insight.generated_time_utc, insight.magnitude)
+                    symbols[symbol] = None
+
+                # The returns window of the symbols in the insights, one column per symbol
+                symbols = list(symbols)
+                returns = self.moments.returns(symbols)
+
+                # Calculate prior estimate of the mean and covariance
+                if type(self).get_equilibrium_return is BlackLittermanOptimizationPortfolioConstructionModel.get_equilibrium_return:
+                    mean = pd.Series(self.moments.mean(symbols), index = symbols)
+                    covariance = pd.DataFrame(self.moments.covariance(symbols), index = symbols, columns = symbols)
+                    pi, sigma = self.get_equilibrium_return(returns, mean, covariance)
+                else:
+                    # overridden implementations only take the returns
+                    pi, sigma = self.get_equilibrium_return(returns)
+            finally:
+                for symbol_data in temporary_symbol_data:
+                    self.symbol_data_by_symbol.pop(symbol_data._symbol, None)
+                    symbol_data.reset()
 
             # Calculate posterior estimate of the mean and covariance
             pi, sigma = self.apply_blacklitterman_master_formula(pi, sigma, p, q)
@@ -110,14 +129,19 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             weights = self.optimizer.optimize(returns, pi, sigma)
             weights = pd.Series(weights, index = sigma.columns)
 
+            # The target of each symbol goes to its first insight
+            insight_by_symbol = {}
+            for insight in last_active_insights:
+                insight_by_symbol.setdefault(insight.symbol, insight)
+
             for symbol, weight in weights.items():
-                for insight in last_active_insights:
-                    if str(insight.symbol) == str(symbol):
-                        # don't trust the optimizer
-                        if self.portfolio_bias != PortfolioBias.LONG_SHORT and self.sign(weight) != self.portfolio_bias:
-                            weight = 0
-                        targets[insight] = weight
-                        break
+                insight = insight_by_symbol.get(symbol)
+                if insight is None:
+                    continue
+                # don't trust the optimizer
+                if self.portfolio_bias != PortfolioBias.LONG_SHORT and self.sign(weight) != self.portfolio_bias:
+                    weight = 0
+                targets[insight] = weight
 
         return targets
 
@@ -126,12 +150,14 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         active_insights = filter(self.should_create_target_for_insight,
             self.algorithm.insights.get_active_insights(self.algorithm.utc_time))
 
-        # Get the last generated active insight for each symbol
-        last_active_insights = []
-        for source_model, f in groupby(sorted(active_insights, key = lambda ff: ff.source_model), lambda fff: fff.source_model):
-            for symbol, g in groupby(sorted(list(f), key = lambda gg: gg.symbol), lambda ggg: ggg.symbol):
-                last_active_insights.append(sorted(g, key = lambda x: x.generated_time_utc)[-1])
-        return last_active_insights
+        # Get the last generated active insight for each source model and symbol, grouped by source model
+        last_active_insights = {}
+        for insight in active_insights:
+            insights_by_symbol = last_active_insights.setdefault(insight.source_model, {})
+            last = insights_by_symbol.get(insight.symbol)
+            if last is None or insight.generated_time_utc >= last.generated_time_utc:
+                insights_by_symbol[insight.symbol] = insight
+        return [insight for insights_by_symbol in last_active_insights.values() for insight in insights_by_symbol.values()]
 
     def on_securities_changed(self, algorithm, changes):
         '''Event fired each time the we add/remove securities from the data feed
@@ -162,7 +188,9 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             if str(symbol) not in symbols:
                 continue
 
-            symbol_data = self.symbol_data_by_symbol.get(symbol, self.BlackLittermanSymbolData(symbol, self.lookback, self.period))
+            symbol_data = self.symbol_data_by_symbol.get(symbol)
+            if symbol_data is None:
+                symbol_data = self.BlackLittermanSymbolData(symbol, self.lookback, self.period, self.moments)
             for time, close in history[symbol].items():
                 utc_time = Extensions.convert_to_utc(time, timezone)
                 symbol_data.update(utc_time, close)
@@ -196,10 +224,12 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
         return Pi, Sigma
 
-    def get_equilibrium_return(self, returns):
+    def get_equilibrium_return(self, returns, mean = None, covariance = None):
         '''Calculate equilibrium returns and covariance
         Args:
             returns: Matrix of returns where each column represents a security and each row returns for the given date/time (size: K x N)
+            mean: The mean of the returns, computed from the returns if None
+            covariance: The covariance of the returns, computed from the returns if None
         Returns:
             equilibrium_return: Array of double of equilibrium returns
             cov: Multi-dimensional array of double with the portfolio covariance of returns (size: K x K)'''
@@ -207,10 +237,14 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         size = len(returns.columns)
         # equal weighting scheme
         W = np.array([1/size]*size)
+        if mean is None:
+            mean = returns.mean()
+        if covariance is None:
+            covariance = returns.cov()
         # the covariance matrix of excess returns (N x N matrix)
-        cov = returns.cov()*252
+        cov = covariance*252
         # annualized return
-        annual_return = np.sum(((1 + returns.mean())**252 -1) * W)
+        annual_return = np.sum(((1 + mean)**252 -1) * W)
         # annualized variance of return
         annual_variance = dot(W.T, dot(cov, W))
         # the risk aversion coefficient
@@ -228,41 +262,35 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
             P: A matrix that identifies the assets involved in the views (size: K x N)
             Q: A view vector (size: K x 1)'''
         try:
-            P = {}
-            Q = {}
-            symbols = set(insight.symbol for insight in insights)
-
-            for model, group in groupby(insights, lambda x: x.source_model):
-                group = list(group)
-
-                up_insights_sum = 0.0
-                dn_insights_sum = 0.0
-                for insight in group:
-                    if insight.direction == InsightDirection.UP:
-                        up_insights_sum = up_insights_sum + np.abs(insight.magnitude)
-                    if insight.direction == InsightDirection.DOWN:
-                        dn_insights_sum = dn_insights_sum + np.abs(insight.magnitude)
+            # one column per symbol, in the order the symbols first appear in the insights
+            columns = {}
+            insights_by_model = {}
+            for insight in insights:
+                columns.setdefault(insight.symbol, len(columns))
+                insights_by_model.setdefault(insight.source_model, []).append(insight)
+
+            P = []
+            Q = []
+            for group in insights_by_model.values():
+                directions = np.array([int(insight.direction) for insight in group], dtype=float)
+                magnitudes = np.abs(np.array([insight.magnitude for insight in group], dtype=float))
+
+                up_insights_sum = magnitudes[directions == int(InsightDirection.UP)].sum()
+                dn_insights_sum = magnitudes[directions == int(InsightDirection.DOWN)].sum()
 
                 q = up_insights_sum if up_insights_sum > dn_insights_sum else dn_insights_sum
                 if q == 0:
                     continue
 
-                Q[model] = q
+                # generate the link matrix of views: P, zero for the symbols the model has no insight for
+                view = np.zeros(len(columns))
+                view[[columns[insight.symbol] for insight in group]] = directions * magnitudes / q
 
-                # generate the link matrix of views: P
-                P[model] = dict()
-                for insight in group:
-                    value = insight.direction * np.abs(insight.magnitude)
-                    P[model][insight.symbol] = value / q
-                # Add zero for other symbols that are listed but active insight
-                for symbol in symbols:
-                    if symbol not in P[model]:
-                        P[model][symbol] = 0
+                P.append(view)
+                Q.append(q)
 
-            Q = np.array([[x] for x in Q.values()])
             if len(Q) > 0:
-                P = np.array([list(x.values()) for x in P.values()])
-                return P, Q
+                return np.array(P), np.array(Q).reshape(-1, 1)
         except:
             pass
 
@@ -271,16 +299,19 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
     class BlackLittermanSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, moments = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
             self.window = RollingWindow(period)
+            self.moments = moments
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self.moments is not None:
+                self.moments.remove(self._symbol)
 
         def update(self, utc_time, close):
             self.roc.update(utc_time, close)
@@ -288,6 +319,8 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
                 self.window.add(value)
+                if self.moments is not None:
+                    self.moments.add(self._symbol, value.end_time, value.value)
 
         def add(self, time, value):
             if self.window.samples > 0 and self.window[0].end_time == time:
@@ -295,6 +328,8 @@ class BlackLittermanOptimizationPortfolioConstructionModel(PortfolioConstruction
 
             item = IndicatorDataPoint(self._symbol, time, value)
             self.window.add(item)
+            if self.moments is not None:
+                self.moments.add(self._symbol, item.end_time, item.value)
 
         @property
         def return_(self):
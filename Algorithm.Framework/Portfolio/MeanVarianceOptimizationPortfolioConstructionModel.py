@@ -13,6 +13,8 @@
 
 from AlgorithmImports import *
 from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+from Portfolio.RollingReturnsMoments import RollingReturnsMoments
+from inspect import signature
 
 ### <summary>
 ### Provides an implementation of Mean-Variance portfolio optimization based on modern portfolio theory.
@@ -49,8 +51,10 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         lower = 0 if portfolio_bias == PortfolioBias.LONG else -1
         upper = 0 if portfolio_bias == PortfolioBias.SHORT else 1
         self.optimizer = MinimumVariancePortfolioOptimizer(lower, upper, target_return) if optimizer is None else optimizer
+        self.optimizer_accepts_moments = self.accepts_moments(self.optimizer)
 
         self.symbol_data_by_symbol = {}
+        self.moments = RollingReturnsMoments(period)
 
         # If the argument is an instance of Resolution or Timedelta
         # Redefine rebalancing_func
@@ -86,14 +90,20 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         if len(active_insights) == 0:
             return targets
 
-        symbols = [insight.symbol for insight in active_insights]
+        symbols = set(insight.symbol for insight in active_insights)
+        symbols = [symbol for symbol in self.symbol_data_by_symbol if symbol in symbols]
 
-        # Create a dictionary keyed by the symbols in the insights with an pandas.series as value to create a data frame
-        returns = { str(symbol.id) : data.return_ for symbol, data in self.symbol_data_by_symbol.items() if symbol in symbols }
-        returns = pd.DataFrame(returns)
+        # The returns window of the symbols in the insights, one column per symbol
+        columns = [str(symbol.id) for symbol in symbols]
+        returns = self.moments.returns(symbols, columns)
 
         # The portfolio optimizer finds the optional weights for the given data
-        weights = self.optimizer.optimize(returns)
+        if self.optimizer_accepts_moments:
+            expected_returns = pd.Series(self.moments.mean(symbols), index = columns)
+            covariance = pd.DataFrame(self.moments.covariance(symbols), index = columns, columns = columns)
+            weights = self.optimizer.optimize(returns, expected_returns = expected_returns, covariance = covariance)
+        else:
+            weights = self.optimizer.optimize(returns)
         weights = pd.Series(weights, index = returns.columns)
 
         # Create portfolio targets from the specified insights
@@ -120,27 +130,39 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
             symbol_data.reset()
 
         # initialize data for added securities
-        symbols = [x.symbol for x in changes.added_securities]
-        for symbol in [x for x in symbols if x not in self.symbol_data_by_symbol]:
-            self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period)
-
-        history = algorithm.history[TradeBar](symbols, self.lookback * self.period, self.resolution)
-        for bars in history:
-            for symbol, bar in bars.items():
-                symbol_data = self.symbol_data_by_symbol.get(symbol).update(bar.end_time, bar.value)
+        warm_up = IndicatorsWarmUp()
+        for security in changes.added_securities:
+            symbol = security.symbol
+            if symbol not in self.symbol_data_by_symbol:
+                self.symbol_data_by_symbol[symbol] = self.MeanVarianceSymbolData(symbol, self.lookback, self.period, self.moments)
+            warm_up.add(symbol, self.symbol_data_by_symbol[symbol].roc)
+
+        # a single history request for all the added symbols, the rate of change indicators are updated from C#
+        warm_up.warm_up(algorithm, self.lookback * self.period, self.resolution)
+
+    def accepts_moments(self, optimizer):
+        '''Determines whether the optimizer takes the expected returns and covariance along the historical returns'''
+        try:
+            parameters = signature(optimizer.optimize).parameters
+            return 'expected_returns' in parameters and 'covariance' in parameters
+        except (TypeError, ValueError):
+            return False
 
     class MeanVarianceSymbolData:
         '''Contains data specific to a symbol required by this model'''
-        def __init__(self, symbol, lookback, period):
+        def __init__(self, symbol, lookback, period, moments = None):
             self._symbol = symbol
             self.roc = RateOfChange(f'{symbol}.roc({lookback})', lookback)
             self.roc.updated += self.on_rate_of_change_updated
             self.window = RollingWindow(period)
+            self.moments = moments
 
         def reset(self):
             self.roc.updated -= self.on_rate_of_change_updated
             self.roc.reset()
             self.window.reset()
+            if self.moments is not None:
+                self.moments.remove(self._symbol)
 
         def update(self, time, value):
             return self.roc.update(time, value)
@@ -148,10 +170,14 @@ class MeanVarianceOptimizationPortfolioConstructionModel(PortfolioConstructionMo
         def on_rate_of_change_updated(self, roc, value):
             if roc.is_ready:
                 self.window.add(value)
+                if self.moments is not None:
+                    self.moments.add(self._symbol, value.end_time, value.value)
 
         def add(self, time, value):
             item = IndicatorDataPoint(self._symbol, time, value)
             self.window.add(item)
+            if self.moments is not None:
+                self.moments.add(self._symbol, item.end_time, item.value)
 
         # Get symbols' returns, we use simple return according to
         # Meucci, Attilio, Quant Nugget 2: Linear vs. Compounded Returns – Common Pitfalls in Portfolio Management (May 1, 2010).
@@ -13,6 +13,7 @@
 
 from AlgorithmImports import *
 from scipy.optimize import minimize
+from Portfolio.PortfolioOptimizerWarmStart import PortfolioOptimizerWarmStart
 
 ### <summary>
 ### Provides an implementation of a portfolio optimizer that calculate the optimal weights
@@ -25,15 +26,25 @@ class MinimumVariancePortfolioOptimizer:
     def __init__(self,
                  minimum_weight = -1,
                  maximum_weight = 1,
-                 target_return = 0.02):
+                 target_return = 0.02,
+                 closed_form = False,
+                 warm_start = False):
         '''Initialize the MinimumVariancePortfolioOptimizer
         Args:
             minimum_weight(float): The lower bounds on portfolio weights
             maximum_weight(float): The upper bounds on portfolio weights
-            target_return(float): The target portfolio return'''
+            target_return(float): The target portfolio return
+            closed_form(bool): True to use the exact solution of the problem without bounds when they are not binding,
+                               and to give SLSQP the analytic gradients otherwise. The analytic gradients change the SLSQP
+                               iterates, so the weights differ slightly from the default numerical gradients, which the C#
+                               optimizer matches, and they are only given along with the closed form solution
+            warm_start(bool): True to start SLSQP from the previous solution when the assets, the historical returns
+                              columns, are the same as in the previous optimization'''
         self.minimum_weight = minimum_weight
         self.maximum_weight = maximum_weight
         self.target_return = target_return
+        self.closed_form = closed_form
+        self.warm_start = PortfolioOptimizerWarmStart() if warm_start else None
 
     def optimize(self, historical_returns, expected_returns = None, covariance = None):
         '''
@@ -52,24 +63,73 @@ class MinimumVariancePortfolioOptimizer:
 
         size = historical_returns.columns.size   # K x 1
         x0 = np.array(size * [1. / size])
+        expected_returns_values = np.asarray(expected_returns, dtype=float).ravel()
+
+        if self.closed_form:
+            covariance_values = np.asarray(covariance, dtype=float)
+            # When none of the bounds is binding, the solution of the equality constrained problem is the solution
+            solution = self.get_closed_form_solution(expected_returns_values, covariance_values)
+            if solution is not None:
+                return solution / np.sum(np.abs(solution))
 
         constraints = [
             {'type': 'eq', 'fun': lambda weights: self.get_budget_constraint(weights)},
-            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns)}]
+            {'type': 'eq', 'fun': lambda weights: self.get_target_constraint(weights, expected_returns_values)}]
+        gradient = None
+        if self.closed_form:
+            constraints[0]['jac'] = lambda weights: np.ones(size)
+            constraints[1]['jac'] = lambda weights: expected_returns_values
+            gradient = lambda weights: 2 * np.dot(covariance_values, weights)
+
+        # Rebalances usually move the weights slightly, start from the previous solution for the same assets
+        assets = PortfolioOptimizerWarmStart.get_assets(historical_returns)
+        initial_guess = x0 if self.warm_start is None else self.warm_start.get_initial_guess(assets, x0)
 
         # https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
         opt = minimize(lambda weights: self.portfolio_variance(weights, covariance),     # Objective function
-                       x0,                                                        # Initial guess
+                       initial_guess,                                             # Initial guess
+                       jac = gradient,                                            # Gradient of the objective function, numerical if None
                        bounds = self.get_boundary_conditions(size),               # Bounds for variables
                        constraints = constraints,                                 # Constraints definition
                        method='SLSQP')     # Optimization method:  Sequential Least Squares Programming (SLSQP)
 
+        if self.warm_start is not None:
+            self.warm_start.update(assets, opt['x'] if opt['success'] else None)
+
         if not opt['success']: return x0
 
         # Scale the solution to ensure that the sum of the absolute weights is 1
         sum_of_absolute_weights = np.sum(np.abs(opt['x']))
         return opt['x'] / sum_of_absolute_weights
 
+    def get_closed_form_solution(self, expected_returns, covariance):
+        '''Solves the Karush-Kuhn-Tucker conditions of the problem without the bounds:
+        minimize w^T Σ w subject to 1^T w = 1 and µ^T w = target return, whose solution is w = Σ^-1 (a 1 + b µ).
+        Returns None if the covariance is singular or the solution is out of bounds, in which case the bounds are active
+        Args:
+            expected_returns: Array of double with the portfolio expected returns (size: K x 1)
+            covariance: Multi-dimensional array of double with the portfolio covariance of returns (size: K x K)'''
+        if not (np.all(np.isfinite(covariance)) and np.all(np.isfinite(expected_returns))):
+            return None
+
+        size = len(expected_returns)
+        constraints = np.column_stack([np.ones(size), expected_returns])
+        try:
+            # Σ^-1 1 and Σ^-1 µ
+            directions = np.linalg.solve(covariance, constraints)
+            if not np.allclose(np.dot(covariance, directions), constraints):
+                return None
+            # the 2 x 2 system for the multipliers a and b
+            coefficients = np.linalg.solve(np.dot(constraints.T, directions), [1, self.target_return])
+        except np.linalg.LinAlgError:
+            return None
+
+        weights = np.dot(directions, coefficients)
+        tolerance = 1e-10
+        if np.any(weights < self.minimum_weight - tolerance) or np.any(weights > self.maximum_weight + tolerance):
+            return None
+        return weights
+
     def portfolio_variance(self, weights, covariance):
         '''Computes the portfolio variance
         Args:
@@ -89,6 +149,6 @@ class MinimumVariancePortfolioOptimizer:
         '''Defines a budget constraint: the sum of the weights equals unity'''
         return np.sum(weights) - 1
 
-    def get_target_constraint(self, weights, expected_returns):
+    def get_target_constraint(self, weights, expected_returns_values):
         '''Ensure that the portfolio return target a given return'''
-        return np.dot(np.matrix(expected_returns), np.matrix(weights).T).item() - self.target_return
+        return np.dot(expected_returns_values, weights) - self.target_return
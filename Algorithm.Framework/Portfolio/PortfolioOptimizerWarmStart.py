@@ -0,0 +1,58 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Keeps the last solution of a portfolio optimizer along with the labels of the assets it is for,
+### so the next optimization of the same assets can start from it
+### </summary>
+class PortfolioOptimizerWarmStart:
+    '''Keeps the last solution of a portfolio optimizer, so the next optimization of the same assets can start from it'''
+    def __init__(self):
+        self._solution = None
+        self._assets = None
+
+    def get_initial_guess(self, assets, default):
+        '''Gets the previous solution if it was for the same assets
+        Args:
+            assets: The labels of the assets being optimized, None if they are not labeled
+            default: The initial guess to use if there's no previous solution for these assets
+        Returns:
+            Array of double with the initial guess of the weights (size: K x 1)'''
+        if assets is not None and assets == self._assets:
+            return self._solution
+        return default
+
+    def update(self, assets, solution):
+        '''Keeps the solution for the next optimization of the same assets
+        Args:
+            assets: The labels of the assets that were optimized, None if they are not labeled
+            solution: The solution found, None if the optimization failed'''
+        if assets is None or solution is None:
+            self._solution = self._assets = None
+        else:
+            self._solution = solution
+            self._assets = assets
+
+    @staticmethod
+    def get_assets(*data):
+        '''Gets the labels of the assets from the columns of the first data frame given.
+        Returns None if there's no data frame or its columns are the default range index,
+        since a basket of the same size but different assets couldn't be told apart'''
+        for item in data:
+            if isinstance(item, pd.DataFrame):
+                if isinstance(item.columns, pd.RangeIndex):
+                    return None
+                return tuple(item.columns)
+        return None
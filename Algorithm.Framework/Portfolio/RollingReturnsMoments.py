@@ -0,0 +1,224 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from collections import deque
+
+### <summary>
+### Keeps the mean and covariance of the returns of a set of securities up to date as the returns come in.
+### Each security keeps its last `period` returns, like a RollingWindow would, and the returns are stored
+### in a NumPy buffer with one row per time. The running sums and cross-products are updated in O(N) per return,
+### so the mean and the covariance are available without going through a pandas.DataFrame of the whole window.
+### Missing values are handled like pandas.DataFrame.mean and pandas.DataFrame.cov do, using pairwise complete observations.
+### </summary>
+class RollingReturnsMoments:
+    '''Keeps the mean and covariance of the returns of a set of securities up to date as the returns come in'''
+    def __init__(self, period):
+        '''Initialize the RollingReturnsMoments
+        Args:
+            period(int): The number of returns kept for each security'''
+        self.period = period
+
+        self._windows = {}
+        self._columns = {}
+        self._free_columns = []
+        self._rows = {}
+        self._free_rows = []
+
+        self._values = np.full((0, 0), np.nan)
+        self._row_times = []
+        self._row_counts = np.zeros(0, dtype=int)
+        # cross-products, sums of the returns of the row security where the column security is present, and pair counts
+        self._cross = np.zeros((0, 0))
+        self._sums = np.zeros((0, 0))
+        self._counts = np.zeros((0, 0))
+
+        # the running sums drift with each removal, they are recomputed from the buffer once in a while
+        self._removals = 0
+
+    def add(self, key, time, value):
+        '''Adds a return to the security window, dropping the oldest one if the window is full.
+        A return for a time already in the window replaces it
+        Args:
+            key: The security key, usually its symbol
+            time: The time of the return
+            value(float): The return'''
+        value = float(value)
+        column = self._get_column(key)
+        window = self._windows[key]
+        row = self._rows.get(time)
+
+        if row is not None and not np.isnan(self._values[row, column]):
+            self._update_sums(row, column, self._values[row, column], -1)
+            self._values[row, column] = value
+            self._update_sums(row, column, value, 1)
+            return
+
+        if row is None:
+            row = self._get_row(time)
+        window.append(time)
+        if len(window) > self.period:
+            self._remove_value(self._rows[window.popleft()], column)
+
+        self._add_value(row, column, value)
+
+    def remove(self, key):
+        '''Removes the security and all its returns
+        Args:
+            key: The security key'''
+        window = self._windows.pop(key, None)
+        if window is None:
+            return
+
+        column = self._columns.pop(key)
+        for time in window:
+            self._remove_value(self._rows[time], column)
+
+        self._cross[column, :] = self._cross[:, column] = 0
+        self._sums[column, :] = self._sums[:, column] = 0
+        self._counts[column, :] = self._counts[:, column] = 0
+        self._free_columns.append(column)
+
+    def reset(self):
+        '''Removes all the securities'''
+        for key in list(self._windows):
+            self.remove(key)
+
+    def mean(self, keys):
+        '''Gets the mean of the returns of the given securities
+        Args:
+            keys: The security keys
+        Returns:
+            Array of double with the mean returns (size: K x 1)'''
+        columns = self._get_columns(keys)
+        counts = np.diagonal(self._counts)[columns]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(counts > 0, np.diagonal(self._sums)[columns] / counts, np.nan)
+
+    def covariance(self, keys):
+        '''Gets the sample covariance of the returns of the given securities
+        Args:
+            keys: The security keys
+        Returns:
+            Multi-dimensional array of double with the covariance of returns (size: K x K)'''
+        columns = self._get_columns(keys)
+        index = np.ix_(columns, columns)
+        counts = self._counts[index]
+        sums = self._sums[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            covariance = (self._cross[index] - sums * sums.T / counts) / (counts - 1)
+        covariance[counts < 2] = np.nan
+        return covariance
+
+    def returns(self, keys, columns = None):
+        '''Gets the returns of the given securities, one row per time
+        Args:
+            keys: The security keys
+            columns: The data frame column labels, defaults to the keys
+        Returns:
+            pandas.DataFrame with the returns, NaN where a security has no return for the time'''
+        keys = list(keys)
+        rows = sorted({ row for key in keys for row in map(self._rows.get, self._windows.get(key, [])) },
+            key = lambda row: self._row_times[row])
+        values = self._values[np.ix_(rows, self._get_columns(keys))]
+        return pd.DataFrame(values, index = [self._row_times[row] for row in rows], columns = keys if columns is None else columns)
+
+    def _get_columns(self, keys):
+        columns = []
+        for key in keys:
+            column = self._columns.get(key)
+            columns.append(self._get_column(key) if column is None else column)
+        return np.array(columns, dtype=int)
+
+    def _get_column(self, key):
+        column = self._columns.get(key)
+        if column is not None:
+            return column
+
+        if not self._free_columns:
+            self._grow_columns()
+        column = self._free_columns.pop()
+        self._columns[key] = column
+        self._windows[key] = deque()
+        return column
+
+    def _get_row(self, time):
+        if not self._free_rows:
+            self._grow_rows()
+        row = self._free_rows.pop()
+        self._rows[time] = row
+        self._row_times[row] = time
+        return row
+
+    def _add_value(self, row, column, value):
+        self._values[row, column] = value
+        self._row_counts[row] += 1
+        self._update_sums(row, column, value, 1)
+
+    def _remove_value(self, row, column):
+        self._update_sums(row, column, self._values[row, column], -1)
+        self._values[row, column] = np.nan
+        self._row_counts[row] -= 1
+        if self._row_counts[row] == 0:
+            del self._rows[self._row_times[row]]
+            self._row_times[row] = None
+            self._free_rows.append(row)
+
+        self._removals += 1
+        if self._removals > self.period * max(1, len(self._columns)):
+            self._recompute_sums()
+
+    def _update_sums(self, row, column, value, sign):
+        '''Adds or removes the value contributions to the sums of all the pairs it is part of'''
+        values = self._values[row]
+        present = ~np.isnan(values)
+        others = np.where(present, values, 0)
+        value = sign * value
+
+        self._cross[column, :] += value * others
+        self._cross[:, column] += value * others
+        self._cross[column, column] -= value * others[column]
+
+        self._sums[column, present] += value
+        self._sums[present, column] += sign * others[present]
+        self._sums[column, column] -= value
+
+        self._counts[column, present] += sign
+        self._counts[present, column] += sign
+        self._counts[column, column] -= sign
+
+    def _recompute_sums(self):
+        present = (~np.isnan(self._values)).astype(float)
+        values = np.nan_to_num(self._values)
+        self._cross = values.T @ values
+        self._sums = values.T @ present
+        self._counts = present.T @ present
+        self._removals = 0
+
+    def _grow_columns(self):
+        size = self._values.shape[1]
+        new_size = max(16, size * 2)
+        self._values = np.hstack([self._values, np.full((self._values.shape[0], new_size - size), np.nan)])
+        for name in ['_cross', '_sums', '_counts']:
+            grown = np.zeros((new_size, new_size))
+            grown[:size, :size] = getattr(self, name)
+            setattr(self, name, grown)
+        self._free_columns.extend(reversed(range(size, new_size)))
+
+    def _grow_rows(self):
+        size = self._values.shape[0]
+        new_size = max(self.period, size * 2)
+        self._values = np.vstack([self._values, np.full((new_size - size, self._values.shape[1]), np.nan)])
+        self._row_times.extend([None] * (new_size - size))
+        self._row_counts = np.concatenate([self._row_counts, np.zeros(new_size - size, dtype=int)])
+        self._free_rows.extend(reversed(range(size, new_size)))
@@ -0,0 +1,74 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+### <summary>
+### Keeps track of the securities with open positions, so the risk management models visit them only
+### instead of going through all the algorithm securities on every time step.
+### The algorithm securities are scanned once, then the positions are kept up to date from the holdings
+### QuantityChanged event of each security, which is raised by the fills.
+### </summary>
+class InvestedPositions:
+    '''Keeps track of the securities with open positions'''
+    def __init__(self):
+        self.securities = {}
+        self._subscribed = {}
+        self._initialized = False
+
+    def get_securities(self, algorithm):
+        '''Gets the securities with open positions
+        Args:
+            algorithm: The algorithm instance
+        Returns:
+            List of the securities with open positions, the caller still checks whether each of them is invested'''
+        if not self._initialized:
+            self._initialized = True
+            for kvp in algorithm.securities:
+                self.add(kvp.value)
+        return list(self.securities.values())
+
+    def on_securities_changed(self, changes):
+        '''Starts and stops tracking the positions of the added and removed securities
+        Args:
+            changes: The security additions and removals from the algorithm'''
+        for security in changes.removed_securities:
+            self.remove(security)
+        for security in changes.added_securities:
+            self.add(security)
+
+    def add(self, security):
+        '''Starts tracking the position of the security'''
+        symbol = security.symbol
+        if symbol in self._subscribed:
+            return
+        self._subscribed[symbol] = security
+        security.holdings.quantity_changed += self.on_holdings_quantity_changed
+        if security.invested or security.holdings.quantity != 0:
+            self.securities[symbol] = security
+
+    def remove(self, security):
+        '''Stops tracking the position of the security'''
+        symbol = security.symbol
+        if self._subscribed.pop(symbol, None) is None:
+            return
+        security.holdings.quantity_changed -= self.on_holdings_quantity_changed
+        self.securities.pop(symbol, None)
+
+    def on_holdings_quantity_changed(self, sender, args):
+        '''Event fired each time the holdings quantity of a security changes'''
+        security = args.security
+        if security.holdings.quantity != 0:
+            self.securities[security.symbol] = security
+        else:
+            self.securities.pop(security.symbol, None)
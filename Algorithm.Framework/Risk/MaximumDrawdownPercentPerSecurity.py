@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Risk.InvestedPositions import InvestedPositions
 
 class MaximumDrawdownPercentPerSecurity(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that limits the drawdown per holding to the specified percentage'''
@@ -20,6 +21,7 @@ class MaximumDrawdownPercentPerSecurity(RiskManagementModel):
         '''Initializes a new instance of the MaximumDrawdownPercentPerSecurity class
         Args:
             maximum_drawdown_percent: The maximum percentage drawdown allowed for any single security holding'''
+        self.invested_positions = InvestedPositions()
         self.maximum_drawdown_percent = -abs(maximum_drawdown_percent)
 
     def manage_risk(self, algorithm, targets):
@@ -28,20 +30,27 @@ class MaximumDrawdownPercentPerSecurity(RiskManagementModel):
             algorithm: The algorithm instance
             targets: The current portfolio targets to be assessed for risk'''
         targets = []
-        for kvp in algorithm.securities:
-            security = kvp.value
 
-            if not security.invested:
-                continue
+        # Only the open positions are visited
+        securities = [ security for security in self.invested_positions.get_securities(algorithm) if security.invested ]
+        if not securities:
+            return targets
 
-            pnl = security.holdings.unrealized_profit_percent
-            if pnl < self.maximum_drawdown_percent:
-                symbol = security.symbol
+        pnl = np.array([ float(security.holdings.unrealized_profit_percent) for security in securities ])
+        for i in np.flatnonzero(pnl < float(self.maximum_drawdown_percent)):
+            symbol = securities[i].symbol
 
-                # Cancel insights
-                algorithm.insights.cancel([symbol])
+            # Cancel insights
+            algorithm.insights.cancel([symbol])
 
-                # liquidate
-                targets.append(PortfolioTarget(symbol, 0))
+            # liquidate
+            targets.append(PortfolioTarget(symbol, 0))
 
         return targets
+
+    def on_securities_changed(self, algorithm, changes):
+        '''Event fired each time the we add/remove securities from the data feed
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            changes: The security additions and removals from the algorithm'''
+        self.invested_positions.on_securities_changed(changes)
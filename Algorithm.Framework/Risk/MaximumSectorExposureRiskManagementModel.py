@@ -12,7 +12,6 @@
 # limitations under the License.
 
 from AlgorithmImports import *
-from itertools import groupby
 
 class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that that limits the sector exposure to the specified percentage'''
@@ -27,6 +26,11 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         self.maximum_sector_exposure = maximum_sector_exposure
         self.targets_collection = PortfolioTargetCollection()
 
+        # sector code by symbol, and the non-zero quantities of each sector: the target quantity if there is one, the holdings quantity otherwise
+        self.sector_by_symbol = {}
+        self.securities_by_symbol = {}
+        self.quantities_by_sector = {}
+
     def manage_risk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
         Args:
@@ -34,34 +38,28 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         maximum_sector_exposure_value = float(algorithm.portfolio.total_portfolio_value) * self.maximum_sector_exposure
 
         self.targets_collection.add_range(targets)
+        for target in targets:
+            self.set_quantity(target.symbol, target.quantity)
 
         risk_targets = list()
 
-        # Group the securities by their sector
-        filtered = list(filter(lambda x: x.value.fundamentals is not None and x.value.fundamentals.has_fundamental_data, algorithm.universe_manager.active_securities))
-        filtered.sort(key = lambda x: x.value.fundamentals.company_reference.industry_template_code)
-        group_by_sector = groupby(filtered, lambda x: x.value.fundamentals.company_reference.industry_template_code)
+        # Only the sectors with holdings or targets have exposure, their value is computed with the current prices
+        for code in sorted(self.quantities_by_sector):
+            quantities = self.quantities_by_sector[code]
 
-        for code, securities in group_by_sector:
             # Compute the sector absolute holdings value
             # If the construction model has created a target, we consider that
             # value to calculate the security absolute holding value
-            quantities = {}
             sector_absolute_holdings_value = 0
 
-            for security in securities:
-                symbol = security.value.symbol
-                quantities[symbol] = security.value.holdings.quantity
-                absolute_holdings_value = security.value.holdings.absolute_holdings_value
-
+            for symbol, quantity in quantities.items():
+                security = self.securities_by_symbol[symbol]
                 if self.targets_collection.contains_key(symbol):
-                    quantities[symbol] = self.targets_collection[symbol].quantity
-
-                    absolute_holdings_value = (security.value.price * abs(quantities[symbol]) *
-                        security.value.symbol_properties.contract_multiplier *
-                        security.value.quote_currency.conversion_rate)
-
-                sector_absolute_holdings_value += absolute_holdings_value
+                    sector_absolute_holdings_value += (security.price * abs(quantity) *
+                        security.symbol_properties.contract_multiplier *
+                        security.quote_currency.conversion_rate)
+                else:
+                    sector_absolute_holdings_value += security.holdings.absolute_holdings_value
 
             # If the ratio between the sector absolute holdings value and the maximum sector exposure value
             # exceeds the unity, it means we need to reduce each security of that sector by that ratio
@@ -70,8 +68,7 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
 
             if ratio > 1:
                 for symbol, quantity in quantities.items():
-                    if quantity != 0:
-                        risk_targets.append(PortfolioTarget(symbol, float(quantity) / ratio))
+                    risk_targets.append(PortfolioTarget(symbol, float(quantity) / ratio))
 
         return risk_targets
 
@@ -80,10 +77,51 @@ class MaximumSectorExposureRiskManagementModel(RiskManagementModel):
         Args:
             algorithm: The algorithm instance that experienced the change in securities
             changes: The security additions and removals from the algorithm'''
-        any_fundamental_data = any([
-            kvp.value.fundamentals is not None and
-            kvp.value.fundamentals.has_fundamental_data for kvp in algorithm.active_securities
-            ])
-
-        if not any_fundamental_data:
+        for security in changes.removed_securities:
+            symbol = security.symbol
+            if symbol not in self.sector_by_symbol:
+                continue
+            self.set_quantity(symbol, 0)
+            security.holdings.quantity_changed -= self.on_holdings_quantity_changed
+            del self.sector_by_symbol[symbol]
+            del self.securities_by_symbol[symbol]
+
+        # The sector is read once, when the security is added
+        for security in changes.added_securities:
+            symbol = security.symbol
+            if symbol in self.sector_by_symbol or security.fundamentals is None or not security.fundamentals.has_fundamental_data:
+                continue
+            self.sector_by_symbol[symbol] = security.fundamentals.company_reference.industry_template_code
+            self.securities_by_symbol[symbol] = security
+            security.holdings.quantity_changed += self.on_holdings_quantity_changed
+
+            quantity = security.holdings.quantity
+            if self.targets_collection.contains_key(symbol):
+                quantity = self.targets_collection[symbol].quantity
+            self.set_quantity(symbol, quantity)
+
+        if not self.sector_by_symbol:
             raise Exception("MaximumSectorExposureRiskManagementModel.on_securities_changed: Please select a portfolio selection model that selects securities with fundamental data.")
+
+    def on_holdings_quantity_changed(self, sender, args):
+        '''Event fired each time the holdings quantity of a security changes, after a fill for instance'''
+        symbol = args.security.symbol
+        # the target quantity takes precedence over the holdings quantity
+        if not self.targets_collection.contains_key(symbol):
+            self.set_quantity(symbol, args.security.holdings.quantity)
+
+    def set_quantity(self, symbol, quantity):
+        '''Sets the quantity of the security in its sector, only the securities with non-zero quantities are kept'''
+        code = self.sector_by_symbol.get(symbol)
+        if code is None:
+            return
+
+        quantities = self.quantities_by_sector.get(code)
+        if quantity != 0:
+            if quantities is None:
+                quantities = self.quantities_by_sector[code] = {}
+            quantities[symbol] = quantity
+        elif quantities is not None:
+            quantities.pop(symbol, None)
+            if not quantities:
+                del self.quantities_by_sector[code]
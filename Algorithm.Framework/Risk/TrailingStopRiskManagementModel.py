@@ -12,6 +12,7 @@
 # limitations under the License.
 
 from AlgorithmImports import *
+from Risk.InvestedPositions import InvestedPositions
 
 class TrailingStopRiskManagementModel(RiskManagementModel):
     '''Provides an implementation of IRiskManagementModel that limits the maximum possible loss
@@ -21,7 +22,14 @@ class TrailingStopRiskManagementModel(RiskManagementModel):
         Args:
             maximum_drawdown_percent: The maximum percentage drawdown allowed for algorithm portfolio compared with the highest unrealized profit, defaults to 5% drawdown'''
         self.maximum_drawdown_percent = abs(maximum_drawdown_percent)
-        self.trailing_absolute_holdings_state = dict()
+        self.invested_positions = InvestedPositions()
+
+        # the trailing state of each position: its slot in the arrays, the position side (1 long, -1 short)
+        # and the highest (long) or lowest (short) absolute holdings value
+        self.slot_by_symbol = {}
+        self.free_slots = []
+        self.position_sides = np.zeros(0)
+        self.trailing_absolute_holdings_values = np.zeros(0)
 
     def manage_risk(self, algorithm, targets):
         '''Manages the algorithm's risk at each time step
@@ -30,44 +38,69 @@ class TrailingStopRiskManagementModel(RiskManagementModel):
             targets: The current portfolio targets to be assessed for risk'''
         risk_adjusted_targets = list()
 
-        for kvp in algorithm.securities:
-            symbol = kvp.key
-            security = kvp.value
+        # Only the open positions are visited, the state of the securities that are not invested anymore is removed
+        securities = [ security for security in self.invested_positions.get_securities(algorithm) if security.invested ]
+        invested = set(security.symbol for security in securities)
+        for symbol in [ symbol for symbol in self.slot_by_symbol if symbol not in invested ]:
+            self.remove_state(symbol)
+        if not securities:
+            return risk_adjusted_targets
 
-            # Remove if not invested
-            if not security.invested:
-                self.trailing_absolute_holdings_state.pop(symbol, None)
-                continue
+        positions = np.array([ 1 if security.holdings.is_long else -1 for security in securities ])
+        absolute_holdings_values = np.array([ float(security.holdings.absolute_holdings_value) for security in securities ])
+        slots = np.array([ self.get_slot(security.symbol) for security in securities ])
 
-            position = PositionSide.LONG if security.holdings.is_long else PositionSide.SHORT
-            absolute_holdings_value = security.holdings.absolute_holdings_value
-            trailing_absolute_holdings_state = self.trailing_absolute_holdings_state.get(symbol)
+        # Add newly invested security (if doesn't exist) or reset holdings state (if position changed)
+        reset = np.flatnonzero(self.position_sides[slots] != positions)
+        self.position_sides[slots[reset]] = positions[reset]
+        self.trailing_absolute_holdings_values[slots[reset]] = [ float(securities[i].holdings.absolute_holdings_cost) for i in reset ]
 
-            # Add newly invested security (if doesn't exist) or reset holdings state (if position changed)
-            if trailing_absolute_holdings_state == None or position != trailing_absolute_holdings_state.position:
-                self.trailing_absolute_holdings_state[symbol] = trailing_absolute_holdings_state = self.HoldingsState(position, security.holdings.absolute_holdings_cost)
+        trailing_absolute_holdings_values = self.trailing_absolute_holdings_values[slots]
 
-            trailing_absolute_holdings_value = trailing_absolute_holdings_state.absolute_holdings_value
+        # Check for new max (for long position) or min (for short position) absolute holdings value
+        new_extreme = (positions * (absolute_holdings_values - trailing_absolute_holdings_values)) > 0
+        self.trailing_absolute_holdings_values[slots[new_extreme]] = absolute_holdings_values[new_extreme]
 
-            # Check for new max (for long position) or min (for short position) absolute holdings value
-            if ((position == PositionSide.LONG and trailing_absolute_holdings_value < absolute_holdings_value) or
-                (position == PositionSide.SHORT and trailing_absolute_holdings_value > absolute_holdings_value)):
-                self.trailing_absolute_holdings_state[symbol].absolute_holdings_value = absolute_holdings_value
-                continue
+        with np.errstate(divide='ignore', invalid='ignore'):
+            drawdowns = np.abs((trailing_absolute_holdings_values - absolute_holdings_values) / trailing_absolute_holdings_values)
 
-            drawdown = abs((trailing_absolute_holdings_value - absolute_holdings_value) / trailing_absolute_holdings_value)
+        for i in np.flatnonzero(~new_extreme & (drawdowns > float(self.maximum_drawdown_percent))):
+            symbol = securities[i].symbol
 
-            if self.maximum_drawdown_percent < drawdown:
-                # Cancel insights
-                algorithm.insights.cancel([ symbol ]);
+            # Cancel insights
+            algorithm.insights.cancel([ symbol ]);
 
-                self.trailing_absolute_holdings_state.pop(symbol, None)
-                # liquidate
-                risk_adjusted_targets.append(PortfolioTarget(symbol, 0))
+            self.remove_state(symbol)
+            # liquidate
+            risk_adjusted_targets.append(PortfolioTarget(symbol, 0))
 
         return risk_adjusted_targets
 
-    class HoldingsState:
-        def __init__(self, position, absolute_holdings_value):
-            self.position = position
-            self.absolute_holdings_value = absolute_holdings_value
+    def on_securities_changed(self, algorithm, changes):
+        '''Event fired each time the we add/remove securities from the data feed
+        Args:
+            algorithm: The algorithm instance that experienced the change in securities
+            changes: The security additions and removals from the algorithm'''
+        self.invested_positions.on_securities_changed(changes)
+
+    def get_slot(self, symbol):
+        '''Gets the slot of the position state in the arrays, a new position has no side so its state is reset'''
+        slot = self.slot_by_symbol.get(symbol)
+        if slot is not None:
+            return slot
+
+        if not self.free_slots:
+            size = len(self.position_sides)
+            new_size = max(16, size * 2)
+            self.position_sides = np.concatenate([self.position_sides, np.zeros(new_size - size)])
+            self.trailing_absolute_holdings_values = np.concatenate([self.trailing_absolute_holdings_values, np.zeros(new_size - size)])
+            self.free_slots.extend(reversed(range(size, new_size)))
+
+        slot = self.slot_by_symbol[symbol] = self.free_slots.pop()
+        self.position_sides[slot] = 0
+        return slot
+
+    def remove_state(self, symbol):
+        slot = self.slot_by_symbol.pop(symbol, None)
+        if slot is not None:
+            self.free_slots.append(slot)
@@ -0,0 +1,46 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from time import perf_counter
+_start = perf_counter()
+from LazyAlgorithmImports import QCAlgorithm, Resolution
+_lazy_elapsed = perf_counter() - _start
+import LazyAlgorithmImports
+
+class AlgorithmImportsStartupBenchmark(QCAlgorithm):
+    '''Reports the startup cost of the lazy imports against the cost of star importing each AlgorithmImports namespace'''
+
+    def initialize(self):
+        self.set_start_date(2013, 10, 7)
+        self.set_end_date(2013, 10, 11)
+        self.set_cash(100000)
+        self.add_equity("SPY", Resolution.MINUTE)
+
+        lazy_loads = dict(LazyAlgorithmImports.load_times)
+        lazy_namespaces = [key for key in lazy_loads if key not in ("assemblies", "index")]
+        self.log(f"Lazy imports: {_lazy_elapsed:.3f} seconds, {len(lazy_namespaces)} namespaces imported: {', '.join(lazy_namespaces)}")
+
+        # the assemblies are already referenced, what's left is the cost of each star import
+        star_imports = {}
+        for namespace in LazyAlgorithmImports.NAMESPACES:
+            start = perf_counter()
+            exec(f"from {namespace} import *", {})
+            star_imports[namespace] = perf_counter() - start
+
+        total = lazy_loads.get("assemblies", 0) + sum(star_imports.values())
+        self.log(f"Eager imports: {total:.3f} seconds, {len(star_imports)} namespaces imported")
+        for namespace, elapsed in sorted(star_imports.items(), key=lambda x: x[1], reverse=True):
+            self.log(f"{namespace}: {elapsed * 1000:.1f} ms")
+
+    def on_data(self, data):
+        pass
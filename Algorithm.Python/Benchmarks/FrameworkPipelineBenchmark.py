@@ -0,0 +1,70 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+
+class FrameworkPipelineBenchmark(QCAlgorithm):
+    '''Python framework algorithm over 500 minute resolution equities, all its models are defined in Python.
+    Run it with the 'single-gil-scope' parameter set to 'true' and 'false' to compare the framework pipeline modes'''
+
+    def initialize(self):
+        self.set_start_date(2018, 1, 1)
+        self.set_end_date(2018, 1, 31)
+        self.set_cash(1000000)
+
+        self.settings.framework_pipeline_single_gil_scope = self.get_parameter("single-gil-scope", "true").lower() == "true"
+
+        self.universe_settings.resolution = Resolution.MINUTE
+        self.add_universe(lambda fundamental: [x.symbol for x in sorted(fundamental, key=lambda x: x.dollar_volume)[-500:]])
+
+        self.set_alpha(MomentumAlphaModel())
+        self.set_portfolio_construction(EqualWeightingPortfolioConstructionModel(Resolution.DAILY))
+        self.set_risk_management(NoOpRiskManagementModel())
+        self.set_execution(TargetsExecutionModel())
+
+class MomentumAlphaModel(AlphaModel):
+    '''Emits an up insight for the symbols whose price increased since the previous slice'''
+
+    def __init__(self):
+        self._last_prices = {}
+
+    def update(self, algorithm, data):
+        insights = []
+        for symbol, bar in data.bars.items():
+            last_price = self._last_prices.get(symbol)
+            if last_price is not None and bar.close > last_price:
+                insights.append(Insight.price(symbol, timedelta(days=1), InsightDirection.UP))
+            self._last_prices[symbol] = bar.close
+        return insights
+
+    def on_securities_changed(self, algorithm, changes):
+        for security in changes.removed_securities:
+            self._last_prices.pop(security.symbol, None)
+
+class NoOpRiskManagementModel(RiskManagementModel):
+    '''Goes through the targets without adjusting them'''
+
+    def manage_risk(self, algorithm, targets):
+        for target in targets:
+            algorithm.securities[target.symbol]
+        return []
+
+class TargetsExecutionModel(ExecutionModel):
+    '''Keeps track of the targets without placing orders, so the benchmark measures the framework calls'''
+
+    def __init__(self):
+        self._targets = PortfolioTargetCollection()
+
+    def execute(self, algorithm, targets):
+        self._targets.add_range(targets)
+        self._targets.clear_fulfilled(algorithm)
@@ -0,0 +1,51 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from time import perf_counter
+
+class HistoryDataFrameBenchmark(QCAlgorithm):
+    '''Measures the throughput of minute history requests converted into pandas data frames for many symbols'''
+
+    def initialize(self):
+        self.set_start_date(2015, 9, 1)
+        self.set_end_date(2015, 10, 1)
+        self.set_cash(100000)
+
+        tickers = [
+            "SPY", "AAPL", "FB", "VXX", "VRX", "NFLX", "UVXY", "QQQ", "IWM", "BABA",
+            "GILD", "XIV", "XOM", "CVX", "MSFT", "GE", "SLB", "JPM", "XLE", "DIS",
+            "AMZN", "TWTR", "PFE", "C", "BAC", "ABBV", "JNJ", "HAL", "XLV", "INTC",
+            "WFC", "V", "YHOO", "COP", "MYL", "AGN", "WMT", "KMI", "MRK", "TSLA"
+        ]
+        self._symbols = [self.add_equity(ticker, Resolution.MINUTE).symbol for ticker in tickers]
+
+        self._rows = 0
+        self._cells = 0
+        self._elapsed = 0
+
+    def on_end_of_day(self, symbol):
+        if symbol != self._symbols[0]:
+            return
+
+        start = perf_counter()
+        history = self.history(self._symbols, 390, Resolution.MINUTE)
+        self._elapsed += perf_counter() - start
+
+        self._rows += history.shape[0]
+        self._cells += history.size
+
+    def on_end_of_algorithm(self):
+        if self._elapsed > 0:
+            self.log(f"History data frames: {self._rows} rows, {self._cells} cells in {self._elapsed:.3f} seconds. "
+                     f"{self._rows / self._elapsed:.0f} rows per second, {self._cells / self._elapsed:.0f} cells per second")
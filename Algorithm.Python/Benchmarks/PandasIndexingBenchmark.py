@@ -0,0 +1,49 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from AlgorithmImports import *
+from time import perf_counter
+import PandasMapper
+
+class PandasIndexingBenchmark(QCAlgorithm):
+    '''Compares the throughput of indexing history data frames by ticker with and without the Python side symbol lookups memo'''
+
+    def initialize(self):
+        self.set_start_date(2013, 10, 7)
+        self.set_end_date(2013, 10, 11)
+        self.set_cash(100000)
+        self._symbol = self.add_equity("SPY", Resolution.MINUTE).symbol
+
+        self._iterations = 10000
+        self._elapsed = { True: 0, False: 0 }
+        self._lookups = 0
+
+    def on_end_of_day(self, symbol):
+        history = self.history([self._symbol], 60, Resolution.MINUTE)
+        if history.empty:
+            return
+
+        for memoize in [True, False]:
+            PandasMapper.memoize_symbol_lookups = memoize
+            start = perf_counter()
+            for _ in range(self._iterations):
+                history.loc["SPY"]
+            self._elapsed[memoize] += perf_counter() - start
+
+        PandasMapper.memoize_symbol_lookups = True
+        self._lookups += self._iterations
+
+    def on_end_of_algorithm(self):
+        for memoize, elapsed in self._elapsed.items():
+            if elapsed > 0:
+                self.log(f"df.loc['SPY'] memoized lookups: {memoize}. {elapsed:.3f} seconds, {self._lookups / elapsed:.0f} lookups per second")
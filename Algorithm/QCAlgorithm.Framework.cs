@@ -14,6 +14,7 @@
 */
 
 using System.Linq;
+using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Util;
 using QuantConnect.Securities;
@@ -149,6 +150,9 @@ namespace QuantConnect.Algorithm
                 return;
             }
 
+            // when enabled, python framework models are all called inside this GIL scope, re-entering it is cheap
+            using var gilState = EnterFrameworkPipelineGilScope();
+
             // insight timestamping handled via InsightsGenerated event handler
             var insightsEnumerable = Alpha.Update(this, slice);
             // for performance only call 'ToArray' if not empty enumerable (which is static)
@@ -243,6 +247,15 @@ namespace QuantConnect.Algorithm
             Execution.Execute(this, riskAdjustedTargets);
         }
 
+        /// <summary>
+        /// Acquires the Python GIL for the framework models pipeline if <see cref="AlgorithmSettings.FrameworkPipelineSingleGilScope"/> is enabled
+        /// </summary>
+        /// <returns>The GIL state to dispose at the end of the pipeline, null if not enabled</returns>
+        private Py.GILState EnterFrameworkPipelineGilScope()
+        {
+            return Settings.FrameworkPipelineSingleGilScope && PythonEngine.IsInitialized ? Py.GIL() : null;
+        }
+
         /// <summary>
         /// Used to send security changes to algorithm framework models
         /// </summary>
@@ -256,6 +269,8 @@ namespace QuantConnect.Algorithm
                 Debug($"{Time}: {changes}");
             }
 
+            using var gilState = EnterFrameworkPipelineGilScope();
+
             Alpha.OnSecuritiesChanged(this, changes);
             PortfolioConstruction.OnSecuritiesChanged(this, changes);
             Execution.OnSecuritiesChanged(this, changes);
@@ -3474,6 +3474,16 @@ namespace QuantConnect.Algorithm
         {
             if (AssertIndicatorHasWarmupPeriod(indicator))
             {
+                if (indicator is PythonIndicator pythonIndicator && pythonIndicator.ImplementsUpdateBatch)
+                {
+                    // the warm up only needs the final state, so unlike the indicator history,
+                    // 'update_batch' doesn't have to return the value for each input
+                    var history = History(symbols, pythonIndicator.WarmUpPeriod, resolution, dataNormalizationMode: GetIndicatorHistoryDataNormalizationMode(indicator));
+                    var inputs = new List<IBaseData>();
+                    selector ??= GetDefaultSelector<T>();
+                    IndicatorHistory(indicator, history, (bar) => inputs.Add(selector(bar)), flushUpdates: () => pythonIndicator.UpdateBatch(inputs));
+                    return;
+                }
                 IndicatorHistory(indicator, symbols, 0, resolution, selector);
             }
         }
@@ -3496,6 +3506,15 @@ namespace QuantConnect.Algorithm
             // assign default selector
             selector ??= GetDefaultSelector<T>();
 
+            if (indicator is PythonIndicator pythonIndicator && pythonIndicator.ImplementsUpdateBatch)
+            {
+                // collect the consolidated inputs so that the python indicator is updated with a single call
+                var inputs = new List<IBaseData>();
+                WarmUpIndicatorImpl<T>(symbols, period, bar => inputs.Add(selector(bar)), history, identityConsolidator);
+                pythonIndicator.UpdateBatch(inputs);
+                return;
+            }
+
             // we expect T type as input
             Action<T> onDataConsolidated = bar =>
             {
@@ -4142,6 +4161,14 @@ namespace QuantConnect.Algorithm
             where T : IBaseData
         {
             selector ??= GetDefaultSelector<T>();
+            if (indicator is PythonIndicator pythonIndicator && pythonIndicator.ImplementsUpdateBatch)
+            {
+                // collect the inputs so that the python indicator is updated with a single call,
+                // which has to return the value for each input so the history has a point per update
+                var inputs = new List<IBaseData>();
+                return IndicatorHistory(indicator, history, (bar) => inputs.Add(selector(bar)),
+                    flushUpdates: () => pythonIndicator.UpdateBatch(inputs, requireValues: true));
+            }
             return IndicatorHistory(indicator, history, (bar) => indicator.Update(selector(bar)));
         }
 
@@ -4489,7 +4516,8 @@ namespace QuantConnect.Algorithm
             return dataNormalizationMode;
         }
 
-        private IndicatorHistory IndicatorHistory<T>(IndicatorBase<T> indicator, IEnumerable<Slice> history, Action<IBaseData> updateIndicator, Type dataType = null)
+        private IndicatorHistory IndicatorHistory<T>(IndicatorBase<T> indicator, IEnumerable<Slice> history, Action<IBaseData> updateIndicator, Type dataType = null,
+            Action flushUpdates = null)
             where T : IBaseData
         {
             // Reset the indicator
@@ -4579,6 +4607,8 @@ namespace QuantConnect.Algorithm
                     }
                 }
             }
+            // let batch updates, if any, reach the indicator
+            flushUpdates?.Invoke();
             // flush the last point, this will be useful for indicator consuming time from multiple symbols
             consumeLastPoint(lastPoint);
             indicator.Updated -= callback;
@@ -1033,11 +1033,13 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the result. <see cref="HistoryFormat.Columnar"/> returns a dictionary keyed by symbol of numpy arrays
+        /// keyed by field, skipping the pandas data frame construction</param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, int periods, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             if (tickers.TryConvert<Universe>(out var universe))
             {
@@ -1045,22 +1047,23 @@ namespace QuantConnect.Algorithm
                 var requests = CreateBarCountHistoryRequests(new[] { universe.Symbol }, universe.DataType, periods, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
                 // we pass in 'BaseDataCollection' type so we clean up the data frame if we can
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection));
+                return GetHistory(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection), format);
             }
             if (tickers.TryCreateType(out var type))
             {
                 var requests = CreateBarCountHistoryRequests(Securities.Keys, type, periods, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type);
+                return GetHistory(History(requests.Where(x => x != null)), flatten, type, format);
             }
 
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
             var dataType = Extensions.GetCustomDataTypeFromSymbols(symbols);
 
-            return GetDataFrame(
+            return GetHistory(
                 History(symbols, periods, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset),
                 flatten,
-                dataType);
+                dataType,
+                format);
         }
 
         /// <summary>
@@ -1080,14 +1083,16 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the result. <see cref="HistoryFormat.Columnar"/> returns a dictionary keyed by symbol of numpy arrays
+        /// keyed by field, skipping the pandas data frame construction</param>
         /// <returns>A python dictionary with pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, TimeSpan span, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             return History(tickers, Time - span, Time, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode,
-                contractDepthOffset, flatten);
+                contractDepthOffset, flatten, format);
         }
 
         /// <summary>
@@ -1107,11 +1112,13 @@ namespace QuantConnect.Algorithm
         /// e.g. for universe requests, the each row represents a day of data, and the data is stored in a list in a cell of the data frame.
         /// If flatten is true, the resulting data frame will contain one row per universe constituent,
         /// and each property of the constituent will be a column in the data frame.</param>
+        /// <param name="format">The format of the result. <see cref="HistoryFormat.Columnar"/> returns a dictionary keyed by symbol of numpy arrays
+        /// keyed by field, skipping the pandas data frame construction</param>
         /// <returns>A python dictionary with a pandas DataFrame containing the requested historical data</returns>
         [DocumentationAttribute(HistoricalData)]
         public PyObject History(PyObject tickers, DateTime start, DateTime end, Resolution? resolution = null, bool? fillForward = null,
             bool? extendedMarketHours = null, DataMappingMode? dataMappingMode = null, DataNormalizationMode? dataNormalizationMode = null,
-            int? contractDepthOffset = null, bool flatten = false)
+            int? contractDepthOffset = null, bool flatten = false, HistoryFormat format = HistoryFormat.DataFrame)
         {
             if (tickers.TryConvert<Universe>(out var universe))
             {
@@ -1119,22 +1126,23 @@ namespace QuantConnect.Algorithm
                 var requests = CreateDateRangeHistoryRequests(new[] { universe.Symbol }, universe.DataType, start, end, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
                 // we pass in 'BaseDataCollection' type so we clean up the data frame if we can
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection));
+                return GetHistory(History(requests.Where(x => x != null)), flatten, typeof(BaseDataCollection), format);
             }
             if (tickers.TryCreateType(out var type))
             {
                 var requests = CreateDateRangeHistoryRequests(Securities.Keys, type, start, end, resolution, fillForward, extendedMarketHours,
                     dataMappingMode, dataNormalizationMode, contractDepthOffset);
-                return GetDataFrame(History(requests.Where(x => x != null)), flatten, type);
+                return GetHistory(History(requests.Where(x => x != null)), flatten, type, format);
             }
 
             var symbols = tickers.ConvertToSymbolEnumerable().ToArray();
             var dataType = Extensions.GetCustomDataTypeFromSymbols(symbols);
 
-            return GetDataFrame(
+            return GetHistory(
                 History(symbols, start, end, resolution, fillForward, extendedMarketHours, dataMappingMode, dataNormalizationMode, contractDepthOffset),
                 flatten,
-                dataType);
+                dataType,
+                format);
         }
 
         /// <summary>
@@ -2095,6 +2103,18 @@ namespace QuantConnect.Algorithm
             return flatten ? history : TryCleanupCollectionDataFrame(dataType, history);
         }
 
+        /// <summary>
+        /// Converts an enumerable of Slice into the requested Python history format
+        /// </summary>
+        protected PyObject GetHistory(IEnumerable<Slice> data, bool flatten, Type dataType, HistoryFormat format)
+        {
+            if (format == HistoryFormat.Columnar)
+            {
+                return PandasConverter.GetColumnarData(RemoveMemoizing(data), dataType);
+            }
+            return GetDataFrame(data, flatten, dataType);
+        }
+
         /// <summary>
         /// Converts an enumerable of BaseData into a Python Pandas data frame
         /// </summary>
@@ -564,6 +564,7 @@ namespace QuantConnect.Brokerages.Backtesting
                         else
                         {
                             universe.RemoveMember(Algorithm.UtcTime, security);
+                            Algorithm.UniverseManager.UpdateMembership(universe, security.Symbol);
                         }
                     }
                 }
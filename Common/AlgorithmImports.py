@@ -29,6 +29,7 @@ for file in os.listdir(path):
     if file.endswith(".dll") and file.startswith("QuantConnect."):
         AddReference(file.replace(".dll", ""))
 
+# LazyAlgorithmImports reads the namespaces to resolve names from these star imports
 from System import *
 from System.Drawing import *
 
@@ -181,6 +181,13 @@ namespace QuantConnect
         /// </summary>
         public bool SeedInitialPrices { get; set; }
 
+        /// <summary>
+        /// Determines whether the framework models of Python algorithms are run inside a single Python GIL scope per time slice,
+        /// from the alpha model update to the execution model, instead of acquiring and releasing the GIL on each model call.
+        /// Defaults to false
+        /// </summary>
+        public bool FrameworkPipelineSingleGilScope { get; set; }
+
         /// <summary>
         /// Initializes a new instance of the <see cref="AlgorithmSettings"/> class
         /// </summary>
@@ -198,6 +205,7 @@ namespace QuantConnect
             DatabasesRefreshPeriod = _defaultDatabasesRefreshPeriod;
             IgnoreUnknownAssetHoldings = _defaultIgnoreUnknownAssetHoldings;
             SeedInitialPrices = false;
+            FrameworkPipelineSingleGilScope = false;
         }
     }
 }
@@ -1281,4 +1281,21 @@ namespace QuantConnect
         /// </summary>
         Research
     }
+
+    /// <summary>
+    /// Specifies the format of the result of a Python history request
+    /// </summary>
+    public enum HistoryFormat
+    {
+        /// <summary>
+        /// A pandas data frame indexed by symbol and time (0)
+        /// </summary>
+        DataFrame,
+
+        /// <summary>
+        /// A dictionary keyed by symbol holding a dictionary of numpy arrays keyed by field, including the time.
+        /// Skips the pandas data frame construction entirely (1)
+        /// </summary>
+        Columnar
+    }
 }
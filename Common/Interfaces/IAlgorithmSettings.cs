@@ -155,5 +155,10 @@ namespace QuantConnect.Interfaces
         /// Determines whether to seed initial prices for all selected and manually added securities.
         /// </summary>
         bool SeedInitialPrices { get; set; }
+
+        /// <summary>
+        /// Determines whether the framework models of Python algorithms are run inside a single Python GIL scope per time slice
+        /// </summary>
+        bool FrameworkPipelineSingleGilScope { get; set; }
     }
 }
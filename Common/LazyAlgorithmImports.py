@@ -0,0 +1,158 @@
+# QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+# Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Lazy counterpart of AlgorithmImports: nothing is loaded from the CLR until a name is first requested.
+# The QuantConnect assemblies are referenced on the first attribute access and their exported types are indexed
+# by name, without importing any namespace. Each name is then imported only from the namespace that owns it, the
+# last of the AlgorithmImports namespaces taking precedence like it does with the star imports there.
+#
+#   from LazyAlgorithmImports import QCAlgorithm, Resolution
+#   import LazyAlgorithmImports as qc
+#
+# Star imports can't be lazy, "from LazyAlgorithmImports import *" only brings the names that were already loaded.
+# The namespaces are read from the star imports of AlgorithmImports, so both modules always resolve the same names.
+
+import os
+import re
+import sys
+from importlib import import_module
+from time import perf_counter
+
+path = os.path.dirname(os.path.realpath(__file__))
+if path not in sys.path:
+    sys.path.append(path)
+
+def _read_namespaces():
+    '''Reads the star imported namespaces of AlgorithmImports, in order'''
+    with open(os.path.join(path, "AlgorithmImports.py")) as file:
+        return tuple(re.findall(r"^from\s+((?:System|QuantConnect)[\w.]*)\s+import\s+\*", file.read(), re.MULTILINE))
+
+NAMESPACES = _read_namespaces()
+
+# Python modules AlgorithmImports exposes under an alias
+_MODULE_ALIASES = {
+    "np": "numpy",
+    "pd": "pandas",
+    "plt": "matplotlib.pyplot",
+}
+
+# Names AlgorithmImports exposes as aliases of other names
+_NAME_ALIASES = {
+    "QCAlgorithmFramework": "QCAlgorithm",
+    "QCAlgorithmFrameworkBridge": "QCAlgorithm",
+}
+
+# Seconds spent in the CLR, keyed by what was loaded: the assemblies, the names index and then each imported namespace
+load_times = {}
+
+_namespaces = {}
+# owning namespace of each name exported by the referenced assemblies, None until they are loaded
+_index = None
+# namespaces that might have names missing from the index, looked up in order when a name is not indexed
+_unindexed_namespaces = ()
+
+from datetime import date, time, datetime, timedelta
+from typing import *
+import math
+import json
+
+# same as AlgorithmImports, keep Python's builtin Exception instead of System.Exception
+from builtins import Exception
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name in _MODULE_ALIASES:
+        value = import_module(_MODULE_ALIASES[name])
+    elif name in _NAME_ALIASES:
+        value = __getattr__(_NAME_ALIASES[name])
+    else:
+        value = _find(name)
+
+    # cache it so the next access doesn't go through __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_ALIASES) | set(_NAME_ALIASES))
+
+def _find(name):
+    '''Imports the name from the namespace that owns it, the same one the AlgorithmImports star imports would resolve it from'''
+    _load_assemblies()
+    namespace = _index.get(name)
+    if namespace is not None:
+        return getattr(_import_namespace(namespace), name)
+
+    for namespace in _unindexed_namespaces:
+        module = _import_namespace(namespace)
+        if module is None:
+            continue
+        try:
+            return getattr(module, name)
+        except AttributeError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _import_namespace(namespace):
+    '''Imports the CLR namespace on first use, namespaces without any loaded assembly are None'''
+    if namespace in _namespaces:
+        return _namespaces[namespace]
+
+    start = perf_counter()
+    try:
+        module = import_module(namespace)
+    except ImportError:
+        module = None
+    load_times[namespace] = perf_counter() - start
+    _namespaces[namespace] = module
+    return module
+
+def _load_assemblies():
+    global _index, _unindexed_namespaces
+    if _index is not None:
+        return
+
+    start = perf_counter()
+    from clr import AddReference
+    AddReference("System")
+    assemblies = [AddReference(file.replace(".dll", "")) for file in os.listdir(path)
+                  if file.endswith(".dll") and file.startswith("QuantConnect.")]
+    load_times["assemblies"] = perf_counter() - start
+
+    start = perf_counter()
+    precedence = {namespace: i for i, namespace in enumerate(NAMESPACES)}
+    index = {}
+    indexed = set()
+    for assembly in assemblies:
+        try:
+            types = assembly.GetExportedTypes()
+        except Exception:
+            # the assembly can't be reflected, its namespaces are looked up by importing them
+            continue
+        indexed.add(assembly.GetName().Name)
+        for clr_type in types:
+            namespace = clr_type.Namespace
+            if clr_type.IsNested or namespace not in precedence:
+                continue
+            # generic types are exposed without their arity, 'List`1' as 'List'
+            name = clr_type.Name.split("`")[0]
+            current = index.get(name)
+            if current is None or precedence[current] < precedence[namespace]:
+                index[name] = namespace
+
+    # the System namespaces come from the framework assemblies, which are not indexed
+    _unindexed_namespaces = tuple(namespace for namespace in reversed(NAMESPACES)
+        if not namespace.startswith("QuantConnect") or len(indexed) < len(assemblies))
+    _index = index
+    load_times["index"] = perf_counter() - start
@@ -14,11 +14,15 @@
 '''
 Lean Pandas Remapper
 Wraps key indexing functions of Pandas to remap keys to SIDs when accessing dataframes.
-Allowing support for indexing of Lean created Indexes with tickers like "SPY", Symbol objs, and SIDs
+Allowing support for indexing of Lean created Indexes with tickers like "SPY", Symbol objs, and SIDs.
+Keys that hold no strings can't be remapped and go straight to the original pandas functions.
 
 '''
 
+import numpy as np
 import pandas as pd
+from ctypes import c_char, c_int64
+from functools import lru_cache
 from pandas.core.indexes.frozen import FrozenList as pdFrozenList
 
 from clr import AddReference
@@ -45,6 +49,60 @@ class PandasColumn(str):
     def __hash__(self):
         return super().__hash__()
 
+def array_from_address(address, count, dtype):
+    '''Creates a numpy array of the given dtype from a pinned memory buffer holding count items.
+    Used by PandasData.cs to hand its typed columns to numpy with a single copy instead of converting each value
+    '''
+    dtype = np.dtype(dtype)
+    buffer = (c_char * (count * dtype.itemsize)).from_address(address)
+    return np.frombuffer(buffer, dtype=dtype).copy()
+
+def factorize(times):
+    '''Factorizes the given times into their codes and sorted unique values, used as the time level of Lean data frames indexes'''
+    return pd.factorize(times, sort=True)
+
+def index_from_levels(constant_levels, count, time_level, names):
+    '''Creates the index of a Lean data frame from its levels and codes, instead of a list of tuples.
+    Each of the constant levels holds a single value repeated count times, and the optional time level
+    is a (codes, uniques) tuple as returned by factorize
+    '''
+    levels = [[value] for value in constant_levels]
+    codes = [np.zeros(count, dtype=np.int8)] * len(levels)
+    if time_level is not None:
+        time_codes, times = time_level
+        levels.append(times)
+        codes.append(time_codes)
+
+    if len(levels) == 1:
+        return pd.Index(levels[0] * count, name=names[0])
+    return pd.MultiIndex(levels=levels, codes=codes, names=names, verify_integrity=False)
+
+# Whether ticker lookups are memoized on the Python side, the memo is invalidated by SymbolCache generation changes
+memoize_symbol_lookups = True
+
+# SymbolCache generation counter, incremented by .NET each time a mapping is added or removed.
+# It is read straight from memory so checking whether the memo is still valid doesn't call into .NET
+_symbol_cache_generation = c_int64.from_address(SymbolCache.get_generation_address())
+_memo_generation = _symbol_cache_generation.value
+
+@lru_cache(maxsize=4096)
+def _memoized_try_get_symbol(key):
+    return SymbolCache.try_get_symbol(key, None)
+
+def try_get_symbol(key):
+    '''Resolves a ticker or SID string through SymbolCache, using a bounded Python side memo
+    which is cleared each time the SymbolCache mappings change
+    '''
+    if not memoize_symbol_lookups:
+        return SymbolCache.try_get_symbol(key, None)
+
+    global _memo_generation
+    generation = _symbol_cache_generation.value
+    if generation != _memo_generation:
+        _memoized_try_get_symbol.cache_clear()
+        _memo_generation = generation
+    return _memoized_try_get_symbol(key)
+
 def mapper(key):
     '''Maps a Symbol object or a Symbol Ticker (string) to the string representation of
     Symbol SecurityIdentifier.If cannot map, returns the object
@@ -53,7 +111,7 @@ def mapper(key):
     if keyType is tuple:
         return tuple(mapper(x) for x in key)
     if keyType is str:
-        kvp = SymbolCache.try_get_symbol(key, None)
+        kvp = try_get_symbol(key)
         if kvp[0]:
             return kvp[1]
         return key
@@ -63,12 +121,58 @@ def mapper(key):
         return {k: mapper(v) for k, v in key.items()}
     return key
 
+def contains_str(key):
+    '''Whether the key, or any of the items of a tuple, list or dict key, is a string.
+    Only strings (tickers and SIDs) can be mapped to Symbol objects
+    '''
+    keyType = type(key)
+    if keyType is str:
+        return True
+    if keyType is tuple or keyType is list:
+        return any(contains_str(x) for x in key)
+    if keyType is dict:
+        return any(contains_str(x) for x in key.values())
+    return False
+
+def holds_symbols(index):
+    '''Whether the index, or any level of a multi index, may hold Symbol objects.
+    Only object indexes of mixed types can, pandas caches the inferred type of each index
+    '''
+    if isinstance(index, pd.MultiIndex):
+        return any(holds_symbols(level) for level in index.levels)
+    return index.dtype == object and index.inferred_type == 'mixed'
+
+def may_hold_symbols(obj):
+    '''Whether the index, series or data frame, or the one a .loc/.at indexer is for, may hold Symbol objects.
+    Mapped keys are Symbol objects, so they can only be found in those
+    '''
+    if isinstance(obj, pd.Index):
+        return holds_symbols(obj)
+    if isinstance(obj, pd.DataFrame):
+        return holds_symbols(obj.index) or holds_symbols(obj.columns)
+    if isinstance(obj, pd.Series):
+        return holds_symbols(obj.index)
+    owner = getattr(obj, 'obj', None)
+    if owner is not None:
+        return may_hold_symbols(owner)
+    return True
+
 def wrap_keyerror_function(f):
     '''Wraps function f with wrapped_function, used for functions that throw KeyError when not found.
-    wrapped_function converts the args / kwargs to use alternative index keys and then calls the function.
+    Keys that hold no strings can't be mapped, so wrapped_function calls the function with them directly,
+    as it does for objects that hold no Symbol objects the mapped keys could match.
+    Otherwise it converts the args / kwargs to use alternative index keys and then calls the function.
     If this fails we fall back to the original key and try it as well, if they both fail we throw our error.
     '''
     def wrapped_function(*args, **kwargs):
+        # Nothing to map, execute original at native speed
+        if not contains_str(args[1:]) and not contains_str(kwargs):
+            return f(*args, **kwargs)
+
+        # Not a Lean object, the mapped Symbols can't be found
+        if not may_hold_symbols(args[0]):
+            return f(*args, **kwargs)
+
         # Map args & kwargs and execute function
         try:
             newargs = args
@@ -97,8 +201,8 @@ def wrap_keyerror_function(f):
 
 def wrap_bool_function(f):
     '''Wraps function f with wrapped_function, used for functions that reply true/false if key is found.
-    wrapped_function attempts with the original args, if its false, it converts the args / kwargs to use
-    alternative index keys and then attempts with the mapped args.
+    wrapped_function attempts with the original args, if its false and the key holds strings, it converts
+    the args / kwargs to use alternative index keys and then attempts with the mapped args.
     '''
     def wrapped_function(*args, **kwargs):
 
@@ -107,6 +211,10 @@ def wrap_bool_function(f):
         if originalResult:
             return originalResult
 
+        # Nothing to map, or not a Lean object the mapped Symbols could be found in, return the original result
+        if not contains_str(args[1:]) and not contains_str(kwargs) or not may_hold_symbols(args[0]):
+            return originalResult
+
         # Try our mapped args; return this result regardless
         newargs = args
         newkwargs = kwargs
@@ -15,6 +15,7 @@
 
 using System;
 using Python.Runtime;
+using System.Diagnostics;
 using System.Collections.Generic;
 
 namespace QuantConnect.Python
@@ -26,7 +27,7 @@ namespace QuantConnect.Python
     {
         private PyObject _instance;
         private object _underlyingClrObject;
-        private Dictionary<string, PyObject> _pythonMethods;
+        private Dictionary<string, PythonMethod> _pythonMethods;
         private Dictionary<string, string> _pythonPropertyNames;
 
         private bool _validateInterface;
@@ -151,10 +152,19 @@ namespace QuantConnect.Python
         /// <param name="pythonOnly">Whether to only return python methods</param>
         /// <returns>The matched method</returns>
         public PyObject GetMethod(string methodName, bool pythonOnly = false)
+        {
+            return GetPythonMethod(methodName, pythonOnly).Method;
+        }
+
+        /// <summary>
+        /// Gets the dispatch table entry of the method with the specified name, resolving it the first time it's requested
+        /// </summary>
+        private PythonMethod GetPythonMethod(string methodName, bool pythonOnly = false)
         {
             if (!_pythonMethods.TryGetValue(methodName, out var method))
             {
-                method = pythonOnly ? _instance.GetPythonMethod(methodName) : _instance.GetMethod(methodName);
+                var pyMethod = pythonOnly ? _instance.GetPythonMethod(methodName) : _instance.GetMethod(methodName);
+                method = new PythonMethod(pyMethod, GetCounter(methodName));
                 _pythonMethods = AddToDictionary(_pythonMethods, methodName, method);
             }
 
@@ -169,8 +179,16 @@ namespace QuantConnect.Python
         /// <returns>The returned valued converted to the given type</returns>
         public T InvokeMethod<T>(string methodName, params object[] args)
         {
-            var method = GetMethod(methodName);
-            return PythonRuntimeChecker.InvokeMethod<T>(method, methodName, args);
+            var method = GetPythonMethod(methodName);
+            var start = method.Start();
+            try
+            {
+                return PythonRuntimeChecker.InvokeMethod<T>(method.Method, methodName, args);
+            }
+            finally
+            {
+                method.Stop(start);
+            }
         }
 
         /// <summary>
@@ -181,8 +199,16 @@ namespace QuantConnect.Python
         public PyObject InvokeMethod(string methodName, params object[] args)
         {
             using var _ = Py.GIL();
-            var method = GetMethod(methodName);
-            return method.Invoke(args);
+            var method = GetPythonMethod(methodName);
+            var start = method.Start();
+            try
+            {
+                return method.Method.Invoke(args);
+            }
+            finally
+            {
+                method.Stop(start);
+            }
         }
 
         /// <summary>
@@ -203,8 +229,9 @@ namespace QuantConnect.Python
         /// <returns>The returned valued converted to the given type</returns>
         public IEnumerable<T> InvokeMethodAndEnumerate<T>(string methodName, params object[] args)
         {
-            var method = GetMethod(methodName);
-            return PythonRuntimeChecker.InvokeMethodAndEnumerate<T>(method, methodName, args);
+            var method = GetPythonMethod(methodName);
+            var result = PythonRuntimeChecker.InvokeMethodAndEnumerate<T>(method.Method, methodName, args);
+            return method.Counter == null ? result : EnumerateAndRecord(result, method.Counter);
         }
 
         /// <summary>
@@ -215,8 +242,16 @@ namespace QuantConnect.Python
         /// <returns>The returned valued converted to the given type</returns>
         public Dictionary<TKey, TValue> InvokeMethodAndGetDictionary<TKey, TValue>(string methodName, params object[] args)
         {
-            var method = GetMethod(methodName);
-            return PythonRuntimeChecker.InvokeMethodAndGetDictionary<TKey, TValue>(method, methodName, args);
+            var method = GetPythonMethod(methodName);
+            var start = method.Start();
+            try
+            {
+                return PythonRuntimeChecker.InvokeMethodAndGetDictionary<TKey, TValue>(method.Method, methodName, args);
+            }
+            finally
+            {
+                method.Stop(start);
+            }
         }
 
         /// <summary>
@@ -229,8 +264,16 @@ namespace QuantConnect.Python
         /// <returns>The returned valued converted to the given type</returns>
         public T InvokeMethodWithOutParameters<T>(string methodName, Type[] outParametersTypes, out object[] outParameters, params object[] args)
         {
-            var method = GetMethod(methodName);
-            return PythonRuntimeChecker.InvokeMethodAndGetOutParameters<T>(method, methodName, outParametersTypes, out outParameters, args);
+            var method = GetPythonMethod(methodName);
+            var start = method.Start();
+            try
+            {
+                return PythonRuntimeChecker.InvokeMethodAndGetOutParameters<T>(method.Method, methodName, outParametersTypes, out outParameters, args);
+            }
+            finally
+            {
+                method.Stop(start);
+            }
         }
 
         /// <summary>
@@ -243,8 +286,16 @@ namespace QuantConnect.Python
         /// <returns>The returned value wrapped using the given method if the result is not a C# object</returns>
         public T InvokeMethodAndWrapResult<T>(string methodName, Func<PyObject, T> wrapResult, params object[] args)
         {
-            var method = GetMethod(methodName);
-            return PythonRuntimeChecker.InvokeMethodAndWrapResult(method, methodName, wrapResult, args);
+            var method = GetPythonMethod(methodName);
+            var start = method.Start();
+            try
+            {
+                return PythonRuntimeChecker.InvokeMethodAndWrapResult(method.Method, methodName, wrapResult, args);
+            }
+            finally
+            {
+                method.Stop(start);
+            }
         }
 
         private string GetPropertyName(string propertyName, bool isEvent = false)
@@ -358,9 +409,9 @@ namespace QuantConnect.Python
             using var _ = Py.GIL();
             if (_pythonMethods != null)
             {
-                foreach (var methods in _pythonMethods.Values)
+                foreach (var method in _pythonMethods.Values)
                 {
-                    methods.Dispose();
+                    method.Method?.Dispose();
                 }
                 _pythonMethods.Clear();
             }
@@ -380,10 +431,18 @@ namespace QuantConnect.Python
 
             if (_instance != null)
             {
-                var method = GetMethod(methodName, true);
-                if (method != null)
+                var method = GetPythonMethod(methodName, true);
+                if (method.Method != null)
                 {
-                    result = PythonRuntimeChecker.InvokeMethod<T>(method, methodName, args);
+                    var start = method.Start();
+                    try
+                    {
+                        result = PythonRuntimeChecker.InvokeMethod<T>(method.Method, methodName, args);
+                    }
+                    finally
+                    {
+                        method.Stop(start);
+                    }
                     return true;
                 }
             }
@@ -392,6 +451,94 @@ namespace QuantConnect.Python
             return false;
         }
 
+        /// <summary>
+        /// Gets the calls counter of the given method, null if the Python method statistics are not enabled
+        /// </summary>
+        private PythonMethodStatistics.Counter GetCounter(string methodName)
+        {
+            var statistics = PythonMethodStatistics.Current;
+            if (statistics == null)
+            {
+                return null;
+            }
+
+            using var _ = Py.GIL();
+            using var pythonType = _instance.GetPythonType();
+            return statistics.GetCounter($"{pythonType.Name}.{methodName}");
+        }
+
+        /// <summary>
+        /// Enumerates the given items recording the time spent getting them.
+        /// The Python method is called lazily, when the first item is requested, so the time is measured around each MoveNext
+        /// and the time spent by the caller between items is not included
+        /// </summary>
+        private static IEnumerable<T> EnumerateAndRecord<T>(IEnumerable<T> items, PythonMethodStatistics.Counter counter)
+        {
+            var elapsed = 0L;
+            using var enumerator = items.GetEnumerator();
+            try
+            {
+                while (true)
+                {
+                    var start = Stopwatch.GetTimestamp();
+                    try
+                    {
+                        if (!enumerator.MoveNext())
+                        {
+                            yield break;
+                        }
+                    }
+                    finally
+                    {
+                        elapsed += Stopwatch.GetTimestamp() - start;
+                    }
+                    yield return enumerator.Current;
+                }
+            }
+            finally
+            {
+                counter.RecordElapsed(elapsed);
+            }
+        }
+
+        /// <summary>
+        /// Dispatch table entry of a resolved Python method along with its calls counter
+        /// </summary>
+        private class PythonMethod
+        {
+            /// <summary>
+            /// The resolved Python method, null if not defined
+            /// </summary>
+            public PyObject Method { get; }
+
+            /// <summary>
+            /// The calls and elapsed time counter of this method, null if the statistics are not enabled
+            /// </summary>
+            public PythonMethodStatistics.Counter Counter { get; }
+
+            public PythonMethod(PyObject method, PythonMethodStatistics.Counter counter)
+            {
+                Method = method;
+                Counter = counter;
+            }
+
+            /// <summary>
+            /// Gets the timestamp a call starts at, only read if the statistics are enabled
+            /// </summary>
+            public long Start()
+            {
+                return Counter == null ? 0 : Stopwatch.GetTimestamp();
+            }
+
+            /// <summary>
+            /// Records a call that started at the given timestamp
+            /// </summary>
+            public void Stop(long start)
+            {
+                Counter?.Record(start);
+            }
+        }
+
         /// <summary>
         /// Set of helper methods to invoke Python methods with runtime checks for return values and out parameter's conversions.
         /// </summary>
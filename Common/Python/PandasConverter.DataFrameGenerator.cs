@@ -191,7 +191,9 @@ namespace QuantConnect.Python
             {
                 using var _ = Py.GIL();
 
-                var pandasDataDataFrames = GetPandasDataDataFrames(levels, filterMissingValueColumns, symbolOnlyIndex, forceMultiValueSymbol).ToList();
+                // the time levels are shared between symbols, like the contracts of an option chain, so they are created once
+                using var timeLevelCache = new PandasData.TimeLevelCache();
+                var pandasDataDataFrames = GetPandasDataDataFrames(levels, filterMissingValueColumns, symbolOnlyIndex, forceMultiValueSymbol, timeLevelCache).ToList();
                 var collectionsDataFrames = GetCollectionsDataFrames(symbolOnlyIndex, forceMultiValueSymbol).ToList();
 
                 try
@@ -236,10 +238,33 @@ namespace QuantConnect.Python
                 }
             }
 
+            /// <summary>
+            /// Generates a dictionary keyed by symbol of dictionaries of numpy arrays keyed by field, without creating any data frame
+            /// </summary>
+            /// <param name="filterMissingValueColumns">Whether to filter missing values. See <see cref="PandasData.ToColumnarDictionary(bool)"/></param>
+            public PyDict GenerateColumnarData(bool filterMissingValueColumns = true)
+            {
+                using var _ = Py.GIL();
+
+                var result = new PyDict();
+                if (_pandasData != null)
+                {
+                    foreach (var kvp in _pandasData)
+                    {
+                        using var pySymbol = kvp.Key.ToPython();
+                        using var columns = kvp.Value.ToColumnarDictionary(filterMissingValueColumns);
+                        result.SetItem(pySymbol, columns);
+                    }
+                }
+
+                return result;
+            }
+
             /// <summary>
             /// Creates the data frames for the data stored in the <see cref="_pandasData"/> dictionary
             /// </summary>
-            private IEnumerable<PyObject> GetPandasDataDataFrames(int? levels, bool filterMissingValueColumns, bool symbolOnlyIndex, bool forceMultiValueSymbol)
+            private IEnumerable<PyObject> GetPandasDataDataFrames(int? levels, bool filterMissingValueColumns, bool symbolOnlyIndex, bool forceMultiValueSymbol,
+                PandasData.TimeLevelCache timeLevelCache)
             {
                 if (_pandasData is null || _pandasData.Count == 0)
                 {
@@ -254,7 +279,7 @@ namespace QuantConnect.Python
 
                 foreach (var data in _pandasData.Values)
                 {
-                    yield return data.ToPandasDataFrame(levels ?? _maxLevels, filterMissingValueColumns);
+                    yield return data.ToPandasDataFrame(levels ?? _maxLevels, filterMissingValueColumns, timeLevelCache);
                 }
             }
 
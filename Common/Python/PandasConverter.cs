@@ -60,6 +60,19 @@ namespace QuantConnect.Python
             return generator.GenerateDataFrame();
         }
 
+        /// <summary>
+        /// Converts an enumerable of <see cref="Slice"/> in a dictionary keyed by symbol of dictionaries of numpy arrays keyed by field,
+        /// including the time. No pandas object is created
+        /// </summary>
+        /// <param name="data">Enumerable of <see cref="Slice"/></param>
+        /// <param name="dataType">Optional type of bars to add to the result</param>
+        /// <returns><see cref="PyDict"/> keyed by <see cref="Symbol"/></returns>
+        public PyDict GetColumnarData(IEnumerable<Slice> data, Type dataType = null)
+        {
+            var generator = new DataFrameGenerator(data, dataType: dataType);
+            return generator.GenerateColumnarData();
+        }
+
         /// <summary>
         /// Converts an enumerable of <see cref="IBaseData"/> in a pandas.DataFrame
         /// </summary>
@@ -0,0 +1,389 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using System;
+using System.Collections;
+using System.Collections.Generic;
+using System.Globalization;
+
+namespace QuantConnect.Python
+{
+    public partial class PandasData
+    {
+        /// <summary>
+        /// The storage type of a <see cref="Serie"/> values
+        /// </summary>
+        private enum SerieType
+        {
+            /// <summary>
+            /// No non-null value has been added yet
+            /// </summary>
+            Unknown,
+
+            /// <summary>
+            /// Values are stored in a double buffer, null values are stored as NaN
+            /// </summary>
+            Double,
+
+            /// <summary>
+            /// Values are stored in a long buffer
+            /// </summary>
+            Long,
+
+            /// <summary>
+            /// Values are stored in a long buffer as nanoseconds since epoch, null values are stored as NaT
+            /// </summary>
+            DateTime,
+
+            /// <summary>
+            /// Values are stored in a byte buffer
+            /// </summary>
+            Bool,
+
+            /// <summary>
+            /// Values are stored boxed, this is the fallback for strings, mixed types and any other type
+            /// </summary>
+            Object
+        }
+
+        /// <summary>
+        /// Typed column store for a single data frame column.
+        /// Values are kept in contiguous buffers per type so they can be handed to numpy with a single copy,
+        /// falling back to boxed storage when the values are not homogeneous
+        /// </summary>
+        private class Serie
+        {
+            private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
+
+            private const int InitialCapacity = 16;
+
+            private SerieType _type;
+            private int _count;
+            private double[] _doubles;
+            private long[] _longs;
+            private byte[] _bools;
+            private List<object> _objects;
+
+            public bool ShouldFilter { get; private set; }
+            public List<DateTime> Times { get; }
+
+            /// <summary>
+            /// The number of values in this serie
+            /// </summary>
+            public int Count => _count;
+
+            public Serie(bool withTimeIndex = true)
+            {
+                ShouldFilter = true;
+                if (withTimeIndex)
+                {
+                    Times = new();
+                }
+            }
+
+            public void Add(DateTime time, object input, bool overrideValues)
+            {
+                var value = input is decimal ? Convert.ToDouble(input, InvariantCulture) : input;
+                if (ShouldFilter)
+                {
+                    // we need at least 1 valid entry for the series not to get filtered
+                    if (value is double doubleValue)
+                    {
+                        if (!doubleValue.IsNaNOrZero())
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value is string stringValue)
+                    {
+                        if (!string.IsNullOrWhiteSpace(stringValue))
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value is bool boolValue)
+                    {
+                        if (boolValue)
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                    else if (value != null)
+                    {
+                        if (value is ICollection enumerable)
+                        {
+                            if (enumerable.Count != 0)
+                            {
+                                ShouldFilter = false;
+                            }
+                        }
+                        else
+                        {
+                            ShouldFilter = false;
+                        }
+                    }
+                }
+
+                if (overrideValues && Times != null && Times.Count > 0 && Times[^1] == time)
+                {
+                    // If the time is the same as the last one, we overwrite the value
+                    SetValue(_count - 1, value);
+                }
+                else
+                {
+                    EnsureCapacity(_count + 1);
+                    _count++;
+                    SetValue(_count - 1, value);
+                    Times?.Add(time);
+                }
+            }
+
+            /// <summary>
+            /// Gets the boxed value at the given position
+            /// </summary>
+            public object GetValue(int index)
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        return _doubles[index];
+                    case SerieType.Long:
+                        return _longs[index];
+                    case SerieType.DateTime:
+                        var nanoseconds = _longs[index];
+                        return nanoseconds == NaT ? null : FromDateTime64(nanoseconds);
+                    case SerieType.Bool:
+                        return _bools[index] != 0;
+                    case SerieType.Object:
+                        return _objects[index];
+                    default:
+                        return null;
+                }
+            }
+
+            /// <summary>
+            /// Converts the values to a Python object that can be used as the data of a pandas.Series.
+            /// Typed buffers are copied into a numpy array in one go, boxed values are converted one by one into a list
+            /// </summary>
+            public PyObject ToPython()
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        return ToNumpyArray(_doubles, _count, _float64);
+                    case SerieType.Long:
+                        return ToNumpyArray(_longs, _count, _int64);
+                    case SerieType.DateTime:
+                        return ToNumpyArray(_longs, _count, _datetime64);
+                    case SerieType.Bool:
+                        return ToNumpyArray(_bools, _count, _bool);
+                    default:
+                        var pyList = new PyList();
+                        for (var i = 0; i < _count; i++)
+                        {
+                            using var pyObject = GetValue(i).ToPython();
+                            pyList.Append(pyObject);
+                        }
+                        return pyList;
+                }
+            }
+
+            /// <summary>
+            /// Creates a new serie, without time index, holding this serie values aligned to the given time positions.
+            /// Missing values are added as null
+            /// </summary>
+            /// <param name="count">The number of aligned times</param>
+            /// <param name="timeIndexes">The position of the first occurrence of each time in the aligned times.
+            /// Repeated times of this serie take the following positions, in order</param>
+            public Serie Align(int count, Dictionary<DateTime, int> timeIndexes)
+            {
+                var positions = new int[count];
+                Array.Fill(positions, -1);
+                var occurrences = new Dictionary<DateTime, int>();
+                for (var i = 0; i < _count; i++)
+                {
+                    var time = Times[i];
+                    occurrences.TryGetValue(time, out var occurrence);
+                    occurrences[time] = occurrence + 1;
+                    positions[timeIndexes[time] + occurrence] = i;
+                }
+
+                var aligned = new Serie(withTimeIndex: false);
+                for (var i = 0; i < positions.Length; i++)
+                {
+                    aligned.Add(default, positions[i] >= 0 ? GetValue(positions[i]) : null, false);
+                }
+                return aligned;
+            }
+
+            private void SetValue(int index, object value)
+            {
+                if (_type == SerieType.Unknown)
+                {
+                    if (value == null)
+                    {
+                        // nothing to store yet, the type will be determined by the first non null value
+                        return;
+                    }
+                    InitializeStorage(value);
+                }
+
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        if (value == null)
+                        {
+                            _doubles[index] = double.NaN;
+                            return;
+                        }
+                        if (value is double doubleValue)
+                        {
+                            _doubles[index] = doubleValue;
+                            return;
+                        }
+                        break;
+                    case SerieType.Long:
+                        if (value is long longValue)
+                        {
+                            _longs[index] = longValue;
+                            return;
+                        }
+                        if (value is int intValue)
+                        {
+                            _longs[index] = intValue;
+                            return;
+                        }
+                        break;
+                    case SerieType.DateTime:
+                        if (value == null)
+                        {
+                            _longs[index] = NaT;
+                            return;
+                        }
+                        if (value is DateTime dateTime && IsDateTime64(dateTime))
+                        {
+                            _longs[index] = ToDateTime64(dateTime);
+                            return;
+                        }
+                        break;
+                    case SerieType.Bool:
+                        if (value is bool boolValue)
+                        {
+                            _bools[index] = boolValue ? (byte)1 : (byte)0;
+                            return;
+                        }
+                        break;
+                    case SerieType.Object:
+                        _objects[index] = value;
+                        return;
+                }
+
+                // the value doesn't match the current storage type, fallback to boxed values
+                ConvertToObjectStorage();
+                _objects[index] = value;
+            }
+
+            /// <summary>
+            /// Picks the storage type based on the first non null value added
+            /// </summary>
+            private void InitializeStorage(object value)
+            {
+                // the values added so far are all null
+                var hasNulls = _count > 1;
+                var capacity = Math.Max(InitialCapacity, _count);
+
+                if (value is double)
+                {
+                    _type = SerieType.Double;
+                    _doubles = new double[capacity];
+                    Array.Fill(_doubles, double.NaN, 0, _count);
+                }
+                else if (value is DateTime dateTime && IsDateTime64(dateTime))
+                {
+                    _type = SerieType.DateTime;
+                    _longs = new long[capacity];
+                    Array.Fill(_longs, NaT, 0, _count);
+                }
+                // pandas won't keep integer or boolean dtypes if there are missing values
+                else if (!hasNulls && (value is long || value is int))
+                {
+                    _type = SerieType.Long;
+                    _longs = new long[capacity];
+                }
+                else if (!hasNulls && value is bool)
+                {
+                    _type = SerieType.Bool;
+                    _bools = new byte[capacity];
+                }
+                else
+                {
+                    _type = SerieType.Object;
+                    _objects = new List<object>(capacity);
+                    for (var i = 0; i < _count; i++)
+                    {
+                        _objects.Add(null);
+                    }
+                }
+            }
+
+            private void ConvertToObjectStorage()
+            {
+                var objects = new List<object>(Math.Max(InitialCapacity, _count));
+                for (var i = 0; i < _count; i++)
+                {
+                    objects.Add(GetValue(i));
+                }
+
+                _type = SerieType.Object;
+                _objects = objects;
+                _doubles = null;
+                _longs = null;
+                _bools = null;
+            }
+
+            private void EnsureCapacity(int count)
+            {
+                switch (_type)
+                {
+                    case SerieType.Double:
+                        EnsureCapacity(ref _doubles, count);
+                        break;
+                    case SerieType.Long:
+                    case SerieType.DateTime:
+                        EnsureCapacity(ref _longs, count);
+                        break;
+                    case SerieType.Bool:
+                        EnsureCapacity(ref _bools, count);
+                        break;
+                    case SerieType.Object:
+                        while (_objects.Count < count)
+                        {
+                            _objects.Add(null);
+                        }
+                        break;
+                }
+            }
+
+            private static void EnsureCapacity<T>(ref T[] buffer, int count)
+            {
+                if (buffer.Length < count)
+                {
+                    Array.Resize(ref buffer, Math.Max(count, buffer.Length * 2));
+                }
+            }
+        }
+    }
+}
@@ -0,0 +1,69 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Python.Runtime;
+using QuantConnect.Util;
+using System;
+using System.Collections.Generic;
+
+namespace QuantConnect.Python
+{
+    public partial class PandasData
+    {
+        /// <summary>
+        /// Cache of factorized time index levels, as (codes, uniques) Python tuples, keyed by the times they were created from.
+        /// It can be shared by all the <see cref="PandasData"/> instances of a data frame so that symbols with the same
+        /// timestamps, like the contracts of an option chain, create their time level once
+        /// </summary>
+        internal class TimeLevelCache : IDisposable
+        {
+            private readonly Dictionary<IReadOnlyCollection<DateTime>, PyObject> _timeLevels = new(new ListComparer<DateTime>());
+
+            /// <summary>
+            /// Gets the factorized time level for the given times, creating it if not cached yet
+            /// </summary>
+            /// <remarks>Requires the GIL to be held</remarks>
+            public PyObject Get(List<DateTime> times)
+            {
+                if (!_timeLevels.TryGetValue(times, out var timeLevel))
+                {
+                    using var pyTimes = ToPythonTimes(times);
+                    timeLevel = _factorize.Invoke(pyTimes);
+                    _timeLevels[times] = timeLevel;
+                }
+
+                return timeLevel;
+            }
+
+            /// <summary>
+            /// Disposes of the cached time levels
+            /// </summary>
+            public void Dispose()
+            {
+                if (_timeLevels.Count == 0)
+                {
+                    return;
+                }
+
+                using var _ = Py.GIL();
+                foreach (var timeLevel in _timeLevels.Values)
+                {
+                    timeLevel.Dispose();
+                }
+                _timeLevels.Clear();
+            }
+        }
+    }
+}
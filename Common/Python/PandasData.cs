@@ -21,9 +21,9 @@ using QuantConnect.Util;
 using System;
 using System.Collections;
 using System.Collections.Generic;
-using System.Globalization;
 using System.Linq;
 using System.Reflection;
+using System.Runtime.InteropServices;
 
 namespace QuantConnect.Python
 {
@@ -41,6 +41,14 @@ namespace QuantConnect.Python
         private static PyObject _multiIndexFactory;
         private static PyObject _multiIndex;
         private static PyObject _indexFactory;
+        private static PyObject _arrayFromAddress;
+        private static PyObject _indexFromLevels;
+        private static PyObject _factorize;
+
+        private static PyString _float64;
+        private static PyString _int64;
+        private static PyString _datetime64;
+        private static PyString _bool;
 
         private static PyList _defaultNames;
         private static PyList _level1Names;
@@ -65,6 +73,13 @@ namespace QuantConnect.Python
         private static readonly Type PandasIgnoreAttribute = typeof(PandasIgnoreAttribute);
         private static readonly Type PandasIgnoreMembersAttribute = typeof(PandasIgnoreMembersAttribute);
 
+        // numpy datetime64[ns] supported range, pandas falls back to object for values outside of it
+        private static readonly DateTime MinDateTime64 = new DateTime(1677, 9, 22);
+        private static readonly DateTime MaxDateTime64 = new DateTime(2262, 4, 11);
+        private static readonly long EpochTicks = new DateTime(1970, 1, 1).Ticks;
+        // numpy NaT representation
+        private const long NaT = long.MinValue;
+
         private static readonly IReadOnlyCollection<DateTime> EmptySeriesTimesKey = new List<DateTime>();
         private static readonly List<DataTypeMember> EmptyDataTypeMembers = new List<DataTypeMember>();
 
@@ -101,8 +116,16 @@ namespace QuantConnect.Python
                 _multiIndex = _pandas.GetAttr("MultiIndex");
                 _multiIndexFactory = _multiIndex.GetAttr("from_tuples");
                 _indexFactory = _pandas.GetAttr("Index");
+                _arrayFromAddress = _pandas.GetAttr("array_from_address");
+                _indexFromLevels = _pandas.GetAttr("index_from_levels");
+                _factorize = _pandas.GetAttr("factorize");
                 _empty = new PyString(string.Empty);
 
+                _float64 = new PyString("float64");
+                _int64 = new PyString("int64");
+                _datetime64 = new PyString("datetime64[ns]");
+                _bool = new PyString("bool");
+
                 var time = new PyString("time");
                 var symbol = new PyString("symbol");
                 var expiry = new PyString("expiry");
@@ -262,6 +285,20 @@ namespace QuantConnect.Python
         /// <param name="filterMissingValueColumns">If false, make sure columns with "missing" values only are still added to the dataframe</param>
         /// <returns>pandas.DataFrame object</returns>
         public PyObject ToPandasDataFrame(int levels = 2, bool filterMissingValueColumns = true)
+        {
+            using var _ = Py.GIL();
+            using var timeLevelCache = new TimeLevelCache();
+            return ToPandasDataFrame(levels, filterMissingValueColumns, timeLevelCache);
+        }
+
+        /// <summary>
+        /// Get the pandas.DataFrame of the current <see cref="PandasData"/> state
+        /// </summary>
+        /// <param name="levels">Number of levels of the multi index</param>
+        /// <param name="filterMissingValueColumns">If false, make sure columns with "missing" values only are still added to the dataframe</param>
+        /// <param name="timeLevelCache">The time levels cache, which can be shared between multiple <see cref="PandasData"/> instances</param>
+        /// <returns>pandas.DataFrame object</returns>
+        internal PyObject ToPandasDataFrame(int levels, bool filterMissingValueColumns, TimeLevelCache timeLevelCache)
         {
             using var _ = Py.GIL();
 
@@ -304,6 +341,10 @@ namespace QuantConnect.Python
 
             names = new PyList(names.SkipLast(names.Count() > 1 && _timeAsColumn ? 1 : 0).ToArray());
 
+            // the last level of the template is the time, unless it's a column, all other levels are constant for this symbol
+            var hasTimeLevel = !_timeAsColumn && indexTemplate.Length > 1;
+            using var constantLevels = new PyList(hasTimeLevel ? indexTemplate[..^1] : indexTemplate);
+
             // creating the pandas MultiIndex is expensive so we keep a cash
             var indexCache = new Dictionary<IReadOnlyCollection<DateTime>, PyObject>(new ListComparer<DateTime>());
             // Returns a dictionary keyed by column name where values are pandas.Series objects
@@ -315,43 +356,15 @@ namespace QuantConnect.Python
                 var key = serie.Times ?? EmptySeriesTimesKey;
                 if (!indexCache.TryGetValue(key, out var index))
                 {
-                    PyList indexSource;
-                    if (_timeAsColumn)
-                    {
-                        indexSource = serie.Values.Select(_ => CreateIndexSourceValue(DateTime.MinValue, indexTemplate)).ToPyListUnSafe();
-                    }
-                    else
-                    {
-                        indexSource = serie.Times.Select(time => CreateIndexSourceValue(time, indexTemplate)).ToPyListUnSafe();
-                    }
-
-                    if (indexTemplate.Length == 1)
-                    {
-                        using var nameDic = Py.kw("name", names[0]);
-                        index = _indexFactory.Invoke(new[] { indexSource }, nameDic);
-                    }
-                    else
-                    {
-                        using var namesDic = Py.kw("names", names);
-                        index = _multiIndexFactory.Invoke(new[] { indexSource }, namesDic);
-                    }
-
+                    // the index is built from the levels and codes instead of a list of tuples, the time level is shared
+                    using var count = serie.Count.ToPython();
+                    var timeLevel = hasTimeLevel ? timeLevelCache.Get(serie.Times) : PyObject.None;
+                    index = _indexFromLevels.Invoke(constantLevels, count, timeLevel, names);
                     indexCache[key] = index;
-
-                    foreach (var pyObject in indexSource)
-                    {
-                        pyObject.Dispose();
-                    }
-                    indexSource.Dispose();
                 }
 
                 // Adds pandas.Series value keyed by the column name
-                using var pyvalues = new PyList();
-                for (var i = 0; i < serie.Values.Count; i++)
-                {
-                    using var pyObject = serie.Values[i].ToPython();
-                    pyvalues.Append(pyObject);
-                }
+                using var pyvalues = serie.ToPython();
                 using var series = _seriesFactory.Invoke(pyvalues, index);
                 using var pyStrKey = seriesName.ToPython();
                 using var pyKey = _pandasColumn.Invoke(pyStrKey);
@@ -419,10 +432,10 @@ namespace QuantConnect.Python
                         value = valuesPerSeries[kvp.Key] = new PyList();
                     }
 
-                    if (kvp.Value.Values.Count > 0)
+                    if (kvp.Value.Count > 0)
                     {
                         // taking only 1 value per symbol
-                        using var valueOfSymbol = kvp.Value.Values[0].ToPython();
+                        using var valueOfSymbol = kvp.Value.GetValue(0).ToPython();
                         value.Append(valueOfSymbol);
                     }
                     else
@@ -456,6 +469,82 @@ namespace QuantConnect.Python
             return result;
         }
 
+        /// <summary>
+        /// Get the columns of the current <see cref="PandasData"/> state as numpy arrays keyed by column name, plus a 'time' column,
+        /// without creating a pandas.DataFrame. Columns with different times are aligned to the union of their times
+        /// </summary>
+        /// <param name="filterMissingValueColumns">If false, make sure columns with "missing" values only are still added</param>
+        /// <returns>Python dictionary of numpy arrays keyed by column name</returns>
+        public PyDict ToColumnarDictionary(bool filterMissingValueColumns = true)
+        {
+            using var _ = Py.GIL();
+
+            var series = _series.Where(x => !filterMissingValueColumns || !x.Value.ShouldFilter).ToList();
+
+            List<DateTime> times = null;
+            var aligned = true;
+            if (!_timeAsColumn)
+            {
+                foreach (var kvp in series)
+                {
+                    if (times == null)
+                    {
+                        times = kvp.Value.Times;
+                    }
+                    else if (!ReferenceEquals(times, kvp.Value.Times) && !times.SequenceEqual(kvp.Value.Times))
+                    {
+                        aligned = false;
+                        break;
+                    }
+                }
+            }
+
+            Dictionary<DateTime, int> timeIndexes = null;
+            if (!aligned)
+            {
+                // A time repeated in a serie, e.g. ticks sharing a timestamp, is kept as many times as the serie repeating it the most,
+                // so rows are aligned on their order within each time instead of collapsing into one
+                var timeCounts = new Dictionary<DateTime, int>();
+                foreach (var kvp in series)
+                {
+                    foreach (var group in kvp.Value.Times.GroupBy(time => time))
+                    {
+                        var count = group.Count();
+                        if (!timeCounts.TryGetValue(group.Key, out var maxCount) || count > maxCount)
+                        {
+                            timeCounts[group.Key] = count;
+                        }
+                    }
+                }
+
+                times = new List<DateTime>();
+                timeIndexes = new Dictionary<DateTime, int>(timeCounts.Count);
+                foreach (var kvp in timeCounts.OrderBy(kvp => kvp.Key))
+                {
+                    timeIndexes[kvp.Key] = times.Count;
+                    times.AddRange(Enumerable.Repeat(kvp.Key, kvp.Value));
+                }
+            }
+
+            var result = new PyDict();
+            foreach (var (seriesName, serie) in series)
+            {
+                using var pyValues = (aligned ? serie : serie.Align(times.Count, timeIndexes)).ToPython();
+                using var pyKey = seriesName.ToPython();
+                result.SetItem(pyKey, pyValues);
+            }
+
+            if (!_timeAsColumn)
+            {
+                using var pyTimes = ToPythonTimes(times ?? new List<DateTime>());
+                using var pyKey = "time".ToPython();
+                result.SetItem(pyKey, pyTimes);
+            }
+            _series.Clear();
+
+            return result;
+        }
+
         private List<DataTypeMember> GetInstanceDataTypeMembers(object data)
         {
             var type = data.GetType();
@@ -632,22 +721,84 @@ namespace QuantConnect.Python
         }
 
         /// <summary>
-        /// Create a new tuple index
+        /// Creates a numpy array of the given type copying the first <paramref name="count"/> items of the buffer
         /// </summary>
-        private PyObject CreateIndexSourceValue(DateTime index, PyObject[] list)
+        private static PyObject ToNumpyArray<T>(T[] buffer, int count, PyObject dtype)
+            where T : struct
         {
-            if (!_timeAsColumn && list.Length > 1)
+            var handle = GCHandle.Alloc(buffer, GCHandleType.Pinned);
+            try
+            {
+                using var address = handle.AddrOfPinnedObject().ToInt64().ToPython();
+                using var pyCount = count.ToPython();
+                return _arrayFromAddress.Invoke(address, pyCount, dtype);
+            }
+            finally
             {
-                DisposeIfNotEmpty(list[^1]);
-                list[^1] = index.ToPython();
+                handle.Free();
             }
+        }
 
-            if (list.Length > 1)
+        /// <summary>
+        /// Copies the values into a new numpy float64 array
+        /// </summary>
+        /// <remarks>Requires the GIL to be held</remarks>
+        public static PyObject ToNumpyArray(double[] values)
+        {
+            return ToNumpyArray(values, values.Length, _float64);
+        }
+
+        /// <summary>
+        /// Converts the times into a numpy datetime64[ns] array, or a list if any is out of the supported range
+        /// </summary>
+        /// <remarks>Requires the GIL to be held</remarks>
+        public static PyObject ToNumpyArray(List<DateTime> times)
+        {
+            return ToPythonTimes(times);
+        }
+
+        /// <summary>
+        /// Converts the times into a numpy datetime64[ns] array, or a list if any is out of the supported range
+        /// </summary>
+        private static PyObject ToPythonTimes(List<DateTime> times)
+        {
+            var nanoseconds = new long[times.Count];
+            for (var i = 0; i < nanoseconds.Length; i++)
             {
-                return new PyTuple(list.ToArray());
+                var time = times[i];
+                if (!IsDateTime64(time))
+                {
+                    // let pandas/numpy handle them as objects
+                    return times.ToPyListUnSafe();
+                }
+                nanoseconds[i] = ToDateTime64(time);
             }
 
-            return list[0].ToPython();
+            return ToNumpyArray(nanoseconds, nanoseconds.Length, _datetime64);
+        }
+
+        /// <summary>
+        /// Whether the date time can be represented as a numpy datetime64[ns]
+        /// </summary>
+        private static bool IsDateTime64(DateTime dateTime)
+        {
+            return dateTime > MinDateTime64 && dateTime < MaxDateTime64;
+        }
+
+        /// <summary>
+        /// Converts a date time into its numpy datetime64[ns] representation
+        /// </summary>
+        private static long ToDateTime64(DateTime dateTime)
+        {
+            return (dateTime.Ticks - EpochTicks) * 100;
+        }
+
+        /// <summary>
+        /// Converts a numpy datetime64[ns] representation into a date time
+        /// </summary>
+        private static DateTime FromDateTime64(long nanoseconds)
+        {
+            return new DateTime(EpochTicks + nanoseconds / 100);
         }
 
         /// <summary>
@@ -666,80 +817,6 @@ namespace QuantConnect.Python
             serie.Add(time, input, overrideValues);
         }
 
-        private class Serie
-        {
-            private static readonly IFormatProvider InvariantCulture = CultureInfo.InvariantCulture;
-
-            public bool ShouldFilter { get; private set; }
-            public List<DateTime> Times { get; }
-            public List<object> Values { get; }
-
-            public Serie(bool withTimeIndex = true)
-            {
-                ShouldFilter = true;
-                Values = new();
-                if (withTimeIndex)
-                {
-                    Times = new();
-                }
-            }
-
-            public void Add(DateTime time, object input, bool overrideValues)
-            {
-                var value = input is decimal ? Convert.ToDouble(input, InvariantCulture) : input;
-                if (ShouldFilter)
-                {
-                    // we need at least 1 valid entry for the series not to get filtered
-                    if (value is double doubleValue)
-                    {
-                        if (!doubleValue.IsNaNOrZero())
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value is string stringValue)
-                    {
-                        if (!string.IsNullOrWhiteSpace(stringValue))
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value is bool boolValue)
-                    {
-                        if (boolValue)
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                    else if (value != null)
-                    {
-                        if (value is ICollection enumerable)
-                        {
-                            if (enumerable.Count != 0)
-                            {
-                                ShouldFilter = false;
-                            }
-                        }
-                        else
-                        {
-                            ShouldFilter = false;
-                        }
-                    }
-                }
-
-                if (overrideValues && Times != null && Times.Count > 0 && Times[^1] == time)
-                {
-                    // If the time is the same as the last one, we overwrite the value
-                    Values[^1] = value;
-                }
-                else
-                {
-                    Values.Add(value);
-                    Times?.Add(time);
-                }
-            }
-        }
-
         private class FixedTimeProvider : ITimeProvider
         {
             private readonly DateTime _time;
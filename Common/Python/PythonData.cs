@@ -17,6 +17,7 @@ using Python.Runtime;
 using QuantConnect.Data;
 using System;
 using System.Collections.Generic;
+using System.Linq;
 
 namespace QuantConnect.Python
 {
@@ -28,6 +29,7 @@ namespace QuantConnect.Python
     {
         private readonly string _pythonTypeName;
         private readonly dynamic _pythonReader;
+        private readonly dynamic _pythonReaderBatch;
         private readonly dynamic _pythonGetSource;
         private readonly dynamic _pythonData;
         private readonly dynamic _defaultResolution;
@@ -36,6 +38,8 @@ namespace QuantConnect.Python
         private readonly dynamic _requiresMapping;
         private DateTime _endTime;
 
+        private static readonly long EpochTicks = new DateTime(1970, 1, 1).Ticks;
+
         /// <summary>
         /// The end time of this data. Some data covers spans (trade bars)
         /// and as such we want to know the entire time span covered
@@ -84,6 +88,8 @@ namespace QuantConnect.Python
                 _defaultResolution = pythonData.GetMethod("DefaultResolution");
                 _supportedResolutions = pythonData.GetMethod("SupportedResolutions");
                 _pythonReader = pythonData.GetMethod("Reader");
+                // optional, only available if defined in Python
+                _pythonReaderBatch = pythonData.GetPythonMethodWithChecks("reader_batch");
                 _pythonGetSource = pythonData.GetMethod("GetSource");
                 _pythonTypeName = pythonData.GetPythonType().GetAssemblyName().Name;
             }
@@ -126,6 +132,170 @@ namespace QuantConnect.Python
             }
         }
 
+        /// <summary>
+        /// True if the Python type defines a <see cref="ReaderBatch"/> implementation, reading many lines per call
+        /// </summary>
+        public bool ImplementsReaderBatch => _pythonReaderBatch != null;
+
+        /// <summary>
+        /// Batch Reader Implementation for Python Custom Data, parses many lines of the source with a single call into Python.
+        /// The Python method can return either a list of data instances or a dictionary of columns, like numpy arrays,
+        /// holding a 'time' column and optionally 'end_time', 'value' and any other property
+        /// </summary>
+        /// <param name="config">Subscription configuration</param>
+        /// <param name="lines">CSV lines of data from the source</param>
+        /// <param name="date">Date of the requested lines</param>
+        /// <param name="isLiveMode">true if we're in live mode, false for backtesting mode</param>
+        /// <returns>The data instances read from the given lines</returns>
+        public List<BaseData> ReaderBatch(SubscriptionDataConfig config, List<string> lines, DateTime date, bool isLiveMode)
+        {
+            if (_pythonReaderBatch == null)
+            {
+                throw new NotImplementedException($"{_pythonTypeName} does not implement 'reader_batch'");
+            }
+
+            using (Py.GIL())
+            {
+                using var pyLines = lines.ToPyListUnSafe();
+                using PyObject data = _pythonReaderBatch(config, pyLines, date, isLiveMode);
+                if (data.IsNone())
+                {
+                    return new List<BaseData>();
+                }
+                return PyDict.IsDictType(data) ? FromColumns(config, data) : FromInstances(data);
+            }
+        }
+
+        /// <summary>
+        /// Gets the data instances from an iterable of Python data objects
+        /// </summary>
+        private List<BaseData> FromInstances(PyObject data)
+        {
+            var result = new List<BaseData>();
+            foreach (PyObject item in data)
+            {
+                using (item)
+                {
+                    if (item.IsNone())
+                    {
+                        continue;
+                    }
+
+                    var instance = item.As<BaseData>();
+                    (instance as PythonData)?.SetProperty("__typename", _pythonTypeName);
+                    result.Add(instance);
+                }
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Creates the data instances from a dictionary of columns, one instance of the Python type per row,
+        /// so they are the same type <see cref="FromInstances"/> and <see cref="Reader"/> return
+        /// </summary>
+        private List<BaseData> FromColumns(SubscriptionDataConfig config, PyObject data)
+        {
+            using var columns = new PyDict(data);
+            using var numpy = Py.Import("numpy");
+            using var keys = columns.Keys();
+
+            var names = new List<string>();
+            var values = new List<object[]>();
+            foreach (PyObject key in keys)
+            {
+                using (key)
+                {
+                    using var column = columns.GetItem(key);
+                    names.Add(key.ToString());
+                    values.Add(ToManagedValues(numpy, column));
+                }
+            }
+
+            if (!names.Contains("time", StringComparer.OrdinalIgnoreCase))
+            {
+                throw new ArgumentException($"{_pythonTypeName}.reader_batch(): the returned columns require a 'time' column. Columns: {string.Join(", ", names)}");
+            }
+
+            var count = values[0].Length;
+            if (values.Any(x => x.Length != count))
+            {
+                throw new ArgumentException($"{_pythonTypeName}.reader_batch(): all the returned columns should have the same length");
+            }
+
+            using var pythonType = ((PyObject)_pythonData).GetPythonType();
+            var result = new List<BaseData>(count);
+            for (var i = 0; i < count; i++)
+            {
+                var instance = pythonType.Invoke().GetAndDispose<PythonData>();
+                instance.Symbol = config.Symbol;
+                for (var j = 0; j < names.Count; j++)
+                {
+                    var value = values[j][i];
+                    if (value != null)
+                    {
+                        instance[names[j]] = value;
+                    }
+                }
+                instance.SetProperty("__typename", _pythonTypeName);
+                result.Add(instance);
+            }
+            return result;
+        }
+
+        /// <summary>
+        /// Converts a column of values into managed values: numbers to decimal, datetimes to <see cref="DateTime"/>.
+        /// Missing values, NaN and NaT, are converted to null. Integers are converted without going through double
+        /// so they keep their precision
+        /// </summary>
+        private static object[] ToManagedValues(dynamic numpy, PyObject column)
+        {
+            using PyObject array = numpy.asarray(column);
+            using PyObject dtype = array.GetAttr("dtype");
+            using PyObject pyKind = dtype.GetAttr("kind");
+            var kind = pyKind.As<string>();
+
+            if (kind == "M")
+            {
+                using PyObject nanoseconds = numpy.asarray(array, "datetime64[ns]").view("int64").tolist();
+                return nanoseconds.As<long[]>()
+                    .Select(x => x == long.MinValue ? null : (object)new DateTime(EpochTicks + x / 100))
+                    .ToArray();
+            }
+
+            using PyObject list = array.InvokeMethod("tolist");
+            if (kind == "f")
+            {
+                return list.As<double[]>()
+                    .Select(x => double.IsNaN(x) ? null : (object)x.SafeDecimalCast())
+                    .ToArray();
+            }
+            if (kind == "i")
+            {
+                return list.As<long[]>().Select(x => (object)(decimal)x).ToArray();
+            }
+            if (kind == "u")
+            {
+                return list.As<ulong[]>().Select(x => (object)(decimal)x).ToArray();
+            }
+            if (kind == "b")
+            {
+                return list.As<bool[]>().Select(x => (object)x).ToArray();
+            }
+
+            var result = new object[list.Length()];
+            var index = 0;
+            foreach (PyObject item in list)
+            {
+                var value = item.IsNone() ? null : item.AsManagedObject(typeof(object));
+                if (!ReferenceEquals(value, item))
+                {
+                    item.Dispose();
+                }
+                result[index++] = value;
+            }
+            return result;
+        }
+
         /// <summary>
         /// Indicates if there is support for mapping
         /// </summary>
@@ -0,0 +1,144 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using System.Threading;
+using System.Diagnostics;
+using System.Collections.Generic;
+using System.Collections.Concurrent;
+
+namespace QuantConnect.Python
+{
+    /// <summary>
+    /// Keeps track of the calls to, and the time spent in, the Python methods invoked through the Python model wrappers
+    /// of the running algorithm. Disabled by default, enabled per algorithm with the 'python-method-statistics' configuration
+    /// </summary>
+    public class PythonMethodStatistics
+    {
+        private readonly ConcurrentDictionary<string, Counter> _counters = new();
+
+        /// <summary>
+        /// The statistics of the running algorithm, null if they are not enabled
+        /// </summary>
+        public static PythonMethodStatistics Current { get; private set; }
+
+        /// <summary>
+        /// Starts collecting the statistics of a new algorithm, discarding the ones of any previous algorithm.
+        /// Only the wrapper methods resolved after this call are tracked
+        /// </summary>
+        /// <returns>The new statistics</returns>
+        public static PythonMethodStatistics Start()
+        {
+            return Current = new PythonMethodStatistics();
+        }
+
+        /// <summary>
+        /// Stops collecting statistics
+        /// </summary>
+        public static void Stop()
+        {
+            Current = null;
+        }
+
+        /// <summary>
+        /// Gets the counter for the given method, creating it if needed
+        /// </summary>
+        /// <param name="name">The name of the method, including its type name</param>
+        public Counter GetCounter(string name)
+        {
+            return _counters.GetOrAdd(name, static key => new Counter(key));
+        }
+
+        /// <summary>
+        /// Gets the counters of the methods that have been called at least once, sorted by elapsed time
+        /// </summary>
+        public List<Counter> GetCounters()
+        {
+            return _counters.Values.Where(x => x.Calls > 0).OrderByDescending(x => x.Elapsed).ToList();
+        }
+
+        /// <summary>
+        /// Gets a summary of the counters, one line per method, sorted by elapsed time
+        /// </summary>
+        /// <param name="count">The maximum number of methods to include</param>
+        public string GetSummary(int count = 10)
+        {
+            return string.Join(Environment.NewLine, GetCounters().Take(count));
+        }
+
+        /// <summary>
+        /// Calls and elapsed time counter of a single Python method
+        /// </summary>
+        public class Counter
+        {
+            private long _calls;
+            private long _elapsedTicks;
+
+            /// <summary>
+            /// The name of the method, including its type name
+            /// </summary>
+            public string Name { get; }
+
+            /// <summary>
+            /// The number of calls to the method
+            /// </summary>
+            public long Calls => Interlocked.Read(ref _calls);
+
+            /// <summary>
+            /// The total time spent in the method calls
+            /// </summary>
+            public TimeSpan Elapsed => TimeSpan.FromSeconds((double)Interlocked.Read(ref _elapsedTicks) / Stopwatch.Frequency);
+
+            /// <summary>
+            /// Creates a new instance
+            /// </summary>
+            /// <param name="name">The name of the method, including its type name</param>
+            public Counter(string name)
+            {
+                Name = name;
+            }
+
+            /// <summary>
+            /// Records a call to the method
+            /// </summary>
+            /// <param name="startTimestamp">The <see cref="Stopwatch.GetTimestamp"/> value when the call started</param>
+            public void Record(long startTimestamp)
+            {
+                RecordElapsed(Stopwatch.GetTimestamp() - startTimestamp);
+            }
+
+            /// <summary>
+            /// Records a call to the method
+            /// </summary>
+            /// <param name="elapsedTimestamp">The time spent in the call, in <see cref="Stopwatch"/> ticks</param>
+            public void RecordElapsed(long elapsedTimestamp)
+            {
+                Interlocked.Increment(ref _calls);
+                Interlocked.Add(ref _elapsedTicks, elapsedTimestamp);
+            }
+
+            /// <summary>
+            /// Returns a string that represents the current object
+            /// </summary>
+            public override string ToString()
+            {
+                var elapsed = Elapsed;
+                var perCall = elapsed.TotalMilliseconds * 1000 / Math.Max(1, Calls);
+                return $"{Name}: {Calls} calls, {elapsed.TotalMilliseconds.ToStringInvariant("F1")} ms, {perCall.ToStringInvariant("F1")} us per call";
+            }
+        }
+    }
+}
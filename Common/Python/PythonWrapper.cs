@@ -130,7 +130,26 @@ namespace QuantConnect.Python
         private static PyObject InvokeMethodImpl(PyObject method, params object[] args)
         {
             using var _ = Py.GIL();
-            return method.Invoke(args.Select(arg => arg.ToPython()).ToArray());
+            var pyArgs = new PyObject[args.Length];
+            try
+            {
+                for (var i = 0; i < args.Length; i++)
+                {
+                    pyArgs[i] = args[i].ToPython();
+                }
+                return method.Invoke(pyArgs);
+            }
+            finally
+            {
+                // the arguments tuple holds its own references, release ours right away instead of waiting for the finalizer
+                for (var i = 0; i < pyArgs.Length; i++)
+                {
+                    if (args[i] != null)
+                    {
+                        pyArgs[i]?.Dispose();
+                    }
+                }
+            }
         }
     }
 }
@@ -31,6 +31,7 @@ namespace QuantConnect.Securities
     public class UniverseManager : BaseExtendedDictionary<Symbol, Universe, ConcurrentDictionary<Symbol, Universe>>
     {
         private readonly Queue<UniverseManagerChanged> _pendingChanges = new();
+        private readonly Dictionary<Symbol, HashSet<Universe>> _universesByMember = new();
 
         /// <summary>
         /// Event fired when a universe is added or removed
@@ -60,6 +61,10 @@ namespace QuantConnect.Securities
         {
             if (Dictionary.TryAdd(key, value))
             {
+                foreach (var member in value.Securities.Keys)
+                {
+                    UpdateMembership(value, member);
+                }
                 lock (_pendingChanges)
                 {
                     _pendingChanges.Enqueue(new UniverseManagerChanged(NotifyCollectionChangedAction.Add, value));
@@ -109,6 +114,13 @@ namespace QuantConnect.Securities
         {
             if (Dictionary.TryRemove(key, out var universe))
             {
+                lock (_universesByMember)
+                {
+                    foreach (var member in universe.Securities.Keys)
+                    {
+                        RemoveMembership(universe, member);
+                    }
+                }
                 universe.Dispose();
                 OnCollectionChanged(new UniverseManagerChanged(NotifyCollectionChangedAction.Remove, universe));
                 return true;
@@ -116,6 +128,69 @@ namespace QuantConnect.Securities
             return false;
         }
 
+        /// <summary>
+        /// Removes all the universes
+        /// </summary>
+        public override void Clear()
+        {
+            base.Clear();
+            lock (_universesByMember)
+            {
+                _universesByMember.Clear();
+            }
+        }
+
+        /// <summary>
+        /// Determines whether the symbol is currently a member of any universe
+        /// </summary>
+        /// <param name="symbol">The symbol whose membership is to be checked</param>
+        /// <returns>True if the symbol is a member of at least one universe, false otherwise</returns>
+        public bool ContainsMember(Symbol symbol)
+        {
+            lock (_universesByMember)
+            {
+                return _universesByMember.ContainsKey(symbol);
+            }
+        }
+
+        /// <summary>
+        /// Gets the universes the symbol is currently a member of
+        /// </summary>
+        /// <param name="symbol">The symbol whose universes are requested</param>
+        /// <returns>The universes the symbol is a member of, empty if it is not a member of any universe</returns>
+        public List<Universe> GetMemberUniverses(Symbol symbol)
+        {
+            lock (_universesByMember)
+            {
+                return _universesByMember.TryGetValue(symbol, out var universes) ? universes.ToList() : new List<Universe>();
+            }
+        }
+
+        /// <summary>
+        /// Updates the membership index after the members of the universe changed,
+        /// it should be called after adding or removing the symbol from the universe
+        /// </summary>
+        /// <param name="universe">The universe whose members changed</param>
+        /// <param name="symbol">The added or removed symbol</param>
+        internal void UpdateMembership(Universe universe, Symbol symbol)
+        {
+            lock (_universesByMember)
+            {
+                if (!universe.ContainsMember(symbol))
+                {
+                    RemoveMembership(universe, symbol);
+                }
+                else if (_universesByMember.TryGetValue(symbol, out var universes))
+                {
+                    universes.Add(universe);
+                }
+                else
+                {
+                    _universesByMember[symbol] = new HashSet<Universe> { universe };
+                }
+            }
+        }
+
         /// <summary>
         /// Gets or sets the element with the specified key
         /// </summary>
@@ -145,6 +220,14 @@ namespace QuantConnect.Securities
             }
         }
 
+        private void RemoveMembership(Universe universe, Symbol symbol)
+        {
+            if (_universesByMember.TryGetValue(symbol, out var universes) && universes.Remove(universe) && universes.Count == 0)
+            {
+                _universesByMember.Remove(symbol);
+            }
+        }
+
         /// <summary>
         /// Event invocator for the <see cref="CollectionChanged"/> event
         /// </summary>
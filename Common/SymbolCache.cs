@@ -18,6 +18,8 @@ using System;
 using System.Linq;
 using System.Collections.Generic;
 using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using System.Threading;
 
 namespace QuantConnect
 {
@@ -32,6 +34,20 @@ namespace QuantConnect
         private static readonly Dictionary<string, Symbol> Symbols = new(StringComparer.OrdinalIgnoreCase);
         private static readonly Dictionary<Symbol, string> Tickers = new();
 
+        // incremented each time a mapping is added or removed, pinned so its address can be shared with Python
+        private static readonly long[] Generation = new long[1];
+        private static readonly GCHandle GenerationHandle = GCHandle.Alloc(Generation, GCHandleType.Pinned);
+
+        /// <summary>
+        /// Gets the memory address of the cache generation counter, which is incremented each time a mapping is added or removed.
+        /// This allows Python to keep its own copy of the resolved tickers and invalidate it without calling into .NET
+        /// </summary>
+        /// <returns>The address of the 64 bits generation counter</returns>
+        public static long GetGenerationAddress()
+        {
+            return GenerationHandle.AddrOfPinnedObject().ToInt64();
+        }
+
         /// <summary>
         /// Adds a mapping for the specified ticker
         /// </summary>
@@ -43,6 +59,7 @@ namespace QuantConnect
             {
                 Symbols[ticker] = symbol;
                 Tickers[symbol] = ticker;
+                Interlocked.Increment(ref Generation[0]);
 
                 var index = ticker.IndexOf('.');
                 if (index != -1)
@@ -121,7 +138,9 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
-                return Tickers.Remove(symbol, out var ticker) && Symbols.Remove(ticker, out symbol);
+                var removed = Tickers.Remove(symbol, out var ticker) && Symbols.Remove(ticker, out symbol);
+                Interlocked.Increment(ref Generation[0]);
+                return removed;
             }
         }
 
@@ -135,7 +154,9 @@ namespace QuantConnect
         {
             lock (Symbols)
             {
-                return Symbols.Remove(ticker, out var symbol) && Tickers.Remove(symbol, out ticker);
+                var removed = Symbols.Remove(ticker, out var symbol) && Tickers.Remove(symbol, out ticker);
+                Interlocked.Increment(ref Generation[0]);
+                return removed;
             }
         }
 
@@ -149,6 +170,7 @@ namespace QuantConnect
             {
                 Symbols.Clear();
                 Tickers.Clear();
+                Interlocked.Increment(ref Generation[0]);
             }
         }
 
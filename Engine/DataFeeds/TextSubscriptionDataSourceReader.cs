@@ -16,6 +16,7 @@
 using System;
 using System.Linq;
 using QuantConnect.Data;
+using QuantConnect.Python;
 using QuantConnect.Logging;
 using QuantConnect.Interfaces;
 using System.Collections.Generic;
@@ -36,6 +37,8 @@ namespace QuantConnect.Lean.Engine.DataFeeds
         private BaseData _factory;
         private bool _shouldCacheDataPoints;
 
+        private const int ReaderBatchSize = 10000;
+
         private static int CacheSize = 100;
         private static volatile Dictionary<string, List<BaseData>> BaseDataSourceCache = new Dictionary<string, List<BaseData>>(100);
         private static Queue<string> CacheKeys = new Queue<string>(100);
@@ -108,6 +111,23 @@ namespace QuantConnect.Lean.Engine.DataFeeds
                         // only create a factory if the stream isn't null
                         _factory = Config.GetBaseDataInstance();
                     }
+
+                    if (_factory is PythonData pythonFactory && pythonFactory.ImplementsReaderBatch && !reader.ShouldBeRateLimited)
+                    {
+                        // let python custom data parse the source in batches, one call into Python per batch instead of per line
+                        foreach (var instance in ReadBatches(reader, pythonFactory))
+                        {
+                            if (_shouldCacheDataPoints)
+                            {
+                                cache.Add(instance);
+                            }
+                            else
+                            {
+                                yield return instance;
+                            }
+                        }
+                    }
+
                     // while the reader has data
                     while (!reader.EndOfStream)
                     {
@@ -196,6 +216,73 @@ namespace QuantConnect.Lean.Engine.DataFeeds
             }
         }
 
+        /// <summary>
+        /// Reads the lines of the given reader in batches using <see cref="PythonData.ReaderBatch"/>.
+        /// If a batch fails, its lines are read one by one so only the lines that fail are dropped
+        /// </summary>
+        /// <param name="reader">The stream reader of the source</param>
+        /// <param name="factory">The python data factory instance</param>
+        /// <returns>The data read that has an end time</returns>
+        private IEnumerable<BaseData> ReadBatches(IStreamReader reader, PythonData factory)
+        {
+            var lines = new List<string>(ReaderBatchSize);
+            while (!reader.EndOfStream)
+            {
+                lines.Clear();
+                while (lines.Count < ReaderBatchSize && !reader.EndOfStream)
+                {
+                    lines.Add(reader.ReadLine());
+                }
+
+                List<BaseData> batch = null;
+                try
+                {
+                    batch = factory.ReaderBatch(Config, lines, _date, IsLiveMode);
+                }
+                catch (Exception err)
+                {
+                    Log.Debug($"TextSubscriptionDataSourceReader.ReadBatches(): Reading the batch line by line: {err.Message}");
+                    batch = ReadLines(lines, factory);
+                }
+
+                if (batch == null)
+                {
+                    continue;
+                }
+
+                foreach (var instance in batch)
+                {
+                    if (instance != null && instance.EndTime != default)
+                    {
+                        yield return instance;
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// Reads the given lines one by one, reporting the lines that fail through <see cref="ReaderError"/>
+        /// </summary>
+        /// <param name="lines">The lines of the batch that failed</param>
+        /// <param name="factory">The python data factory instance</param>
+        /// <returns>The data read from the lines that didn't fail</returns>
+        private List<BaseData> ReadLines(List<string> lines, PythonData factory)
+        {
+            var data = new List<BaseData>(lines.Count);
+            foreach (var line in lines)
+            {
+                try
+                {
+                    data.Add(factory.Reader(Config, line, _date, IsLiveMode));
+                }
+                catch (Exception err)
+                {
+                    OnReaderError(line, err);
+                }
+            }
+            return data;
+        }
+
         /// <summary>
         /// Event invocator for the <see cref="ReaderError"/> event
         /// </summary>
@@ -291,6 +291,7 @@ namespace QuantConnect.Lean.Engine.DataFeeds
                 if (addedSubscription)
                 {
                     var addedMember = universe.AddMember(dateTimeUtc, security, internalFeed);
+                    _algorithm.UniverseManager.UpdateMembership(universe, security.Symbol);
 
                     if (addedMember && dataFeedAdded)
                     {
@@ -489,8 +490,9 @@ namespace QuantConnect.Lean.Engine.DataFeeds
 
                 // safe to remove the member from the universe
                 universe.RemoveMember(dateTimeUtc, member);
+                _algorithm.UniverseManager.UpdateMembership(universe, member.Symbol);
 
-                var isActive = _algorithm.UniverseManager.ActiveSecurities.ContainsKey(member.Symbol);
+                var isActive = _algorithm.UniverseManager.ContainsMember(member.Symbol);
                 foreach (var subscription in universe.GetSubscriptionRequests(member, dateTimeUtc, algorithmEndDateUtc,
                                                                               _algorithm.SubscriptionManager.SubscriptionDataConfigService))
                 {
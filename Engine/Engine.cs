@@ -34,6 +34,7 @@ using QuantConnect.Lean.Engine.Setup;
 using QuantConnect.Logging;
 using QuantConnect.Orders;
 using QuantConnect.Packets;
+using QuantConnect.Python;
 using QuantConnect.Securities;
 using QuantConnect.Util;
 using static QuantConnect.StringExtensions;
@@ -98,6 +99,11 @@ namespace QuantConnect.Lean.Engine
                 Log.Trace($"Engine.Run(): Resource limits '{job.Controls.CpuAllocation}' CPUs. {job.Controls.RamAllocation} MB RAM.");
                 TextSubscriptionDataSourceReader.SetCacheSize((int)(job.RamAllocation * 0.4));
 
+                if (Config.GetBool("python-method-statistics"))
+                {
+                    PythonMethodStatistics.Start();
+                }
+
                 //Reset thread holders.
                 var initializeComplete = false;
 
@@ -365,6 +371,12 @@ namespace QuantConnect.Lean.Engine
                             }
 
                             Log.Trace("Engine.Run(): Exiting Algorithm Manager");
+
+                            var pythonMethodStatistics = PythonMethodStatistics.Current?.GetSummary();
+                            if (!string.IsNullOrEmpty(pythonMethodStatistics))
+                            {
+                                Log.Trace($"Engine.Run(): Python model methods calls:{Environment.NewLine}{pythonMethodStatistics}");
+                            }
                         }, job.Controls.RamAllocation, workerThread: workerThread, sleepIntervalMillis: algorithm.LiveMode ? 10000 : 1000);
 
                         if (!complete)
@@ -472,6 +484,7 @@ namespace QuantConnect.Lean.Engine
                 AlgorithmHandlers.RealTime.Exit();
                 AlgorithmHandlers.DataMonitor.Exit();
                 (algorithm as AlgorithmPythonWrapper)?.DisposeSafely();
+                PythonMethodStatistics.Stop();
             }
         }
 
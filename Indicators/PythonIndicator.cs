@@ -17,6 +17,8 @@ using System;
 using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Python;
+using QuantConnect.Data.Market;
+using System.Collections.Generic;
 
 namespace QuantConnect.Indicators
 {
@@ -29,6 +31,9 @@ namespace QuantConnect.Indicators
         private PyObject _instance;
         private bool _isReady;
         private bool _pythonIsReadyProperty;
+        private bool _implementsUpdateBatch;
+        // the readiness of the batch value being published, the python state is only known after the last one
+        private bool? _batchValueIsReady;
         private BasePythonWrapper<IIndicator> _indicatorWrapper;
 
         /// <summary>
@@ -94,9 +99,21 @@ namespace QuantConnect.Indicators
                 }
             }
 
+            using (Py.GIL())
+            {
+                _implementsUpdateBatch = indicator.GetPythonMethodWithChecks("update_batch") != null;
+            }
+
             WarmUpPeriod = GetIndicatorWarmUpPeriod();
         }
 
+        /// <summary>
+        /// True if the python implementation defines 'update_batch(times, opens, highs, lows, closes, volumes)',
+        /// allowing it to be updated with many inputs in a single call
+        /// </summary>
+        [PandasIgnore]
+        public bool ImplementsUpdateBatch => _implementsUpdateBatch;
+
         /// <summary>
         /// Gets a flag indicating when this indicator is ready and fully initialized
         /// </summary>
@@ -104,6 +121,11 @@ namespace QuantConnect.Indicators
         {
             get
             {
+                if (_batchValueIsReady.HasValue)
+                {
+                    return _batchValueIsReady.Value;
+                }
+
                 if (_isReady)
                 {
                     return true;
@@ -140,6 +162,129 @@ namespace QuantConnect.Indicators
             return _indicatorWrapper.GetProperty<decimal>("Value");
         }
 
+        /// <summary>
+        /// Updates this indicator with the given inputs, in order, and returns true if this indicator is ready.
+        /// If the python implementation defines 'update_batch' it's called once with numpy arrays of the input times and prices,
+        /// else the indicator is updated with each input.
+        /// 'update_batch' can return the indicator value for each input, NaN while not ready, to produce the intermediate values:
+        /// the samples, current and previous values then advance, and the updated event is fired, once per input like with streaming updates.
+        /// While each value is published the indicator is ready, since it has a value, afterwards the readiness is read from the python state.
+        /// If it returns None only the final state, read from the indicator 'value', is published
+        /// </summary>
+        /// <param name="inputs">The values to use to update this indicator</param>
+        /// <param name="requireValues">True if each intermediate value is needed, like in the indicator history,
+        /// in which case 'update_batch' has to return a value per input</param>
+        /// <returns>True if this indicator is ready, false otherwise</returns>
+        public bool UpdateBatch(IReadOnlyList<IBaseData> inputs, bool requireValues = false)
+        {
+            if (!_implementsUpdateBatch)
+            {
+                foreach (var input in inputs)
+                {
+                    Update(input);
+                }
+                return IsReady;
+            }
+
+            if (inputs.Count == 0)
+            {
+                return IsReady;
+            }
+
+            var times = new List<DateTime>(inputs.Count);
+            var opens = new double[inputs.Count];
+            var highs = new double[inputs.Count];
+            var lows = new double[inputs.Count];
+            var closes = new double[inputs.Count];
+            var volumes = new double[inputs.Count];
+            for (var i = 0; i < inputs.Count; i++)
+            {
+                var input = inputs[i];
+                times.Add(input.EndTime);
+                if (input is IBaseDataBar bar)
+                {
+                    opens[i] = (double)bar.Open;
+                    highs[i] = (double)bar.High;
+                    lows[i] = (double)bar.Low;
+                    closes[i] = (double)bar.Close;
+                }
+                else
+                {
+                    opens[i] = highs[i] = lows[i] = closes[i] = (double)input.Value;
+                }
+                volumes[i] = input switch
+                {
+                    TradeBar tradeBar => (double)tradeBar.Volume,
+                    Tick tick => (double)tick.Quantity,
+                    _ => double.NaN
+                };
+            }
+
+            double[] values = null;
+            using (Py.GIL())
+            {
+                using var pyTimes = PandasData.ToNumpyArray(times);
+                using var pyOpens = PandasData.ToNumpyArray(opens);
+                using var pyHighs = PandasData.ToNumpyArray(highs);
+                using var pyLows = PandasData.ToNumpyArray(lows);
+                using var pyCloses = PandasData.ToNumpyArray(closes);
+                using var pyVolumes = PandasData.ToNumpyArray(volumes);
+                using var result = _indicatorWrapper.InvokeMethod("UpdateBatch", pyTimes, pyOpens, pyHighs, pyLows, pyCloses, pyVolumes);
+
+                if (!result.IsNone())
+                {
+                    values = BasePythonWrapper<IIndicator>.PythonRuntimeChecker.Convert<double[]>(result, "update_batch");
+                    if (values.Length != inputs.Count)
+                    {
+                        throw new ArgumentException($"{Name}.update_batch() returned {values.Length} values for {inputs.Count} inputs");
+                    }
+                }
+                else if (requireValues)
+                {
+                    throw new ArgumentException($"{Name}.update_batch() should return a value per input to produce the intermediate values");
+                }
+                else
+                {
+                    _isReady = _indicatorWrapper.GetProperty<bool>(nameof(IsReady));
+                    var value = _indicatorWrapper.GetProperty<decimal>("Value");
+
+                    Samples += inputs.Count;
+                    var last = inputs[^1];
+                    Current = new IndicatorDataPoint(last.Symbol, last.EndTime, value);
+                }
+            }
+
+            if (values == null)
+            {
+                OnUpdated(Current);
+                return IsReady;
+            }
+
+            try
+            {
+                for (var i = 0; i < values.Length; i++)
+                {
+                    Samples++;
+                    if (double.IsNaN(values[i]))
+                    {
+                        continue;
+                    }
+                    // the values are NaN while not ready, so the indicator is ready at each value,
+                    // not as per the python state, which is the one after the last input
+                    _batchValueIsReady = true;
+                    // without an 'is_ready' property, the indicator is ready once it produces a value
+                    _isReady = !_pythonIsReadyProperty;
+                    Current = new IndicatorDataPoint(inputs[i].Symbol, inputs[i].EndTime, values[i].SafeDecimalCast());
+                    OnUpdated(Current);
+                }
+            }
+            finally
+            {
+                _batchValueIsReady = null;
+            }
+            return IsReady;
+        }
+
         /// <summary>
         /// Get the indicator WarmUpPeriod parameter. If not defined, use 0
         /// </summary>
@@ -47,7 +47,7 @@ namespace QuantConnect.Report
         /// The order we just processed
         /// </summary>
         [JsonIgnore]
-        public Order Order { get; private set; }
+        public Order Order { get; internal set; }
 
         /// <summary>
         /// A list of holdings at the current moment in time
@@ -74,6 +74,19 @@ namespace QuantConnect.Report
             Leverage = Holdings.Sum(x => x.AbsoluteHoldingsValue) / TotalPortfolioValue;
         }
 
+        /// <summary>
+        /// Creates an instance of the PointInTimePortfolio object from its json representation
+        /// </summary>
+        [JsonConstructor]
+        private PointInTimePortfolio(DateTime time, decimal totalPortfolioValue, decimal cash, List<PointInTimeHolding> holdings, decimal leverage)
+        {
+            Time = time;
+            TotalPortfolioValue = totalPortfolioValue;
+            Cash = cash;
+            Holdings = holdings;
+            Leverage = leverage;
+        }
+
         /// <summary>
         /// Clones the provided portfolio
         /// </summary>
@@ -136,12 +149,12 @@ namespace QuantConnect.Report
             /// </summary>
             /// <param name="symbol">Symbol of the holding</param>
             /// <param name="holdingsValue">Value of the holding</param>
-            /// <param name="holdingsQuantity">Quantity of the holding</param>
-            public PointInTimeHolding(Symbol symbol, decimal holdingsValue, decimal holdingsQuantity)
+            /// <param name="quantity">Quantity of the holding</param>
+            public PointInTimeHolding(Symbol symbol, decimal holdingsValue, decimal quantity)
             {
                 Symbol = symbol;
                 HoldingsValue = holdingsValue;
-                Quantity = holdingsQuantity;
+                Quantity = quantity;
             }
         }
     }
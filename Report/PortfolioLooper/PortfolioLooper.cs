@@ -240,9 +240,11 @@ namespace QuantConnect.Report
         /// <param name="orders">Orders</param>
         /// <param name="algorithmConfiguration">Optional parameter to override default algorithm configuration</param>
         /// <param name="liveSeries">Equity curve series originates from LiveResult</param>
+        /// <param name="checkpointPath">Optional path of the checkpoint file. If it holds a checkpoint for the first orders,
+        /// processing resumes from it, and it is updated with the state after the last deployment processed</param>
         /// <returns>Enumerable of <see cref="PointInTimePortfolio"/></returns>
         public static IEnumerable<PointInTimePortfolio> FromOrders(Series<DateTime, double> equityCurve, IEnumerable<Order> orders,
-            AlgorithmConfiguration algorithmConfiguration = null, bool liveSeries = false)
+            AlgorithmConfiguration algorithmConfiguration = null, bool liveSeries = false, string checkpointPath = null)
         {
             // Don't do anything if we have no orders or equity curve to process
             if (!orders.Any() || equityCurve.IsEmpty)
@@ -250,6 +252,8 @@ namespace QuantConnect.Report
                 yield break;
             }
 
+            var allOrders = orders.ToList();
+
             // Chunk different deployments into separate Lists for separate processing
             var portfolioDeployments = new List<List<Order>>();
 
@@ -261,7 +265,7 @@ namespace QuantConnect.Report
             // Make use of reference semantics to add new deployments to the list
             portfolioDeployments.Add(currentDeployment);
 
-            foreach (var order in orders)
+            foreach (var order in allOrders)
             {
                 // In case we have two different deployments with only a single
                 // order in the deployments, <= was chosen because it covers duplicate values
@@ -275,15 +279,35 @@ namespace QuantConnect.Report
                 previousOrderId = order.Id;
             }
 
+            // The portfolios of the orders covered by the checkpoint don't need to be generated again
+            var checkpoint = PortfolioLooperCheckpoint.Read(checkpointPath, allOrders);
+            var resumedOrderCount = checkpoint?.OrderCount ?? 0;
+            var nextCheckpoint = checkpoint;
+
             PortfolioLooper looper = null;
             PointInTimePortfolio prev = null;
+            foreach (var entry in checkpoint?.Portfolios ?? Enumerable.Empty<PortfolioLooperCheckpoint.PortfolioEntry>())
+            {
+                prev = entry.Portfolio;
+                yield return prev;
+            }
+
+            var deploymentStartIndex = 0;
             foreach (var deploymentOrders in portfolioDeployments)
             {
+                var startIndex = deploymentStartIndex;
+                deploymentStartIndex += deploymentOrders.Count;
+
                 if (deploymentOrders.Count == 0)
                 {
                     Log.Trace($"PortfolioLooper.FromOrders(): Deployment contains no orders");
                     continue;
                 }
+                if (deploymentStartIndex <= resumedOrderCount)
+                {
+                    // Deployment fully covered by the checkpoint
+                    continue;
+                }
                 var startTime = deploymentOrders.First().Time;
                 var deployment = equityCurve.Where(kvp => kvp.Key <= startTime);
                 if (deployment.IsEmpty)
@@ -302,11 +326,38 @@ namespace QuantConnect.Report
                 // For every deployment, we want to start fresh.
                 looper = new PortfolioLooper(deployment.LastValue(), deploymentOrders, algorithmConfiguration: algorithmConfiguration);
 
-                foreach (var portfolio in looper.ProcessOrders(deploymentOrders))
+                // Unless the checkpoint was taken in the middle of this deployment, then we pick up where it left off
+                var skip = 0;
+                if (startIndex < resumedOrderCount)
+                {
+                    looper.RestoreState(checkpoint);
+                    skip = resumedOrderCount - startIndex;
+                }
+
+                var portfolios = nextCheckpoint?.Portfolios.ToList() ?? new List<PortfolioLooperCheckpoint.PortfolioEntry>();
+                var orderIndex = startIndex + skip;
+                foreach (var portfolio in looper.ProcessOrders(deploymentOrders.Skip(skip)))
                 {
+                    // Orders skipped by ProcessOrders don't generate a portfolio
+                    while (!ReferenceEquals(allOrders[orderIndex], portfolio.Order))
+                    {
+                        orderIndex++;
+                    }
+
+                    portfolios.Add(new PortfolioLooperCheckpoint.PortfolioEntry { OrderIndex = orderIndex, Portfolio = portfolio });
                     prev = portfolio;
                     yield return portfolio;
                 }
+
+                if (!string.IsNullOrEmpty(checkpointPath))
+                {
+                    nextCheckpoint = looper.CaptureState(deploymentStartIndex, portfolios);
+                }
+            }
+
+            if (nextCheckpoint != null && nextCheckpoint != checkpoint)
+            {
+                nextCheckpoint.Write(checkpointPath, allOrders);
             }
 
             if (prev != null)
@@ -347,28 +398,7 @@ namespace QuantConnect.Report
                     lastFillTime = order.LastFillTime.Value;
                 }
 
-                var tick = new Tick { Quantity = order.Quantity, AskPrice = order.Price, BidPrice = order.Price, Value = order.Price, EndTime = lastFillTime };
-                var tradeBar = new TradeBar
-                {
-                    Open = order.Price,
-                    High = order.Price,
-                    Low = order.Price,
-                    Close = order.Price,
-                    Volume = order.Quantity,
-
-                    DataType = MarketDataType.TradeBar,
-                    Period = TimeSpan.Zero,
-                    Symbol = order.Symbol,
-                    Time = lastFillTime,
-                };
-
-                // Required for crypto so that the Cache Price is updated accordingly,
-                // since its `Security.Price` implementation explicitly requests TradeBars.
-                // For most asset types this might be enough as well, but there is the
-                // possibility that some trades might get filtered, so we cover that
-                // case by setting the market price via Tick as well.
-                orderSecurity.SetMarketPrice(tradeBar);
-                orderSecurity.SetMarketPrice(tick);
+                SetMarketPrice(orderSecurity, order.Price, order.Quantity, lastFillTime);
 
                 // Check if we have a base currency (i.e. forex or crypto that requires currency conversion)
                 // to ensure the proper conversion rate is set for them
@@ -413,5 +443,109 @@ namespace QuantConnect.Report
                 yield return new PointInTimePortfolio(order, Algorithm.Portfolio);
             }
         }
+
+        /// <summary>
+        /// Captures the state of the portfolio after processing the first orders
+        /// </summary>
+        /// <param name="orderCount">Number of orders processed, from the start of the order list</param>
+        /// <param name="portfolios">The point in time portfolios generated by the processed orders</param>
+        /// <returns>The checkpoint holding the state</returns>
+        private PortfolioLooperCheckpoint CaptureState(int orderCount, List<PortfolioLooperCheckpoint.PortfolioEntry> portfolios)
+        {
+            return new PortfolioLooperCheckpoint
+            {
+                OrderCount = orderCount,
+                Portfolios = portfolios,
+                Cash = Algorithm.Portfolio.CashBook.ToDictionary(kvp => kvp.Key, kvp => kvp.Value.Amount),
+                UnsettledCash = Algorithm.Portfolio.UnsettledCashBook.ToDictionary(kvp => kvp.Key, kvp => kvp.Value.Amount),
+                Securities = Algorithm.Securities.Values
+                    .Select(security => new PortfolioLooperCheckpoint.SecurityState
+                    {
+                        Symbol = security.Symbol,
+                        Price = security.Price,
+                        AveragePrice = security.Holdings.AveragePrice,
+                        Quantity = security.Holdings.Quantity
+                    })
+                    .ToList()
+            };
+        }
+
+        /// <summary>
+        /// Restores the state of the portfolio captured by <see cref="CaptureState"/>
+        /// </summary>
+        /// <param name="checkpoint">The checkpoint holding the state</param>
+        private void RestoreState(PortfolioLooperCheckpoint checkpoint)
+        {
+            foreach (var state in checkpoint.Securities)
+            {
+                if (!Algorithm.Securities.TryGetValue(state.Symbol, out var security))
+                {
+                    continue;
+                }
+
+                if (state.Price != 0)
+                {
+                    SetMarketPrice(security, state.Price, 0, Algorithm.StartDate);
+                }
+                security.Holdings.SetHoldings(state.AveragePrice, state.Quantity);
+            }
+
+            RestoreCash(Algorithm.Portfolio.CashBook, checkpoint.Cash);
+            RestoreCash(Algorithm.Portfolio.UnsettledCashBook, checkpoint.UnsettledCash);
+
+            Algorithm.Portfolio.InvalidateTotalPortfolioValue();
+        }
+
+        /// <summary>
+        /// Restores the amounts of the cash book and updates their conversion rates
+        /// </summary>
+        private static void RestoreCash(CashBook cashBook, Dictionary<string, decimal> amounts)
+        {
+            foreach (var kvp in amounts)
+            {
+                if (cashBook.TryGetValue(kvp.Key, out var cash))
+                {
+                    cash.SetAmount(kvp.Value);
+                }
+                else
+                {
+                    cashBook.Add(kvp.Key, kvp.Value, 0);
+                }
+            }
+
+            foreach (var cash in cashBook.Values.Where(x => x.CurrencyConversion != null))
+            {
+                cash.Update();
+            }
+        }
+
+        /// <summary>
+        /// Sets the market price of the security
+        /// </summary>
+        private static void SetMarketPrice(Security security, decimal price, decimal quantity, DateTime time)
+        {
+            var tick = new Tick { Quantity = quantity, AskPrice = price, BidPrice = price, Value = price, EndTime = time };
+            var tradeBar = new TradeBar
+            {
+                Open = price,
+                High = price,
+                Low = price,
+                Close = price,
+                Volume = quantity,
+
+                DataType = MarketDataType.TradeBar,
+                Period = TimeSpan.Zero,
+                Symbol = security.Symbol,
+                Time = time,
+            };
+
+            // Required for crypto so that the Cache Price is updated accordingly,
+            // since its `Security.Price` implementation explicitly requests TradeBars.
+            // For most asset types this might be enough as well, but there is the
+            // possibility that some trades might get filtered, so we cover that
+            // case by setting the market price via Tick as well.
+            security.SetMarketPrice(tradeBar);
+            security.SetMarketPrice(tick);
+        }
     }
 }
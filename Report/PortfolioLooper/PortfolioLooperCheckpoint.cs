@@ -0,0 +1,177 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using Newtonsoft.Json;
+using QuantConnect.Logging;
+using QuantConnect.Orders;
+
+namespace QuantConnect.Report
+{
+    /// <summary>
+    /// State of the <see cref="PortfolioLooper"/> after processing the first orders of an algorithm.
+    /// Persisted to disk so the next report of the same algorithm resumes from it and only processes the new orders
+    /// </summary>
+    public class PortfolioLooperCheckpoint
+    {
+        /// <summary>
+        /// Number of orders, from the start of the order list, covered by this checkpoint
+        /// </summary>
+        public int OrderCount { get; set; }
+
+        /// <summary>
+        /// Hash of the covered orders, used to detect that they have not changed since the checkpoint was written
+        /// </summary>
+        public int OrdersHash { get; set; }
+
+        /// <summary>
+        /// The point in time portfolios generated from the covered orders
+        /// </summary>
+        public List<PortfolioEntry> Portfolios { get; set; } = new();
+
+        /// <summary>
+        /// Amount of each currency of the cash book after processing the last covered order
+        /// </summary>
+        public Dictionary<string, decimal> Cash { get; set; } = new();
+
+        /// <summary>
+        /// Amount of each currency of the unsettled cash book after processing the last covered order
+        /// </summary>
+        public Dictionary<string, decimal> UnsettledCash { get; set; } = new();
+
+        /// <summary>
+        /// Price and holdings of each security after processing the last covered order
+        /// </summary>
+        public List<SecurityState> Securities { get; set; } = new();
+
+        /// <summary>
+        /// Reads the checkpoint at the given path if it matches the given orders
+        /// </summary>
+        /// <param name="path">Path of the checkpoint json file</param>
+        /// <param name="orders">All the orders of the algorithm</param>
+        /// <returns>The checkpoint, or null if there is none or it was written for different orders</returns>
+        public static PortfolioLooperCheckpoint Read(string path, IReadOnlyList<Order> orders)
+        {
+            if (string.IsNullOrEmpty(path) || !File.Exists(path))
+            {
+                return null;
+            }
+
+            try
+            {
+                var checkpoint = JsonConvert.DeserializeObject<PortfolioLooperCheckpoint>(File.ReadAllText(path));
+                if (checkpoint == null || checkpoint.OrderCount > orders.Count || checkpoint.OrdersHash != GetOrdersHash(orders, checkpoint.OrderCount))
+                {
+                    Log.Trace($"PortfolioLooperCheckpoint.Read(): Ignoring checkpoint {path} because the orders have changed");
+                    return null;
+                }
+
+                foreach (var entry in checkpoint.Portfolios)
+                {
+                    entry.Portfolio.Order = orders[entry.OrderIndex];
+                }
+
+                Log.Trace($"PortfolioLooperCheckpoint.Read(): Resuming from checkpoint {path} covering {checkpoint.OrderCount} orders");
+                return checkpoint;
+            }
+            catch (Exception err)
+            {
+                Log.Error(err, $"Failed to read checkpoint {path}");
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Writes the checkpoint to the given path
+        /// </summary>
+        /// <param name="path">Path of the checkpoint json file</param>
+        /// <param name="orders">All the orders of the algorithm</param>
+        public void Write(string path, IReadOnlyList<Order> orders)
+        {
+            OrdersHash = GetOrdersHash(orders, OrderCount);
+
+            Log.Trace($"PortfolioLooperCheckpoint.Write(): Writing checkpoint covering {OrderCount} orders to {path}");
+            File.WriteAllText(path, JsonConvert.SerializeObject(this));
+        }
+
+        /// <summary>
+        /// Gets a hash of the fields of the first orders that affect the portfolio.
+        /// Not using <see cref="HashCode"/> because it is seeded per process
+        /// </summary>
+        private static int GetOrdersHash(IReadOnlyList<Order> orders, int count)
+        {
+            unchecked
+            {
+                var hash = 17;
+                for (var i = 0; i < count; i++)
+                {
+                    var order = orders[i];
+                    hash = hash * 31 + order.Id;
+                    hash = hash * 31 + order.Time.GetHashCode();
+                    hash = hash * 31 + order.LastFillTime.GetHashCode();
+                    hash = hash * 31 + order.Quantity.GetHashCode();
+                    hash = hash * 31 + order.Price.GetHashCode();
+                    hash = hash * 31 + (int)order.Status;
+                    hash = hash * 31 + (int)order.Type;
+                }
+                return hash;
+            }
+        }
+
+        /// <summary>
+        /// Point in time portfolio generated by an order
+        /// </summary>
+        public class PortfolioEntry
+        {
+            /// <summary>
+            /// Index of the order that generated the portfolio, used to restore <see cref="PointInTimePortfolio.Order"/>
+            /// </summary>
+            public int OrderIndex { get; set; }
+
+            /// <summary>
+            /// The point in time portfolio
+            /// </summary>
+            public PointInTimePortfolio Portfolio { get; set; }
+        }
+
+        /// <summary>
+        /// Price and holdings of a security
+        /// </summary>
+        public class SecurityState
+        {
+            /// <summary>
+            /// Symbol of the security
+            /// </summary>
+            public Symbol Symbol { get; set; }
+
+            /// <summary>
+            /// Last price of the security
+            /// </summary>
+            public decimal Price { get; set; }
+
+            /// <summary>
+            /// Average price of the holdings
+            /// </summary>
+            public decimal AveragePrice { get; set; }
+
+            /// <summary>
+            /// Quantity held
+            /// </summary>
+            public decimal Quantity { get; set; }
+        }
+    }
+}
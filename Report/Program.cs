@@ -15,13 +15,11 @@
 
 using System;
 using System.IO;
-using Newtonsoft.Json;
 using QuantConnect.Util;
 using System.Diagnostics;
 using QuantConnect.Logging;
 using QuantConnect.Packets;
 using QuantConnect.Lean.Engine;
-using System.Collections.Generic;
 using QuantConnect.Configuration;
 using QuantConnect.Python;
 
@@ -61,24 +59,13 @@ namespace QuantConnect.Report
 
             // Parse content from source files into result objects
             Log.Trace($"QuantConnect.Report.Main(): Parsing source files...{backtestDataFile}, {liveDataFile}");
-            var backtestSettings = new JsonSerializerSettings
-            {
-                Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<BacktestResult>() },
-                FloatParseHandling = FloatParseHandling.Decimal
-            };
-
-            var backtest = JsonConvert.DeserializeObject<BacktestResult>(File.ReadAllText(backtestDataFile), backtestSettings);
+            // Only the members used by the report are read, the rest of each file is skipped
+            var backtest = StreamingResultReader.Read<BacktestResult>(backtestDataFile);
             LiveResult live = null;
 
             if (!string.IsNullOrEmpty(liveDataFile))
             {
-                var settings = new JsonSerializerSettings
-                {
-                    NullValueHandling = NullValueHandling.Ignore,
-                    Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<LiveResult>() }
-                };
-
-                live = JsonConvert.DeserializeObject<LiveResult>(File.ReadAllText(liveDataFile), settings);
+                live = StreamingResultReader.Read<LiveResult>(liveDataFile);
             }
 
             string cssOverrideContent = null;
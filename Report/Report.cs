@@ -71,10 +71,15 @@ namespace QuantConnect.Report
             // backtestConfiguration?.TradingDaysPerYear equal liveConfiguration?.TradingDaysPerYear
             var tradingDayPerYear = backtestConfiguration?.TradingDaysPerYear ?? 252;
 
+            // Checkpoints of the portfolio looper, so the next report only processes the new orders
+            var checkpoint = Config.Get("report-portfolio-checkpoint");
+            var backtestCheckpoint = string.IsNullOrWhiteSpace(checkpoint) ? null : checkpoint.Replace(".json", string.Empty) + "-backtesting-checkpoint.json";
+            var liveCheckpoint = string.IsNullOrWhiteSpace(checkpoint) ? null : checkpoint.Replace(".json", string.Empty) + "-live-checkpoint.json";
+
             Log.Trace($"QuantConnect.Report.Report(): Processing backtesting orders");
-            var backtestPortfolioInTime = PortfolioLooper.FromOrders(backtestCurve, backtestOrders, backtestConfiguration).ToList();
+            var backtestPortfolioInTime = PortfolioLooper.FromOrders(backtestCurve, backtestOrders, backtestConfiguration, checkpointPath: backtestCheckpoint).ToList();
             Log.Trace($"QuantConnect.Report.Report(): Processing live orders");
-            var livePortfolioInTime = PortfolioLooper.FromOrders(liveCurve, liveOrders, liveConfiguration, liveSeries: true).ToList();
+            var livePortfolioInTime = PortfolioLooper.FromOrders(liveCurve, liveOrders, liveConfiguration, liveSeries: true, checkpointPath: liveCheckpoint).ToList();
 
             var destination = pointInTimePortfolioDestination ?? Config.Get("report-destination");
             if (!string.IsNullOrWhiteSpace(destination))
@@ -186,6 +191,9 @@ namespace QuantConnect.Report
                 statistics[reportElement.JsonKey] = reportElement.Result;
             }
 
+            // charts rendered by the process pool are injected as placeholders, replace them with the rendered charts
+            html = ChartReportElement.ResolveCharts(html);
+
             reportStatistics = JsonConvert.SerializeObject(statistics, Formatting.None);
         }
 
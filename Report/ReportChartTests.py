@@ -181,3 +181,14 @@ result = charts.GetExposure(time, long_securities, short_securities, long, short
 result = charts.GetExposure(time, long_securities, short_securities, long, short,
                                 live_time, live_long_securities, live_short_securities,
                                 live_long, live_short)
+
+## Test the process pool rendering mode
+# The workers are spawned and import this script as __mp_main__ when it is run directly, they must not start their own pool
+if __name__ != '__mp_main__':
+    pool_charts = ReportCharts(processes = 2)
+    backtest = [['2012', '2013', '2014'], [1.0, -2.0, 3.0]]
+    live = [['2015'], [0.5]]
+    expected = charts.GetAnnualReturns(backtest, live) + charts.GetLeverage(empty, empty)
+    placeholders = pool_charts.GetAnnualReturns(backtest, live) + pool_charts.GetLeverage(empty, empty)
+    result = pool_charts.ResolveCharts(placeholders)
+    assert result == expected, 'Charts rendered by the process pool differ from the charts rendered in process'
@@ -11,16 +11,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import re
+import sys
 import matplotlib
 import numpy as np
 import pandas as pd
+from io import BytesIO
 from base64 import b64encode
+from functools import wraps
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 from pandas.plotting import register_matplotlib_converters
-from clr import AddReference
-AddReference("System")
-from System import *
 
 register_matplotlib_converters()
 
@@ -31,14 +34,84 @@ font = {'family': 'DejaVu Sans'}
 matplotlib.rc('font',**font)
 matplotlib.rc('axes', edgecolor='#d5d5d5')
 
-import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import matplotlib.colors as mcolors
+from matplotlib.artist import Artist, setp
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
 from matplotlib.dates import DateFormatter
+from matplotlib.font_manager import FontProperties
 from matplotlib.ticker import MaxNLocator, NullFormatter, ScalarFormatter, FormatStrFormatter
 la = matplotlib.font_manager.FontManager()
 lu = matplotlib.font_manager.FontProperties(family = "Open Sans Condensed")
 
+def deferrable(method):
+    '''Submits the chart to the process pool, when there is one, and returns a placeholder
+    that ReportCharts.ResolveCharts replaces with the rendered chart'''
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.executor is None:
+            return method(self, *args, **kwargs)
+
+        placeholder = f'{{{{$REPORT-CHART-{len(self.pending)}}}}}'
+        self.pending[placeholder] = self.executor.submit(render_chart, method.__name__,
+            to_builtin(args), to_builtin(kwargs))
+        return placeholder
+    return wrapper
+
+def render_chart(name, args, kwargs):
+    '''Renders a single chart in a worker process'''
+    return getattr(ReportCharts(), name)(*args, **kwargs)
+
+def to_builtin(value):
+    '''Converts CLR collections into Python lists and dictionaries so they can be pickled to the workers'''
+    if value is None or isinstance(value, (str, bytes, int, float, date, np.ndarray, pd.Series, pd.DataFrame)):
+        return value
+    if hasattr(value, 'keys'):
+        return {to_builtin(key): to_builtin(value[key]) for key in value.keys()}
+    try:
+        return [to_builtin(x) for x in value]
+    except TypeError:
+        return value
+
+def python_executable():
+    '''Gets the Python interpreter the workers are spawned with. When Python is embedded,
+    sys.executable is the host process, so we fall back to the interpreter of the environment'''
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+    return os.path.join(sys.exec_prefix, 'python.exe' if os.name == 'nt' else os.path.join('bin', 'python3'))
+
+class HeatmapLabels(Artist):
+    '''Draws the values of a heatmap at the center of their cells as a single artist,
+    instead of creating one Text artist per cell. NaN cells are left empty'''
+    def __init__(self, values, fontsize = 7):
+        super().__init__()
+        values = np.asarray(values, dtype=float)
+        rows, columns = np.nonzero(~np.isnan(values))
+        self.positions = np.column_stack([columns, rows])
+        self.labels = np.round(values[rows, columns], 1).astype(str)
+        self.prop = FontProperties(size=fontsize)
+        self.set_in_layout(False)
+
+    def draw(self, renderer):
+        if not self.get_visible() or len(self.labels) == 0:
+            return
+
+        gc = renderer.new_gc()
+        gc.set_foreground(matplotlib.rcParams['text.color'])
+        canvas_height = renderer.get_canvas_width_height()[1]
+
+        for (x, y), label in zip(self.axes.transData.transform(self.positions), self.labels):
+            # center the text box on the cell, the renderer expects the position of the baseline
+            width, height, descent = renderer.get_text_width_height_descent(label, self.prop, ismath=False)
+            y = y - height / 2 + descent
+            if renderer.flipy():
+                y = canvas_height - y
+            renderer.draw_text(gc, x - width / 2, y, label, self.prop, 0)
+
+        gc.restore()
+        self.stale = False
+
 class ReportCharts:
     color_map = {
             "Equity": "#ff9914",
@@ -53,50 +126,78 @@ class ReportCharts:
             "CryptoFuture": "#E55812"
         }
 
+    # the 'Insufficient Data' charts by (width, height, fontsize)
+    insufficient_data_cache = {}
+
+    def __init__(self, processes = 0):
+        '''
+        processes: number of worker processes rendering the charts concurrently. When greater than zero,
+        the chart methods return a placeholder that is replaced by the chart in ResolveCharts
+        '''
+        self.pending = {}
+        self.executor = None
+        if processes > 0:
+            context = get_context('spawn')
+            context.set_executable(python_executable())
+            self.executor = ProcessPoolExecutor(processes, mp_context=context)
+
     def fig_to_base64(self, filename = '', fig = None, dpi = 200):
+        '''Encodes the figure as a base64 PNG in memory. The filename is kept for backwards compatibility, nothing is written to disk'''
         base64 = 'data:image/png;base64,'
         if fig is not None:
-            fig.savefig(filename, dpi=dpi, bbox_inches='tight')
-            with open(filename, "rb") as fp:
-                base64 += b64encode(fp.read()).decode('utf-8').replace('\n', '')
+            with BytesIO() as buffer:
+                fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+                base64 += b64encode(buffer.getvalue()).decode('utf-8')
             return base64
 
-    def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
-                           name = "returns-per-trade.png", width = 7, height = 5,
-                           live_color = "#ff9914", backtest_color = "#71c3fc"):
+    def ResolveCharts(self, text):
+        '''Replaces the placeholders returned by the deferred chart methods with the rendered charts'''
+        for placeholder, future in self.pending.items():
+            text = text.replace(placeholder, future.result())
+        self.pending.clear()
+        return text
 
-        if len(returns_per_trade) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
+    def GetInsufficientData(self, name, width, height, fontsize = 20):
+        key = (width, height, fontsize)
+        if key in self.insufficient_data_cache:
+            return self.insufficient_data_cache[key]
 
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
+        fig = Figure()
+        fig.set_size_inches(width, height)
 
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
+        left, box_width = .25, .5
+        bottom, box_height = .25, .5
+        right = left + box_width
+        top = bottom + box_height
 
-            ax.axis('off')
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
+                horizontalalignment='center',
+                verticalalignment='center',
+                fontsize=fontsize,
+                transform=ax.transAxes)
 
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
+        ax.axis('off')
 
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+        for _, spine in ax.spines.items():
+            spine.set_visible(False)
+
+        self.insufficient_data_cache[key] = self.fig_to_base64(name, fig)
+        return self.insufficient_data_cache[key]
+
+    @deferrable
+    def GetReturnsPerTrade(self, returns_per_trade = [], live_returns_per_trade = [],
+                           name = "returns-per-trade.png", width = 7, height = 5,
+                           live_color = "#ff9914", backtest_color = "#71c3fc"):
+
+        if len(returns_per_trade) == 0:
+            return self.GetInsufficientData(name, width, height, 30)
 
         if len(live_returns_per_trade) > 0:
             width = 11.5
             height = 5
-            plt.figure()
-            fig, ax = plt.subplots(1, 2, tight_layout=True)
+            fig = Figure(tight_layout=True)
+            ax = fig.subplots(1, 2)
             ax[0].hist(returns_per_trade, bins=75, color=backtest_color)
             ax[1].hist(live_returns_per_trade, bins=25, color=live_color)
             for i in range(2):
@@ -110,31 +211,31 @@ class ReportCharts:
                     ax[i].tick_params(labelsize=8)
                     ax[i].tick_params(axis='x', color='#d5d5d5')
                     ax[i].tick_params(axis='y', color='#d5d5d5')
-                    plt.setp(ax[i].spines.values(), color='#d5d5d5')
+                    setp(ax[i].spines.values(), color='#d5d5d5')
                     ax[i].spines['right'].set_visible(False)
                     ax[i].spines['top'].set_visible(False)
+            percent_ax = ax[1]
         else:
-            fig = plt.figure()
-            plt.hist(returns_per_trade, bins=75, color=backtest_color)
-            plt.xticks(fontsize=8)
-            plt.yticks(fontsize=8)
-            plt.gca().spines['right'].set_visible(False)
-            plt.gca().spines['top'].set_visible(False)
-            plt.gca().tick_params(axis='x', color='#d5d5d5')
-            plt.gca().tick_params(axis='y', color='#d5d5d5')
-            plt.gca().axvline(x=np.median(returns_per_trade), color="red", ls="dashed", label="median", linewidth=0.5)
-            plt.ylabel('')
+            fig = Figure()
+            percent_ax = fig.add_subplot()
+            percent_ax.hist(returns_per_trade, bins=75, color=backtest_color)
+            percent_ax.tick_params(labelsize=8)
+            percent_ax.spines['right'].set_visible(False)
+            percent_ax.spines['top'].set_visible(False)
+            percent_ax.tick_params(axis='x', color='#d5d5d5')
+            percent_ax.tick_params(axis='y', color='#d5d5d5')
+            percent_ax.axvline(x=np.median(returns_per_trade), color="red", ls="dashed", label="median", linewidth=0.5)
+            percent_ax.set_ylabel('')
 
         # Set the x ticks as percentage to keep consistency
-        plt.xticks(ticks=plt.xticks()[0], labels=["{:.2f}%".format(tick * 100) for tick in plt.xticks()[0]])
+        ticks = percent_ax.get_xticks()
+        percent_ax.set_xticks(ticks)
+        percent_ax.set_xticklabels(["{:.2f}%".format(tick * 100) for tick in ticks])
 
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetCumulativeReturns(self, data = None, live_data = None, benchmark_symbol = 'SPY',
                                  name = "cumulative-return.png", width = 11.5, height = 2.5, live_color = "#ff9914",
                                  backtest_color = "#71c3fc", gray = "#b3bcc0"):
@@ -151,34 +252,10 @@ class ReportCharts:
             live_data = [[],[],[],[]]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
+            return self.GetInsufficientData(name, width, height)
 
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
-
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         labels = ['Backtest', 'Benchmark']
         labels_removed = []
 
@@ -193,38 +270,14 @@ class ReportCharts:
                 # We have nothing for this graph. Wipe any mention of it
                 labels_removed.append(labels[i])
 
-            rectangles.append(plt.Rectangle((0, 0), 1, 1, fc=colors[i]))
+            rectangles.append(Rectangle((0, 0), 1, 1, fc=colors[i]))
 
         # Only get the labels we didn't remove (i.e. labels that have a graph, guaranteed)
         labels = [label for label in labels if label not in labels_removed]
 
         # Return if we don't have any valid labels
         if not any(labels):
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         live_labels = []
         live_labels_removed = []
@@ -237,68 +290,39 @@ class ReportCharts:
             for i, array in enumerate(values):
                 if any(array[0]):
                     ax.plot(array[0], array[1], linewidth=0.5, color=colors[i], drawstyle='steps-post')
-                    rectangles.append(plt.Rectangle((0, 0), 1, 1, fc=colors[i]))
+                    rectangles.append(Rectangle((0, 0), 1, 1, fc=colors[i]))
 
         ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                   frameon=False, fontsize=8, ncol=len(labels))
-        fig = ax.get_figure()
-        plt.xticks(rotation=0, ha='center', fontsize=8)
-        plt.yticks(fontsize=8)
+        ax.tick_params(axis='both', labelsize=8)
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
         ax.yaxis.set_major_formatter(ticker.PercentFormatter())
         ax.yaxis.set_major_locator(MaxNLocator(6))
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
-        plt.setp(ax.spines.values(), color='#d5d5d5')
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
+        setp(ax.spines.values(), color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetDailyReturns(self, returns = [[],[]], live_returns = [[],[]],
                             name = "daily-returns.png", width = 11.5, height = 2.5,
                             live_color = "#ff9914", backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(returns[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         returns[0] = list(returns[0])
         returns[1] = list(returns[1])
         live_returns[0] = list(live_returns[0])
         live_returns[1] = list(live_returns[1])
 
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
 
         backtest_series = pd.Series(returns[1], index=returns[0])
         live_series = pd.Series(live_returns[1], index=live_returns[0])
@@ -320,11 +344,10 @@ class ReportCharts:
 
         # Need to handle this since we don't use a legend if it is only backtesting
         if len(live_returns[0]) > 0:
-            rectangles = [plt.Rectangle((0, 0), 1, 1, fc=backtest_color), plt.Rectangle((0, 0), 1, 1, fc=live_color)]
+            rectangles = [Rectangle((0, 0), 1, 1, fc=backtest_color), Rectangle((0, 0), 1, 1, fc=live_color)]
             ax.legend(rectangles, [label for label in ['Backtest', "Live"]], handlelength=0.8, handleheight=0.8,
                       frameon=False, fontsize=8)
 
-        fig = ax.get_figure()
         ax.xaxis_date()
         #ax.set_xticks(fontsize = 8)
         #ax.set_yticks(fontsize = 8)
@@ -332,19 +355,17 @@ class ReportCharts:
         ax.set_xlabel("")
         ax.yaxis.set_major_formatter(ticker.PercentFormatter())
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
-        plt.axhline(y = 0, color = '#d5d5d5')
-        plt.setp(ax.spines.values(), color='#d5d5d5')
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.axhline(y = 0, color = '#d5d5d5')
+        setp(ax.spines.values(), color='#d5d5d5')
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.set_axisbelow(True)
         ax.yaxis.grid(True, color = "#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetMonthlyReturns(self, returns = {}, live_returns = {}, width=7, height=5, name='monthly-returns.png'):
         '''
         Expects monthly returns in dictionary keyed by year containing a list of monthly returns (as percentage values, i.e. 1% is 1.0 in the list).
@@ -359,31 +380,7 @@ class ReportCharts:
 
         if len(returns) == 0:
             print("No monthly returns found")
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height, 30)
 
         # Make data frame
         returns = pd.DataFrame(returns, index = months).transpose()
@@ -395,12 +392,13 @@ class ReportCharts:
                   c('#00FF00'), c('#00CC00')]
 
         abs_cmap = matplotlib.colors.LinearSegmentedColormap.from_list('monthly_returns', colors)
-        norm = plt.Normalize(-10, 10)
+        norm = mcolors.Normalize(-10, 10)
 
+        fig = Figure()
         if len(live_returns) > 0:
             live_returns = pd.DataFrame(live_returns, index=months).transpose()
 
-            fig, ax = plt.subplots(2, 1, gridspec_kw={'height_ratios': [6, 1]})
+            ax = fig.subplots(2, 1, gridspec_kw={'height_ratios': [6, 1]})
             #ax[0].matshow(returns, aspect='auto', cmap=c_map, interpolation='none', vmin=-10, vmax=10)
             #ax[1].matshow(live_returns, aspect='auto', cmap=live_c_map, interpolation='none')
             ax[0].matshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
@@ -412,11 +410,7 @@ class ReportCharts:
             ax[0].set_xticklabels([''] + [x for x in returns.columns])
             ax[0].tick_params(labelsize=8, bottom=True, labelbottom=True, top=False, labeltop=False)
             ax[0].set_ylabel('Backtest', rotation='vertical', fontweight='black')
-            for (j, i), label in np.ndenumerate(returns):
-                if np.isnan(label):
-                    ax[0].text(i, j, "", ha='center', va='center', fontsize=7)
-                else:
-                    ax[0].text(i, j, round(label, 1), ha='center', va='center', fontsize=7)
+            ax[0].add_artist(HeatmapLabels(returns.values))
 
             ax[1].xaxis.set_major_locator(ticker.MaxNLocator(min(12, len(live_returns.columns))))
             ax[1].yaxis.set_major_locator(ticker.MaxNLocator(len(live_returns.index.values)))
@@ -424,11 +418,7 @@ class ReportCharts:
             ax[1].set_yticklabels([''] + list(live_returns.index.values))
             ax[1].tick_params(labelsize=8, bottom=True, labelbottom=True, top=False, labeltop=False)
             ax[1].set_ylabel('Live', rotation='vertical', fontweight='black')
-            for (j, i), label in np.ndenumerate(live_returns):
-                if np.isnan(label):
-                    ax[1].text(i, j, "", ha='center', va='center', fontsize=7)
-                else:
-                    ax[1].text(i, j, round(label, 1), ha='center', va='center', fontsize=7)
+            ax[1].add_artist(HeatmapLabels(live_returns.values))
 
             ax[0].tick_params(axis='x', color='#d5d5d5')
             ax[0].tick_params(axis='y', color='#d5d5d5')
@@ -436,27 +426,22 @@ class ReportCharts:
             ax[1].tick_params(axis='y', color='#d5d5d5')
 
         else:
-            ax = plt.imshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
-            fig = ax.get_figure()
-            plt.xlabel('')
-            plt.ylabel('')
-            plt.gca().tick_params(axis='x', color='#d5d5d5')
-            plt.gca().tick_params(axis='y', color='#d5d5d5')
-            plt.yticks(range(len(returns.index.values)), returns.index.values, fontsize=8)
-            plt.xticks(range(12), ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
-            for (j, i), label in np.ndenumerate(returns):
-                if np.isnan(label):
-                    plt.text(i, j, "", ha='center', va='center', fontsize=7)
-                else:
-                    plt.text(i, j, str(round(label, 1)), ha='center', va='center', fontsize=7)
+            ax = fig.add_subplot()
+            ax.imshow(returns, aspect='auto', cmap=abs_cmap, norm=norm, interpolation='none')
+            ax.set_xlabel('')
+            ax.set_ylabel('')
+            ax.tick_params(axis='x', color='#d5d5d5')
+            ax.tick_params(axis='y', color='#d5d5d5')
+            ax.set_yticks(range(len(returns.index.values)))
+            ax.set_yticklabels(returns.index.values, fontsize=8)
+            ax.set_xticks(range(12))
+            ax.set_xticklabels(months)
+            ax.add_artist(HeatmapLabels(returns.values))
 
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetAnnualReturns(self, data = None, live_data = None, name = "annual-returns.png",width = 3.5*2, height = 2.5*2):
 
         live_color = "#ff9914"
@@ -468,103 +453,51 @@ class ReportCharts:
             live_data = [[], []]
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height, 30)
 
         # Cast to list just in case
         time = list(data[0]) + list(live_data[0])
         returns = list(data[1]) + list(live_data[1])
 
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         # Prevent value speculation on the y-axis ticks by
         # converting to string before plotting.
         ax.barh([str(i) for i in time], returns, color = [backtest_color], zorder=1)
         # Add a percentage sign at the end of each x-axis tick
         ax.xaxis.set_major_formatter(ticker.PercentFormatter())
 
-        fig = ax.get_figure()
-        plt.xticks(rotation=0, ha='center', fontsize=8)
-        plt.yticks(fontsize=8)
-        plt.axvline(x=0, color='#d5d5d5', linewidth=0.5)
-        vline = plt.axvline(x=np.mean(returns), color="red", ls="dashed", label="mean", linewidth=1)
-        plt.legend([vline], ["mean"], loc='upper right', frameon=False, fontsize=8)
-        plt.setp(ax.spines.values(), color='#d5d5d5')
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.tick_params(axis='both', labelsize=8)
+        ax.axvline(x=0, color='#d5d5d5', linewidth=0.5)
+        vline = ax.axvline(x=np.mean(returns), color="red", ls="dashed", label="mean", linewidth=1)
+        ax.legend([vline], ["mean"], loc='upper right', frameon=False, fontsize=8)
+        setp(ax.spines.values(), color='#d5d5d5')
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.grid(color='#d5d5d5', axis='x', linewidth=1, zorder=0)
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
-        plt.xlabel("")
-        plt.ylabel("")
+        ax.set_xlabel("")
+        ax.set_ylabel("")
         ax.xaxis.grid(True)
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetDrawdown(self, data = [[],[]], live_data = [[],[]], worst = [{}], name = "drawdowns.png",
                         width = 11.5, height = 2.5, gray = "#b3bcc0"):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
+            return self.GetInsufficientData(name, width, height)
 
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
-
-        time = list(data[0]) + list(live_data[0])
-        drawdown = list(data[1]) + list(live_data[1])
+        # The series may come as lists or as numpy arrays
+        time = np.concatenate([np.asarray(data[0], dtype='datetime64[ns]'), np.asarray(live_data[0], dtype='datetime64[ns]')])
+        drawdown = np.concatenate([np.asarray(data[1], dtype=float), np.asarray(live_data[1], dtype=float)])
 
         colors = ["#FFCCCCCC", "#FFE5CCCC", "#FFFFCCCC", "#E5FFCCCC", "#CCFFCCCC"]
         labels = ["1st Worst", "2nd Worst", "3rd Worst", "4th Worst", "5th Worst"]
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
         # Backtest
@@ -578,12 +511,12 @@ class ReportCharts:
             if start == end:
                 worst_point = start
             else:
-                sub_data = drawdown[time.index(start):time.index(end)]
-                worst_point = time[drawdown.index(min(sub_data))]
+                begin, stop = np.searchsorted(time, [np.datetime64(start, 'ns'), np.datetime64(end, 'ns')])
+                worst_point = time[begin + np.argmin(drawdown[begin:stop])]
 
-            plt.axvspan(start, end, 0, 0.95, color = colors[index], zorder = 1)
-            plt.axvline(worst_point, 0, 0.95, ls = 'dashed', color = 'black', zorder = 4, linewidth = 0.5)
-            ax.text(worst_point, min(drawdown) * 0.75, labels[index], rotation = 90, zorder = 4, va='bottom')
+            ax.axvspan(start, end, 0, 0.95, color = colors[index], zorder = 1)
+            ax.axvline(worst_point, 0, 0.95, ls = 'dashed', color = 'black', zorder = 4, linewidth = 0.5)
+            ax.text(worst_point, drawdown.min() * 0.75, labels[index], rotation = 90, zorder = 4, va='bottom')
 
         # Live
         live_time = live_data[0]
@@ -592,97 +525,64 @@ class ReportCharts:
         # No need to draw the live mode stuff since we've already taken care of it.
         # We're just after the Live trading dotted plot in case it exists
 
-        plt.axvline(live_time[0], 0, 0.95, ls='dotted', color='red', zorder=4) if len(live_time) > 0 else None
-        plt.text(live_time[0], min(min(drawdown), min(live_drawdown)) * 0.75, "Live Trading", rotation=90, zorder=4, fontsize=7) if len(live_time) > 0 else None
-
-        fig = ax.get_figure()
-        plt.xticks(rotation=0, ha='center', fontsize=8)
-        plt.yticks(ticks=[i for i in plt.yticks()[0] if i <= 0], labels=['{:.1f}%'.format(i * 100) for i in plt.yticks()[0] if i <= 0], fontsize=8)
-        plt.ylabel("")
-        plt.xlabel("")
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
-        plt.setp(ax.spines.values(), color='#d5d5d5')
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.axvline(live_time[0], 0, 0.95, ls='dotted', color='red', zorder=4) if len(live_time) > 0 else None
+        ax.text(live_time[0], min(drawdown.min(), np.min(live_drawdown)) * 0.75, "Live Trading", rotation=90, zorder=4, fontsize=7) if len(live_time) > 0 else None
+
+        ax.tick_params(axis='x', labelsize=8)
+        ticks = [i for i in ax.get_yticks() if i <= 0]
+        ax.set_yticks(ticks)
+        ax.set_yticklabels(['{:.1f}%'.format(i * 100) for i in ticks], fontsize=8)
+        ax.set_ylabel("")
+        ax.set_xlabel("")
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
+        setp(ax.spines.values(), color='#d5d5d5')
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetCrisisEventsPlots(self, data = [[],[],[]], name = '', width = 7, height = 5,
                              backtest_color = "#71c3fc", gray = "#b3bcc0"):
         if len(data[0]) == 0:
-            fig = plt.figure()
+            fig = Figure()
             fig.set_size_inches(width, height)
-            base64 = self.fig_to_base64(f'{name}.png', fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.fig_to_base64(f'{name}.png', fig)
 
-        plt.figure()
-        ax = plt.gca()
-        fig = ax.get_figure()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%Y-%m-%d"))
         colors = [backtest_color, gray]
         for j, values in enumerate(data[1:]):
             ax.plot(data[0][:min(len(data[0]),len(values))], values, color=colors[j], linewidth=0.5, zorder=2, drawstyle='steps-post')
         labels = ['Backtest', 'Benchmark']
-        rectangles = [plt.Rectangle((0, 0), 1, 1, fc=backtest_color), plt.Rectangle((0, 0), 1, 1, fc=gray)]
+        rectangles = [Rectangle((0, 0), 1, 1, fc=backtest_color), Rectangle((0, 0), 1, 1, fc=gray)]
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8, ncol=len(labels))
         for line in leg.get_lines(): line.set_linewidth(3)
-        plt.axhline(y=0, color= gray, zorder=1)
-        plt.setp(ax.spines.values(), color='#d5d5d5')
+        ax.axhline(y=0, color= gray, zorder=1)
+        setp(ax.spines.values(), color='#d5d5d5')
         ax.tick_params(axis='x', labelsize=8, labelrotation=45)
-        plt.yticks(ticks=plt.yticks()[0], labels=['{0:g}%'.format(i * 100) for i in plt.yticks()[0]], fontsize=8)
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ticks = ax.get_yticks()
+        ax.set_yticks(ticks)
+        ax.set_yticklabels(['{0:g}%'.format(i * 100) for i in ticks], fontsize=8)
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
-        plt.xlabel("")
-        plt.ylabel("")
+        ax.set_xlabel("")
+        ax.set_ylabel("")
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(f'{name}.png', fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(f'{name}.png', fig)
 
+    @deferrable
     def GetRollingBeta(self, data = [[],[],[],[]], live_data = [[],[],[],[]], name = "rolling-portfolio-beta-to-equity.png",
                         width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                         backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
 
         if len(data[0]) == 0 and len(live_data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         # Data will come in the following format:
         # [six month rolling beta time, six month rolling beta, twelve month rolling beta time, twelve month rolling beta]
@@ -697,20 +597,19 @@ class ReportCharts:
 
         if len(backtest_six_month_beta) > 0:
             labels += ['6 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=backtest_six_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=backtest_six_months_color)]
         if len(backtest_twelve_month_beta) > 0:
             labels += ['12 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=backtest_twelve_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=backtest_twelve_months_color)]
         if len(live_six_month_beta) > 0:
             labels += ['Live 6 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=live_six_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=live_six_months_color)]
         if len(live_twelve_month_beta) > 0:
             labels += ['Live 12 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=live_twelve_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=live_twelve_months_color)]
 
-        plt.figure()
-        ax = plt.gca()
-        fig = ax.get_figure()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
         # Backtest
@@ -728,55 +627,28 @@ class ReportCharts:
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8, ncol=2)
         for line in leg.get_lines(): line.set_linewidth(3)
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
-        plt.setp(ax.spines.values(), color='#d5d5d5')
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
+        setp(ax.spines.values(), color='#d5d5d5')
         ax.tick_params(axis='both', labelsize=8, labelrotation=0)
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.xlabel("")
-        plt.ylabel("")
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.set_xlabel("")
+        ax.set_ylabel("")
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetRollingSharpeRatio(self, data = [[],[]], live_data = [[],[]], name = "rolling-sharpe-ratio.png",
                                 width = 11.5, height = 2.5, live_six_months_color = "#ff9914", live_twelve_months_color = "#ffd700",
                                 backtest_six_months_color = "#71c3fc", backtest_twelve_months_color = "#1d7dc1"):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
+            return self.GetInsufficientData(name, width, height)
 
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
-
-        plt.figure()
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
 
         # Data will come in the following format:
@@ -791,16 +663,16 @@ class ReportCharts:
 
         if len(backtest_six_month_rolling_sharpe) > 0:
             labels += ['6 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=backtest_six_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=backtest_six_months_color)]
         if len(backtest_twelve_month_rolling_sharpe) > 0:
             labels += ['12 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=backtest_twelve_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=backtest_twelve_months_color)]
         if len(live_six_month_rolling_sharpe) > 0:
             labels += ['Live 6 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=live_six_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=live_six_months_color)]
         if len(live_twelve_month_rolling_sharpe) > 0:
             labels += ['Live 12 mo.']
-            rectangles += [plt.Rectangle((0, 0), 1, 1, fc=live_twelve_months_color)]
+            rectangles += [Rectangle((0, 0), 1, 1, fc=live_twelve_months_color)]
 
         # Backtest
         if len(backtest_six_month_rolling_sharpe) > 0:
@@ -817,52 +689,23 @@ class ReportCharts:
         leg = ax.legend(rectangles, labels, handlelength=0.8, handleheight=0.8,
                         frameon=False, fontsize=8)
         for line in leg.get_lines(): line.set_linewidth(3)
-        plt.axhline(y=0, color='#d5d5d5', zorder=1)
-        plt.setp(ax.spines.values(), color='#d5d5d5')
+        ax.axhline(y=0, color='#d5d5d5', zorder=1)
+        setp(ax.spines.values(), color='#d5d5d5')
         ax.tick_params(axis='both', labelsize=8, labelrotation=0)
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
-        fig = ax.get_figure()
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
     def GetAssetAllocation(self, data = [[],[]], live_data = [[],[]],
                               name="asset-allocation.png", width = 7, height = 5):
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=30,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return {"Backtest Asset Allocation": base64}
+            return {"Backtest Asset Allocation": self.GetInsufficientData(name, width, height, 30)}
 
         symbols = [data[0], live_data[0]]
 
@@ -886,58 +729,32 @@ class ReportCharts:
 
             labels = [f'{symbol}\n' + '{:.2f}%'.format(value * 100) for symbol, value in zip(symbols_to_use, to_label)]
 
-            fig = plt.figure()
-            plt.pie(to_label, colors = colors)
-            plt.legend(labels, frameon = False, fontsize = 8, loc = 'center left', bbox_to_anchor=(0, 0.5))
-            plt.axis('equal')
+            fig = Figure()
+            ax = fig.add_subplot()
+            ax.pie(to_label, colors = colors)
+            ax.legend(labels, frameon = False, fontsize = 8, loc = 'center left', bbox_to_anchor=(0, 0.5))
+            ax.axis('equal')
             fig.set_size_inches(width, height)
             if i == 0:
                 pies["Backtest Asset Allocation"] = self.fig_to_base64(f"asset-allocation-backtest.png", fig)
             else:
                 pies["Live Asset Allocation"] = self.fig_to_base64(f"asset-allocation-live.png", fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
 
         pies["filler"] = ''
 
         return pies
 
+    @deferrable
     def GetLeverage(self, data = [[],[]], live_data = [[],[]], name = "leverage.png",width = 11.5,
                         height = 2.5, backtest_color = "#71c3fc", live_color = "#ff9914",):
 
         if len(data[0]) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         labels = ['Backtest']
 
-        plt.figure()
-        ax = plt.gca()
-        fig = ax.get_figure()
+        fig = Figure()
+        ax = fig.add_subplot()
 
         # Backtest
         ax.fill_between(data[0], 0, data[1], color = backtest_color, alpha = 0.75, step='post')
@@ -948,57 +765,29 @@ class ReportCharts:
 
         ax.fill_between(live_data[0], 0, live_data[1], color=live_color, alpha=0.75, step = 'post')
 
-        rectangles = [plt.Rectangle((0, 0), 1, 1, fc=backtest_color), plt.Rectangle((0, 0), 1, 1, fc=live_color)]
+        rectangles = [Rectangle((0, 0), 1, 1, fc=backtest_color), Rectangle((0, 0), 1, 1, fc=live_color)]
         ax.legend(rectangles, [label for label in labels], handlelength=0.8, handleheight=0.8,
                   frameon=False, fontsize=8)
-        ax.set_xticklabels(ax.get_xticklabels(), rotation=0, ha='center')
         ax.tick_params(axis='both', labelsize=8, labelrotation=0)
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
-        plt.axhline(y=0, color='#d5d5d5')
-        plt.setp(ax.spines.values(), color='#d5d5d5')
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        ax.axhline(y=0, color='#d5d5d5')
+        setp(ax.spines.values(), color='#d5d5d5')
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.set_axisbelow(True)
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
         ax.yaxis.grid(True, color="#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
 
+    @deferrable
     def GetExposure(self, time = [], long_securities = [], short_securities = [], long_data = [[]], short_data = [[]],
                         live_time = [], live_long_securities = [], live_short_securities = [], live_long_data = [[]],
                         live_short_data = [[]], name = "exposure.png", width = 11.5, height = 2.5):
         if len(time) == 0:
-            fig = plt.figure()
-            fig.set_size_inches(width, height)
-
-            left, box_width = .25, .5
-            bottom, box_height = .25, .5
-            right = left + box_width
-            top = bottom + box_height
-
-            ax = fig.add_axes([0, 0, 1, 1])
-            ax.text(0.5 * (left + right), 0.5 * (top + bottom), 'Insufficient Data', color="#d5d5d5",
-                    horizontalalignment='center',
-                    verticalalignment='center',
-                    fontsize=20,
-                    transform=ax.transAxes)
-
-            ax.axis('off')
-
-            for _, spine in ax.spines.items():
-                spine.set_visible(False)
-
-            base64 = self.fig_to_base64(name, fig)
-            plt.cla()
-            plt.clf()
-            plt.close('all')
-            return base64
+            return self.GetInsufficientData(name, width, height)
 
         for k, v in list(self.color_map.items()):
             self.color_map[k + ' - Short'] = '#' + hex(int(v[1:], 16) ^ 0xffffff)[2:].zfill(6)
@@ -1009,7 +798,8 @@ class ReportCharts:
         short_colors = [self.color_map[security + ' - Short'] for security in short_securities] if len(short_securities) > 0 else None
         short_live_colors = [self.color_map[security + ' - Short'] for security in live_short_securities] if len(live_short_securities) > 0 else None
 
-        ax = plt.gca()
+        fig = Figure()
+        ax = fig.add_subplot()
 
         # Create step plot for the stackplot by adding a value
         # right before the next data point with the same previous value
@@ -1122,27 +912,21 @@ class ReportCharts:
         # use dict.fromkeys() instead of set() to remove duplicates and preserve order
         labels = list(dict.fromkeys(labels))
         live_labels = list(dict.fromkeys(live_labels))
-        rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in labels]
-        live_rectangles = [plt.Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in live_labels]
+        rectangles = [Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in labels]
+        live_rectangles = [Rectangle((0, 0), 1, 1, fc=self.color_map[lab]) for lab in live_labels]
         ax.legend(rectangles + live_rectangles, labels + [f'{lab} - Live' for lab in live_labels], handlelength=0.8,
                   handleheight=0.8, frameon=False, fontsize=8, ncol=len(labels), loc='upper right')
-        fig = ax.get_figure()
-        plt.xticks(rotation = 0,ha = 'center', fontsize = 8)
-        plt.yticks(fontsize = 8)
-        plt.xlabel("")
+        ax.tick_params(axis='both', labelsize=8)
+        ax.set_xlabel("")
         ax.axhline(y=0, color = 'black', linewidth = 0.5)
         ax.xaxis.set_major_formatter(DateFormatter("%b %Y"))
-        plt.setp(ax.spines.values(), color='#d5d5d5')
+        setp(ax.spines.values(), color='#d5d5d5')
         ax.spines['right'].set_visible(False)
         ax.spines['top'].set_visible(False)
-        plt.setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
-        plt.ylabel("")
-        plt.xlabel("")
+        setp([ax.get_xticklines(), ax.get_yticklines()], color='#d5d5d5')
+        ax.set_ylabel("")
+        ax.set_xlabel("")
         ax.set_axisbelow(True)
         ax.yaxis.grid(True, color = "#ececec")
         fig.set_size_inches(width, height)
-        base64 = self.fig_to_base64(name, fig)
-        plt.cla()
-        plt.clf()
-        plt.close('all')
-        return base64
+        return self.fig_to_base64(name, fig)
@@ -13,8 +13,12 @@
  * limitations under the License.
 */
 
+using System;
+using System.Linq;
+using Deedle;
 using Python.Runtime;
 using QuantConnect.Python;
+using QuantConnect.Configuration;
 
 
 namespace QuantConnect.Report.ReportElements
@@ -32,10 +36,50 @@ namespace QuantConnect.Report.ReportElements
 
             using (Py.GIL())
             {
+                if (Charting != null)
+                {
+                    // the charts instance is shared so the charts rendered by its process pool can be resolved once
+                    return;
+                }
+
                 dynamic module = Py.Import("ReportCharts");
                 var classObj = module.ReportCharts;
 
-                Charting = classObj.Invoke();
+                Charting = classObj.Invoke(Config.GetInt("report-chart-processes").ToPython());
+            }
+        }
+
+        /// <summary>
+        /// Appends the times and the values of the series to the list as numpy arrays
+        /// </summary>
+        /// <param name="list">The list of chart arguments</param>
+        /// <param name="series">The series to append</param>
+        /// <remarks>Requires the GIL to be held</remarks>
+        protected static void AppendSeries(PyList list, Series<DateTime, double> series)
+        {
+            var observations = series.Observations.ToList();
+
+            using var times = PandasData.ToNumpyArray(observations.Select(kvp => kvp.Key).ToList());
+            using var values = PandasData.ToNumpyArray(observations.Select(kvp => kvp.Value).ToArray());
+            list.Append(times);
+            list.Append(values);
+        }
+
+        /// <summary>
+        /// Replaces the placeholders of the charts rendered by the process pool with the rendered charts
+        /// </summary>
+        /// <param name="html">The report html containing the chart placeholders</param>
+        /// <returns>The report html with the rendered charts</returns>
+        internal static string ResolveCharts(string html)
+        {
+            if (Charting == null)
+            {
+                return html;
+            }
+
+            using (Py.GIL())
+            {
+                return (string)Charting.ResolveCharts(html);
             }
         }
     }
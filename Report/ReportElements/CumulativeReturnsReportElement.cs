@@ -130,15 +130,11 @@ namespace QuantConnect.Report.ReportElements
                 var liveCumulativePercent = finalSeries.Where(kvp => kvp.Key >= liveStart);
                 var liveBenchmarkCumulativePercent = finalBenchSeries.Where(kvp => kvp.Key >= liveBenchStart);
 
-                backtestList.Append(backtestCumulativePercent.Keys.ToList().ToPython());
-                backtestList.Append(backtestCumulativePercent.Values.ToList().ToPython());
-                backtestList.Append(backtestBenchmarkCumulativePercent.Keys.ToList().ToPython());
-                backtestList.Append(backtestBenchmarkCumulativePercent.Values.ToList().ToPython());
-
-                liveList.Append(liveCumulativePercent.Keys.ToList().ToPython());
-                liveList.Append(liveCumulativePercent.Values.ToList().ToPython());
-                liveList.Append(liveBenchmarkCumulativePercent.Keys.ToList().ToPython());
-                liveList.Append(liveBenchmarkCumulativePercent.Values.ToList().ToPython());
+                AppendSeries(backtestList, backtestCumulativePercent.Downsample());
+                AppendSeries(backtestList, backtestBenchmarkCumulativePercent.Downsample());
+
+                AppendSeries(liveList, liveCumulativePercent.Downsample());
+                AppendSeries(liveList, liveBenchmarkCumulativePercent.Downsample());
 
                 base64 = Charting.GetCumulativeReturns(backtestList, liveList);
             }
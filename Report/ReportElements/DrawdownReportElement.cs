@@ -61,23 +61,6 @@ namespace QuantConnect.Report.ReportElements
             var base64 = "";
             using (Py.GIL())
             {
-                var backtestList = new PyList();
-
-                if (liveUnderwaterPlot.IsEmpty)
-                {
-                    backtestList.Append(seriesUnderwaterPlot.Keys.ToList().ToPython());
-                    backtestList.Append(seriesUnderwaterPlot.Values.ToList().ToPython());
-                }
-                else
-                {
-                    backtestList.Append(seriesUnderwaterPlot.Before(liveUnderwaterPlot.FirstKey()).Keys.ToList().ToPython());
-                    backtestList.Append(seriesUnderwaterPlot.Before(liveUnderwaterPlot.FirstKey()).Values.ToList().ToPython());
-                }
-
-                var liveList = new PyList();
-                liveList.Append(liveUnderwaterPlot.Keys.ToList().ToPython());
-                liveList.Append(liveUnderwaterPlot.Values.ToList().ToPython());
-
                 var worstList = new PyList();
                 var previousDrawdownPeriods = new List<KeyValuePair<DateTime, DateTime>>();
 
@@ -98,6 +81,18 @@ namespace QuantConnect.Report.ReportElements
                     previousDrawdownPeriods.Add(new KeyValuePair<DateTime, DateTime>(group.Start, group.End));
                 }
 
+                // the worst drawdown periods are looked up by their start and end in the plotted series
+                var drawdownPeriodBounds = previousDrawdownPeriods.SelectMany(kvp => new[] { kvp.Key, kvp.Value }).ToHashSet();
+
+                var backtestList = new PyList();
+                var backtestUnderwaterPlot = liveUnderwaterPlot.IsEmpty
+                    ? seriesUnderwaterPlot
+                    : seriesUnderwaterPlot.Before(liveUnderwaterPlot.FirstKey());
+                AppendSeries(backtestList, backtestUnderwaterPlot.Downsample(keep: drawdownPeriodBounds));
+
+                var liveList = new PyList();
+                AppendSeries(liveList, liveUnderwaterPlot.Downsample(keep: drawdownPeriodBounds));
+
                 base64 = Charting.GetDrawdown(backtestList, liveList, worstList);
             }
 
@@ -70,15 +70,11 @@ namespace QuantConnect.Report.ReportElements
                 var backtestList = new PyList();
                 var liveList = new PyList();
 
-                backtestList.Append(backtestRollingSharpeSixMonths.Keys.ToList().ToPython());
-                backtestList.Append(backtestRollingSharpeSixMonths.Values.ToList().ToPython());
-                backtestList.Append(backtestRollingSharpeTwelveMonths.Keys.ToList().ToPython());
-                backtestList.Append(backtestRollingSharpeTwelveMonths.Values.ToList().ToPython());
+                AppendSeries(backtestList, backtestRollingSharpeSixMonths.Downsample());
+                AppendSeries(backtestList, backtestRollingSharpeTwelveMonths.Downsample());
 
-                liveList.Append(liveRollingSharpeSixMonths.Keys.ToList().ToPython());
-                liveList.Append(liveRollingSharpeSixMonths.Values.ToList().ToPython());
-                liveList.Append(liveRollingSharpeTwelveMonths.Keys.ToList().ToPython());
-                liveList.Append(liveRollingSharpeTwelveMonths.Values.ToList().ToPython());
+                AppendSeries(liveList, liveRollingSharpeSixMonths.Downsample());
+                AppendSeries(liveList, liveRollingSharpeTwelveMonths.Downsample());
 
                 base64 = Charting.GetRollingSharpeRatio(backtestList, liveList);
             }
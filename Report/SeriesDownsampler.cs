@@ -0,0 +1,118 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using Deedle;
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+namespace QuantConnect.Report
+{
+    /// <summary>
+    /// Reduces the number of points of the series plotted by the report charts
+    /// to what the rendered images can actually show
+    /// </summary>
+    public static class SeriesDownsampler
+    {
+        /// <summary>
+        /// Horizontal resolution of the widest report charts, 11.5 inches rendered at 200 dpi
+        /// </summary>
+        public const int DefaultBuckets = 2300;
+
+        /// <summary>
+        /// Downsamples the series by splitting its time span into equally sized buckets, one per pixel,
+        /// and keeping the minimum and maximum of each bucket. The first and last points are always kept,
+        /// so the shape of the curve and its extremes, such as the deepest drawdown, are preserved
+        /// </summary>
+        /// <param name="input">Series to downsample</param>
+        /// <param name="buckets">Number of time buckets</param>
+        /// <param name="keep">Times that must be kept in the output if they are in the input, e.g. the start of a drawdown period</param>
+        /// <returns>The downsampled series, or the input series if it already has less than two points per bucket</returns>
+        public static Series<DateTime, double> Downsample(this Series<DateTime, double> input, int buckets = DefaultBuckets, ICollection<DateTime> keep = null)
+        {
+            var observations = input.Observations.ToList();
+            if (observations.Count <= 2 * buckets)
+            {
+                return input;
+            }
+
+            var start = observations[0].Key.Ticks;
+            var span = (double)(observations[observations.Count - 1].Key.Ticks - start);
+            if (span <= 0)
+            {
+                return input;
+            }
+
+            var selected = new List<KeyValuePair<DateTime, double>>(2 * buckets + 2 + (keep?.Count ?? 0));
+            var indexes = new SortedSet<int>();
+            var bucketStart = 0;
+            var bucket = 0;
+
+            for (var i = 0; i <= observations.Count; i++)
+            {
+                var currentBucket = i == observations.Count
+                    ? int.MaxValue
+                    : (int)Math.Min(buckets - 1, (observations[i].Key.Ticks - start) / span * buckets);
+
+                if (currentBucket == bucket)
+                {
+                    continue;
+                }
+
+                // the bucket is complete, select its minimum and maximum in time order
+                var min = bucketStart;
+                var max = bucketStart;
+                for (var j = bucketStart; j < i; j++)
+                {
+                    var value = observations[j].Value;
+                    if (value < observations[min].Value)
+                    {
+                        min = j;
+                    }
+                    if (value > observations[max].Value)
+                    {
+                        max = j;
+                    }
+                    if (keep != null && keep.Contains(observations[j].Key))
+                    {
+                        indexes.Add(j);
+                    }
+                }
+
+                indexes.Add(min);
+                indexes.Add(max);
+                if (bucketStart == 0)
+                {
+                    indexes.Add(0);
+                }
+                if (i == observations.Count)
+                {
+                    indexes.Add(i - 1);
+                }
+
+                foreach (var index in indexes)
+                {
+                    selected.Add(observations[index]);
+                }
+
+                indexes.Clear();
+                bucketStart = i;
+                bucket = currentBucket;
+            }
+
+            return new Series<DateTime, double>(selected);
+        }
+    }
+}
@@ -0,0 +1,208 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+using Newtonsoft.Json.Serialization;
+using QuantConnect.Lean.Engine.Results;
+
+namespace QuantConnect.Report
+{
+    /// <summary>
+    /// Reads backtest and live result files as a stream, deserializing only the members, charts and series
+    /// used by the report elements and skipping everything else, so memory is bounded by what the report needs
+    /// instead of by the size of the file
+    /// </summary>
+    public static class StreamingResultReader
+    {
+        /// <summary>
+        /// The result members used by the report elements
+        /// </summary>
+        private static readonly HashSet<string> RequiredMembers = new()
+        {
+            nameof(Result.Charts),
+            nameof(Result.Orders),
+            nameof(Result.Statistics),
+            nameof(Result.AlgorithmConfiguration),
+            nameof(Result.TotalPerformance)
+        };
+
+        /// <summary>
+        /// The series used by the report elements keyed by chart name
+        /// </summary>
+        private static readonly Dictionary<string, HashSet<string>> RequiredSeries = new()
+        {
+            { BaseResultsHandler.StrategyEquityKey, new() { BaseResultsHandler.EquityKey, BaseResultsHandler.ReturnKey, "Daily Performance" } },
+            { BaseResultsHandler.BenchmarkKey, new() { BaseResultsHandler.BenchmarkKey } }
+        };
+
+        /// <summary>
+        /// Reads the result file
+        /// </summary>
+        /// <typeparam name="T">The result type, <see cref="BacktestResult"/> or <see cref="LiveResult"/></typeparam>
+        /// <param name="path">Path of the result json file</param>
+        /// <returns>The result holding the members used by the report, null if the file holds a null result</returns>
+        public static T Read<T>(string path)
+            where T : Result, new()
+        {
+            using var stream = new StreamReader(path);
+            return Read<T>(stream);
+        }
+
+        /// <summary>
+        /// Reads the result json
+        /// </summary>
+        /// <typeparam name="T">The result type, <see cref="BacktestResult"/> or <see cref="LiveResult"/></typeparam>
+        /// <param name="textReader">Reader of the result json</param>
+        /// <returns>The result holding the members used by the report, null if the json holds a null result</returns>
+        public static T Read<T>(TextReader textReader)
+            where T : Result, new()
+        {
+            var serializer = JsonSerializer.Create(new JsonSerializerSettings
+            {
+                Converters = new List<JsonConverter> { new OrderTypeNormalizingJsonConverter() },
+                FloatParseHandling = FloatParseHandling.Decimal,
+                NullValueHandling = NullValueHandling.Ignore
+            });
+            using var reader = new JsonTextReader(textReader) { FloatParseHandling = FloatParseHandling.Decimal };
+
+            if (!reader.Read() || reader.TokenType == JsonToken.Null)
+            {
+                return null;
+            }
+
+            var result = new T();
+            var contract = (JsonObjectContract)serializer.ContractResolver.ResolveContract(typeof(T));
+
+            while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+            {
+                var property = contract.Properties.GetClosestMatchProperty((string)reader.Value);
+                reader.Read();
+
+                if (property == null || !RequiredMembers.Contains(property.UnderlyingName))
+                {
+                    reader.Skip();
+                }
+                else if (property.UnderlyingName == nameof(Result.Charts))
+                {
+                    result.Charts = ReadCharts(reader, serializer);
+                }
+                else
+                {
+                    property.ValueProvider.SetValue(result, serializer.Deserialize(reader, property.PropertyType));
+                }
+            }
+
+            return result;
+        }
+
+        /// <summary>
+        /// Reads the required charts, keeping only their required series
+        /// </summary>
+        private static IDictionary<string, Chart> ReadCharts(JsonReader reader, JsonSerializer serializer)
+        {
+            if (reader.TokenType == JsonToken.Null)
+            {
+                return null;
+            }
+
+            var charts = new Dictionary<string, Chart>();
+            while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+            {
+                var chartName = (string)reader.Value;
+                reader.Read();
+
+                if (!RequiredSeries.TryGetValue(chartName, out var seriesNames) || reader.TokenType != JsonToken.StartObject)
+                {
+                    reader.Skip();
+                    continue;
+                }
+
+                var chart = new JObject();
+                while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+                {
+                    var propertyName = (string)reader.Value;
+                    reader.Read();
+
+                    if (string.Equals(propertyName, nameof(Chart.Series), StringComparison.OrdinalIgnoreCase))
+                    {
+                        chart[propertyName] = ReadSeries(reader, seriesNames);
+                    }
+                    else
+                    {
+                        chart[propertyName] = JToken.ReadFrom(reader);
+                    }
+                }
+
+                charts[chartName] = chart.ToObject<Chart>(serializer);
+            }
+
+            return charts;
+        }
+
+        /// <summary>
+        /// Reads the required series of a chart, removing their null points so they can be deserialized
+        /// </summary>
+        private static JToken ReadSeries(JsonReader reader, HashSet<string> seriesNames)
+        {
+            if (reader.TokenType != JsonToken.StartObject)
+            {
+                return JToken.ReadFrom(reader);
+            }
+
+            var series = new JObject();
+            while (reader.Read() && reader.TokenType == JsonToken.PropertyName)
+            {
+                var seriesName = (string)reader.Value;
+                reader.Read();
+
+                if (!seriesNames.Contains(seriesName))
+                {
+                    reader.Skip();
+                    continue;
+                }
+
+                var token = JToken.ReadFrom(reader);
+                var values = token["Values"] ?? token["values"];
+                if (values is JArray points)
+                {
+                    // null chart points and null candlesticks
+                    foreach (var point in points.Where(IsNullPoint).ToList())
+                    {
+                        point.Remove();
+                    }
+                }
+                series[seriesName] = token;
+            }
+
+            return series;
+        }
+
+        private static bool IsNullPoint(JToken point)
+        {
+            if (point is JObject jObject)
+            {
+                return jObject["x"] == null || jObject["x"].Value<long?>() == null ||
+                    jObject["y"] == null || jObject["y"].Value<decimal?>() == null;
+            }
+
+            return point is JArray jArray && jArray.Any(jToken => jToken.Type == JTokenType.Null);
+        }
+    }
+}
@@ -3326,6 +3326,39 @@ def getHistory(algorithm, symbol, period):
             }
         }
 
+        [Test]
+        public void PythonColumnarHistoryMatchesDataFrame()
+        {
+            var algorithm = GetAlgorithm(new DateTime(2013, 10, 8));
+            var symbol = algorithm.AddEquity("SPY", Resolution.Minute).Symbol;
+
+            using (Py.GIL())
+            {
+                PythonInitializer.Initialize();
+                algorithm.SetPandasConverter();
+
+                var testModule = PyModule.FromString("PythonColumnarHistoryMatchesDataFrame",
+                    @"
+from AlgorithmImports import *
+import numpy as np
+
+def assertColumnarHistory(algorithm, symbol):
+    data_frame = algorithm.history([symbol], 100, Resolution.MINUTE)
+    columnar = algorithm.history([symbol], 100, Resolution.MINUTE, format=HistoryFormat.COLUMNAR)
+
+    assert isinstance(columnar, dict), f'Expected a dict, found {type(columnar)}'
+    columns = columnar[symbol]
+    expected = data_frame.loc[symbol]
+    assert np.array_equal(columns['time'], expected.index.values), 'Unexpected times'
+    for column in expected.columns:
+        assert np.allclose(columns[column], expected[column].values, equal_nan=True), f'Unexpected values for {column}'
+");
+
+                dynamic assertColumnarHistory = testModule.GetAttr("assertColumnarHistory");
+                Assert.DoesNotThrow(() => assertColumnarHistory(algorithm, symbol));
+            }
+        }
+
         [Test]
         public void PythonUniverseHistoryDataFramesAreFlattened()
         {
@@ -378,6 +378,51 @@ class CustomSimpleMovingAverage(PythonIndicator):
             }
         }
 
+        [Test]
+        public void PythonCustomIndicatorWithoutBatchValuesCanBeWarmedUpWithResolution()
+        {
+            var referenceSymbol = Symbol.Create("IBM", SecurityType.Equity, Market.USA);
+            _algorithm.AddEquity(referenceSymbol);
+            _algorithm.SetDateTime(new DateTime(2013, 10, 11));
+            using (Py.GIL())
+            {
+                var testModule = PyModule.FromString(Guid.NewGuid().ToString(),
+                            @"
+from AlgorithmImports import *
+from collections import deque
+
+class CustomSimpleMovingAverage(PythonIndicator):
+    def __init__(self, name, period):
+        super().__init__()
+        self.warm_up_period = period
+        self.name = name
+        self.value = 0
+        self.queue = deque(maxlen=period)
+        self.batch_updates = 0
+
+    @property
+    def is_ready(self):
+        return len(self.queue) == self.queue.maxlen
+
+    def update(self, input):
+        self.queue.appendleft(input.value)
+        self.value = np.sum(self.queue) / len(self.queue)
+        return self.is_ready
+
+    # only the final state is kept, there's no value per input
+    def update_batch(self, times, opens, highs, lows, closes, volumes):
+        self.batch_updates += 1
+        self.queue.extendleft(closes)
+        self.value = np.sum(self.queue) / len(self.queue)
+        return None");
+
+                var customIndicator = testModule.GetAttr("CustomSimpleMovingAverage").Invoke("custom".ToPython(), 100.ToPython());
+                Assert.DoesNotThrow(() => _algorithm.WarmUpIndicator(referenceSymbol, customIndicator, Resolution.Minute));
+                Assert.IsTrue(customIndicator.GetAttr("is_ready").GetAndDispose<bool>());
+                Assert.AreEqual(1, customIndicator.GetAttr("batch_updates").GetAndDispose<int>());
+            }
+        }
+
         [TestCase("count")]
         [TestCase("StartAndEndDate")]
         public void IndicatorUpdatedWithSymbol(string testCase)
@@ -0,0 +1,73 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using NUnit.Framework;
+using Python.Runtime;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Alphas
+{
+    [TestFixture]
+    public class PearsonCorrelationPairsTradingAlphaModelTests
+    {
+        [TestCase(1, 0.1)]
+        [TestCase(2, 0.1)]
+        [TestCase(3, 0.5)]
+        [TestCase(4, 0.5)]
+        [TestCase(5, 0.99)]
+        public void ScreeningPicksTheSameBestPairAsThePairwisePearsonCorrelation(int seed, double minimumCorrelation)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(Guid.NewGuid().ToString(), @"
+from AlgorithmImports import *
+from scipy.stats import pearsonr
+from Alphas.PearsonCorrelationPairsTradingAlphaModel import PearsonCorrelationPairsTradingAlphaModel
+
+def get_best_pairs(seed, minimum_correlation):
+    tickers = ['AAPL', 'AIG', 'BAC', 'GOOG', 'IBM', 'SPY', 'QQQ', 'XLE']
+    symbols = sorted([Symbol.create(ticker, SecurityType.EQUITY, Market.USA) for ticker in tickers])
+
+    # log returns driven by a common factor with a different weight for each security
+    random = np.random.default_rng(seed)
+    market = random.normal(size=(100, 1))
+    returns = market * random.uniform(0, 2, len(symbols)) + random.normal(size=(100, len(symbols)))
+    df = pd.DataFrame(returns, columns=[str(symbol) for symbol in symbols])
+
+    # the screening with a pearsonr call per pair
+    expected = None
+    stop = len(df.columns)
+    corr = dict()
+    for i in range(0, stop):
+        for j in range(i+1, stop):
+            corr[(i, j)] = pearsonr(df.iloc[:,i], df.iloc[:,j])[0]
+    corr = sorted(corr.items(), key = lambda kv: kv[1])
+    if corr[-1][1] >= minimum_correlation:
+        expected = (symbols[corr[-1][0][0]], symbols[corr[-1][0][1]])
+
+    model = PearsonCorrelationPairsTradingAlphaModel(minimum_correlation=minimum_correlation)
+    model.set_correlation(symbols, df)
+    return str(expected), str(model.get_best_pair())
+");
+                var bestPairs = module.GetAttr("get_best_pairs").Invoke(seed.ToPython(), minimumCorrelation.ToPython());
+                var expected = bestPairs[0].As<string>();
+                var actual = bestPairs[1].As<string>();
+
+                Assert.AreEqual(expected, actual);
+                Assert.AreEqual(minimumCorrelation < 0.99, expected != "None");
+            }
+        }
+    }
+}
@@ -0,0 +1,94 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using QuantConnect.Algorithm.Framework;
+using QuantConnect.Data;
+using QuantConnect.Data.Consolidators;
+using QuantConnect.Data.Market;
+using QuantConnect.Indicators;
+
+namespace QuantConnect.Tests.Algorithm.Framework
+{
+    [TestFixture]
+    public class IndicatorsWarmUpTests
+    {
+        [Test]
+        public void WarmsUpIndicatorsAndConsolidatorsOfEachSymbol()
+        {
+            var reference = new DateTime(2020, 1, 1);
+            var history = Enumerable.Range(0, 5).Select(i =>
+            {
+                var time = reference.AddDays(i);
+                var data = new List<BaseData>
+                {
+                    new TradeBar(time, Symbols.SPY, 100 + i, 100 + i, 100 + i, 100 + i, 1000, Time.OneDay),
+                    new QuoteBar(time, Symbols.EURUSD, new Bar(1 + i, 1 + i, 1 + i, 1 + i), 0, null, 0, Time.OneDay)
+                };
+                // AAPL has no data on the first day
+                if (i > 0)
+                {
+                    data.Add(new TradeBar(time, Symbols.AAPL, 10 * i, 10 * i, 10 * i, 10 * i, 1000, Time.OneDay));
+                }
+                return new Slice(time.AddDays(1), data, time.AddDays(1));
+            }).ToList();
+
+            var spy = new RateOfChange(4);
+            var eurusd = new SimpleMovingAverage(5);
+            var aaplConsolidator = new TradeBarConsolidator(1);
+            var aapl = new Maximum(3);
+            aaplConsolidator.DataConsolidated += (_, bar) => aapl.Update(bar.EndTime, bar.High);
+
+            var warmUp = new IndicatorsWarmUp()
+                .Add(Symbols.SPY, spy)
+                .Add(Symbols.EURUSD, eurusd)
+                .Add(Symbols.AAPL, aaplConsolidator)
+                .Add(Symbols.IBM, new SimpleMovingAverage(2));
+
+            var warmedUp = warmUp.WarmUp(history);
+
+            CollectionAssert.AreEquivalent(new[] { Symbols.SPY, Symbols.EURUSD, Symbols.AAPL }, warmedUp);
+
+            Assert.IsTrue(spy.IsReady);
+            Assert.AreEqual(104m / 100m - 1, spy.Current.Value);
+            Assert.AreEqual(reference.AddDays(5), spy.Current.EndTime);
+
+            Assert.IsTrue(eurusd.IsReady);
+            Assert.AreEqual(3m, eurusd.Current.Value);
+
+            Assert.IsTrue(aapl.IsReady);
+            Assert.AreEqual(4, aapl.Samples);
+            Assert.AreEqual(40m, aapl.Current.Value);
+        }
+
+        [Test]
+        public void SelectorPicksTheIndicatorInput()
+        {
+            var time = new DateTime(2020, 1, 1);
+            var history = new[]
+            {
+                new Slice(time, new BaseData[] { new TradeBar(time, Symbols.SPY, 1, 4, 0.5m, 2, 1000, Time.OneDay) }, time)
+            };
+
+            var identity = new Identity("high");
+            new IndicatorsWarmUp().Add(Symbols.SPY, identity, bar => ((TradeBar)bar).High).WarmUp(history);
+
+            Assert.AreEqual(4m, identity.Current.Value);
+        }
+    }
+}
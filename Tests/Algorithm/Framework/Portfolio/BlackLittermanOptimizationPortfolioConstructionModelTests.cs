@@ -92,6 +92,26 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.AreEqual(0, actualTargets.Count());
         }
 
+        [Test]
+        public void InsightSymbolsWithoutDataAreNotKept()
+        {
+            using (Py.GIL())
+            {
+                var name = nameof(BLOPCM);
+                var instance = PyModule.FromString(name, GetPythonBLOPCM()).GetAttr(name).Invoke(((int)PortfolioBias.LongShort).ToPython());
+                _algorithm.SetPortfolioConstruction(new PortfolioConstructionModelPythonWrapper(instance));
+
+                // the model ignores the security changes, so every insight symbol is unknown to it
+                Clear();
+                _algorithm.Insights.AddRange(_view1Insights);
+                var actualTargets = _algorithm.PortfolioConstruction.CreateTargets(_algorithm, _view1Insights);
+
+                Assert.AreEqual(_view1Insights.Length, actualTargets.Count());
+                Assert.AreEqual(0, instance.GetAttr("symbol_data_by_symbol").Length());
+                Assert.AreEqual(0, instance.GetAttr("moments").GetAttr("_windows").Length());
+            }
+        }
+
         [Test]
         [TestCase(Language.CSharp)]
         [TestCase(Language.Python)]
@@ -14,6 +14,7 @@
 */
 
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Algorithm.Framework.Portfolio;
 using System;
 using System.Collections.Generic;
@@ -177,5 +178,108 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
 
             Assert.AreEqual(expectedResult, result);
         }
+
+        [Test]
+        public void PythonClosedFormMatchesSlsqpWhenNoBoundIsActive()
+        {
+            using (Py.GIL())
+            {
+                var module = GetPythonTestModule();
+                var closedForm = module.GetAttr("optimize").Invoke(true.ToPython(), false.ToPython(), (-1).ToPython(), 1.ToPython());
+                var slsqp = module.GetAttr("optimize").Invoke(false.ToPython(), false.ToPython(), (-1).ToPython(), 1.ToPython());
+
+                // the exact solution is used, which is the C# optimizer one, SLSQP stops within its tolerance
+                Assert.IsTrue(module.GetAttr("has_closed_form_solution").Invoke((-1).ToPython(), 1.ToPython()).As<bool>());
+                var expected = ExpectedResults[0];
+                for (var i = 0; i < expected.Length; i++)
+                {
+                    Assert.AreEqual(slsqp[i].As<double>(), closedForm[i].As<double>(), 1e-3);
+                    Assert.AreEqual(expected[i], closedForm[i].As<double>(), 1e-6);
+                }
+            }
+        }
+
+        [Test]
+        public void PythonClosedFormFallsBackToSlsqpWhenABoundIsActive()
+        {
+            using (Py.GIL())
+            {
+                var module = GetPythonTestModule();
+                var closedForm = module.GetAttr("optimize").Invoke(true.ToPython(), false.ToPython(), (-1).ToPython(), 0.5.ToPython());
+                var slsqp = module.GetAttr("optimize").Invoke(false.ToPython(), false.ToPython(), (-1).ToPython(), 0.5.ToPython());
+
+                // the exact solution of the problem without bounds has a weight above the maximum
+                Assert.IsFalse(module.GetAttr("has_closed_form_solution").Invoke((-1).ToPython(), 0.5.ToPython()).As<bool>());
+                // a solution was found, it's not the equal weights
+                Assert.Less(closedForm[2].As<double>(), 0);
+                for (var i = 0; i < 4; i++)
+                {
+                    var weight = closedForm[i].As<double>();
+                    Assert.AreEqual(slsqp[i].As<double>(), weight, 1e-6);
+                    Assert.GreaterOrEqual(Math.Round(weight, 6), -1);
+                    Assert.LessOrEqual(Math.Round(weight, 6), 0.5);
+                }
+            }
+        }
+
+        [Test]
+        public void PythonWarmStartReusesThePreviousSolutionOfTheSameAssets()
+        {
+            using (Py.GIL())
+            {
+                var module = GetPythonTestModule();
+                // initial guess and solution of each optimization, of the assets: A, B, C, D; A, B, C, D; A, B, C, E
+                var guesses = module.GetAttr("get_warm_start_initial_guesses").Invoke();
+
+                var uniform = new[] { 0.25, 0.25, 0.25, 0.25 };
+                Assert.AreEqual(uniform, guesses[0][0].As<double[]>());
+                Assert.AreEqual(guesses[0][1].As<double[]>(), guesses[1][0].As<double[]>());
+                Assert.AreEqual(uniform, guesses[2][0].As<double[]>());
+            }
+        }
+
+        private static PyModule GetPythonTestModule()
+        {
+            return PyModule.FromString(Guid.NewGuid().ToString(), @"
+from AlgorithmImports import *
+import Portfolio.MinimumVariancePortfolioOptimizer as optimizer_module
+from Portfolio.MinimumVariancePortfolioOptimizer import MinimumVariancePortfolioOptimizer
+
+historical_returns = pd.DataFrame([[0.76, -0.06, 1.22, 0.17], [0.02, 0.28, 1.25, -0.00], [-0.50, -0.13, -0.50, -0.03], [0.81, 0.31, 2.39, 0.26], [-0.02, 0.02, 0.06, 0.01]],
+    columns=['A', 'B', 'C', 'D'])
+expected_returns = pd.Series([0.21, 0.08, 0.88, 0.08], index=historical_returns.columns)
+covariance = pd.DataFrame([[0.31, 0.05, 0.55, 0.07], [0.05, 0.04, 0.18, 0.01], [0.55, 0.18, 1.28, 0.12], [0.07, 0.01, 0.12, 0.02]],
+    index=historical_returns.columns, columns=historical_returns.columns)
+
+def optimize(closed_form, warm_start, minimum_weight, maximum_weight):
+    optimizer = MinimumVariancePortfolioOptimizer(minimum_weight, maximum_weight, closed_form=closed_form, warm_start=warm_start)
+    return [float(x) for x in optimizer.optimize(historical_returns, expected_returns, covariance)]
+
+def has_closed_form_solution(minimum_weight, maximum_weight):
+    optimizer = MinimumVariancePortfolioOptimizer(minimum_weight, maximum_weight)
+    return optimizer.get_closed_form_solution(expected_returns.values, covariance.values) is not None
+
+def get_warm_start_initial_guesses():
+    guesses = []
+    minimize = optimizer_module.minimize
+    def recording_minimize(fun, x0, **kwargs):
+        result = minimize(fun, x0, **kwargs)
+        guesses.append(([float(x) for x in x0], [float(x) for x in result['x']]))
+        return result
+
+    optimizer_module.minimize = recording_minimize
+    try:
+        optimizer = MinimumVariancePortfolioOptimizer(warm_start=True)
+        optimizer.optimize(historical_returns, expected_returns, covariance)
+        optimizer.optimize(historical_returns, expected_returns, covariance)
+        # a different basket of the same size starts from the uniform weights
+        other_assets = ['A', 'B', 'C', 'E']
+        optimizer.optimize(historical_returns.set_axis(other_assets, axis=1),
+            expected_returns.set_axis(other_assets), covariance.set_axis(other_assets, axis=0).set_axis(other_assets, axis=1))
+    finally:
+        optimizer_module.minimize = minimize
+    return guesses
+");
+        }
     }
 }
@@ -109,6 +109,108 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.AreEqual(expected, actual, 0.000001);
         }
 
+        [Test]
+        public void RollingReturnsMomentsMatchPandasDataFrame()
+        {
+            var code = @"
+import numpy as np
+import pandas as pd
+from Portfolio.RollingReturnsMoments import RollingReturnsMoments
+
+def Compare():
+    period = 5
+    moments = RollingReturnsMoments(period)
+    windows = {}
+    random = np.random.default_rng(7)
+
+    for time in range(100):
+        for key in ['A', 'B', 'C', 'D']:
+            # missing values and misaligned times
+            if random.random() < 0.2:
+                continue
+            value_time = time if random.random() < 0.9 else time + 0.5
+            value = random.normal(0.001, 0.02)
+            moments.add(key, value_time, value)
+
+            window = windows.setdefault(key, {})
+            window[value_time] = value
+            if len(window) > period:
+                del window[min(window)]
+
+        if time == 50:
+            moments.remove('C')
+            windows.pop('C')
+
+    keys = list(windows)
+    returns = pd.DataFrame({ key: pd.Series(window) for key, window in windows.items() }).sort_index()
+
+    return (np.allclose(moments.covariance(keys), returns.cov().values, equal_nan=True)
+        and np.allclose(moments.mean(keys), returns.mean().values, equal_nan=True)
+        and np.allclose(moments.returns(keys).values, returns.values, equal_nan=True))";
+
+            using (Py.GIL())
+            {
+                dynamic compare = PyModule.FromString("RollingReturnsMomentsMatchPandasDataFrame", code).GetAttr("Compare");
+                Assert.IsTrue((bool)compare());
+            }
+        }
+
+        [Test]
+        public void RollingReturnsMomentsMatchPandasDataFrameAfterEachChange()
+        {
+            var code = @"
+import numpy as np
+import pandas as pd
+from Portfolio.RollingReturnsMoments import RollingReturnsMoments
+
+def Compare():
+    period = 5
+    moments = RollingReturnsMoments(period)
+    windows = {}
+    random = np.random.default_rng(11)
+
+    for time in range(300):
+        for key in ['A', 'B', 'C', 'D', 'E']:
+            draw = random.random()
+            if draw < 0.2:
+                continue
+            # removed securities can be added back later
+            if draw < 0.23:
+                moments.remove(key)
+                windows.pop(key, None)
+                continue
+
+            window = windows.setdefault(key, {})
+            value_time = time if random.random() < 0.9 else time + 0.5
+            # a return for a time already in the window replaces it
+            if window and random.random() < 0.05:
+                value_time = max(window)
+            value = random.normal(0.001, 0.02)
+            moments.add(key, value_time, value)
+
+            window[value_time] = value
+            if len(window) > period:
+                del window[min(window)]
+
+        keys = list(windows)
+        if not keys:
+            continue
+        returns = pd.DataFrame({ key: pd.Series(window, dtype = float) for key, window in windows.items() }).sort_index()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            expected_covariance = returns.cov().values
+        if not (np.allclose(moments.covariance(keys), expected_covariance, equal_nan=True)
+            and np.allclose(moments.mean(keys), returns.mean().values, equal_nan=True)
+            and np.allclose(moments.returns(keys).values, returns.values, equal_nan=True)):
+            return False
+    return True";
+
+            using (Py.GIL())
+            {
+                dynamic compare = PyModule.FromString("RollingReturnsMomentsMatchPandasDataFrameAfterEachChange", code).GetAttr("Compare");
+                Assert.IsTrue((bool)compare());
+            }
+        }
+
         [Test]
         public void DuplicateKeyPortfolioConstructionModelDoesNotThrow()
         {
@@ -18,6 +18,7 @@ using System.Collections.Generic;
 using System.Linq;
 using Accord.Math;
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Algorithm.Framework.Portfolio;
 
 namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
@@ -136,6 +137,131 @@ namespace QuantConnect.Tests.Algorithm.Framework.Portfolio
             Assert.AreEqual(expected, result);
         }
 
+        [Test]
+        public void PythonOptimizerEqualizesTheRiskContributions(
+            [Range(1, 8)] int testCaseNumber,
+            [Values("newton-cg", "coordinate-descent")] string method)
+        {
+            using (Py.GIL())
+            {
+                var module = GetPythonTestModule();
+                var covariance = _covariances[testCaseNumber];
+                var budget = _riskBudgets[testCaseNumber];
+
+                // only the covariance is given, there are no historical returns
+                var result = module.GetAttr("optimize").Invoke(covariance.ToPython(), budget.ToPython(), method.ToPython()).As<double[]>();
+
+                var variance = result.Select((x, i) => x * covariance[i].Dot(result)).ToArray();
+                for (var i = 0; i < result.Length; i++)
+                {
+                    Assert.AreEqual(budget[i], variance[i] / variance.Sum(), 1e-6);
+                }
+
+                // the weights of the Newton-CG with the Hessian matrix, before the Hessian-vector products
+                var expected = module.GetAttr("optimize_with_hessian").Invoke(covariance.ToPython(), budget.ToPython()).As<double[]>();
+                for (var i = 0; i < result.Length; i++)
+                {
+                    Assert.AreEqual(expected[i], result[i], 1e-6);
+                }
+            }
+        }
+
+        [Test]
+        public void PythonOptimizerWarmStartReusesThePreviousSolutionOfTheSameAssets([Values("newton-cg", "coordinate-descent")] string method)
+        {
+            using (Py.GIL())
+            {
+                var module = GetPythonTestModule();
+                // initial guess and solution of each optimization, of the assets: A, B, C; A, B, C; A, B, D
+                var guesses = module.GetAttr("get_warm_start_initial_guesses").Invoke(method.ToPython());
+
+                var uniform = Enumerable.Repeat(1d / 3, 3).ToArray();
+                Assert.AreEqual(3, guesses.Length());
+                Assert.AreEqual(uniform, guesses[0][0].As<double[]>());
+                Assert.AreEqual(guesses[0][1].As<double[]>(), guesses[1][0].As<double[]>());
+                Assert.AreEqual(uniform, guesses[2][0].As<double[]>());
+            }
+        }
+
+        [Test]
+        public void PythonCoordinateDescentWeightsAreKeptIfNewtonCGFails()
+        {
+            using (Py.GIL())
+            {
+                var module = GetPythonTestModule();
+                var covariance = _covariances[3];
+                var budget = _riskBudgets[3];
+
+                // a single cycle doesn't converge, and the Newton-CG refinement fails
+                var result = module.GetAttr("optimize_without_newton_cg").Invoke(covariance.ToPython(), budget.ToPython()).As<double[]>();
+
+                // the weights aren't the equal weights, they moved towards the solution
+                var expected = _expectedResults[3];
+                for (var i = 0; i < result.Length; i++)
+                {
+                    var weight = expected[i] / expected.Sum();
+                    Assert.Less(Math.Abs(weight - result[i]), Math.Abs(weight - 0.5));
+                }
+            }
+        }
+
+        private static PyModule GetPythonTestModule()
+        {
+            return PyModule.FromString(Guid.NewGuid().ToString(), @"
+from AlgorithmImports import *
+from scipy.optimize import minimize
+from Portfolio.RiskParityPortfolioOptimizer import RiskParityPortfolioOptimizer
+
+def optimize(covariance, budget, method):
+    optimizer = RiskParityPortfolioOptimizer(method=method)
+    return [float(x) for x in optimizer.optimize(None, budget, np.array(covariance, dtype=float))]
+
+def optimize_with_hessian(covariance, budget):
+    covariance = np.array(covariance, dtype=float)
+    budget = np.array(budget, dtype=float)
+    objective = lambda weights: 0.5 * weights.T @ covariance @ weights - budget.T @ np.log(weights)
+    gradient = lambda weights: covariance @ weights - budget / weights
+    hessian = lambda weights: covariance + np.diag((budget / weights**2).flatten())
+    x0 = np.array(len(budget) * [1. / len(budget)])
+    solver = minimize(objective, jac=gradient, hess=hessian, x0=x0, method='Newton-CG')
+    return [float(x) for x in solver['x'] / np.sum(solver['x'])]
+
+class RecordingRiskParityPortfolioOptimizer(RiskParityPortfolioOptimizer):
+    def __init__(self, method):
+        super().__init__(method=method, warm_start=True)
+        self.guesses = []
+
+    def newton_cg(self, covariance, budget, x0):
+        solution = super().newton_cg(covariance, budget, x0)
+        self.guesses.append(([float(x) for x in x0], [float(x) for x in solution]))
+        return solution
+
+    def coordinate_descent(self, covariance, budget, x0):
+        solution, converged = super().coordinate_descent(covariance, budget, x0)
+        self.guesses.append(([float(x) for x in x0], [float(x) for x in solution]))
+        return solution, converged
+
+def get_warm_start_initial_guesses(method):
+    optimizer = RecordingRiskParityPortfolioOptimizer(method)
+    covariance = pd.DataFrame([[0.25, 0.05, 0.01], [0.05, 0.04, 0.02], [0.01, 0.02, 0.09]], index=['A', 'B', 'C'], columns=['A', 'B', 'C'])
+    optimizer.optimize(None, covariance=covariance)
+    optimizer.optimize(None, covariance=covariance)
+    # a different basket of the same size starts from the equal weights
+    other_assets = ['A', 'B', 'D']
+    optimizer.optimize(None, covariance=covariance.set_axis(other_assets, axis=0).set_axis(other_assets, axis=1))
+    return optimizer.guesses
+
+class FailingNewtonCGRiskParityPortfolioOptimizer(RiskParityPortfolioOptimizer):
+    def newton_cg(self, covariance, budget, x0):
+        return None
+
+def optimize_without_newton_cg(covariance, budget):
+    optimizer = FailingNewtonCGRiskParityPortfolioOptimizer(method=RiskParityPortfolioOptimizer.COORDINATE_DESCENT)
+    optimizer.maximum_iterations = 1
+    return [float(x) for x in optimizer.optimize(None, budget, np.array(covariance, dtype=float))]
+");
+        }
+
         private T[,] JaggedArrayTo2DArray<T>(T[][] source)
         {
             int FirstDim = source.Length;
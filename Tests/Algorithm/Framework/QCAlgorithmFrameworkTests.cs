@@ -17,12 +17,14 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using NUnit.Framework;
+using Python.Runtime;
 using QuantConnect.Algorithm;
 using QuantConnect.Algorithm.Framework.Alphas;
 using QuantConnect.Algorithm.Framework.Portfolio;
 using QuantConnect.Algorithm.Framework.Selection;
 using QuantConnect.Data;
 using QuantConnect.Data.Market;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
 using QuantConnect.Tests.Common.Securities;
 using QuantConnect.Tests.Engine.DataFeeds;
 
@@ -112,6 +114,108 @@ namespace QuantConnect.Tests.Algorithm.Framework
             Assert.AreEqual(expectedCount, actualInsights.Count);
         }
 
+        [Test]
+        public void PythonModelsGiveTheSameResultsInASingleGilScope()
+        {
+            var (insights, executedTargets, changes) = RunPythonModels(false);
+            var (singleScopeInsights, singleScopeExecutedTargets, singleScopeChanges) = RunPythonModels(true);
+
+            Assert.AreEqual(1, insights.Count);
+            CollectionAssert.AreEqual(insights, singleScopeInsights);
+            // the risk management model halves the portfolio construction targets
+            Assert.AreEqual(1, executedTargets.Count);
+            CollectionAssert.AreEqual(executedTargets, singleScopeExecutedTargets);
+            Assert.AreEqual(4, changes);
+            Assert.AreEqual(changes, singleScopeChanges);
+        }
+
+        private static (List<string> Insights, List<string> ExecutedTargets, int Changes) RunPythonModels(bool frameworkPipelineSingleGilScope)
+        {
+            var algo = new QCAlgorithm();
+            algo.Settings.FrameworkPipelineSingleGilScope = frameworkPipelineSingleGilScope;
+            algo.SubscriptionManager.SetDataManager(new DataManagerStub(algo));
+            algo.Transactions.SetOrderProcessor(new FakeOrderProcessor());
+            var insights = new List<string>();
+            algo.InsightsGenerated += (algorithm, data) => insights.AddRange(data.Insights.Select(x => $"{x.Symbol} {x.Direction} {x.Period}"));
+            var security = algo.AddEquity("SPY");
+            algo.SetUniverseSelection(new ManualUniverseSelectionModel());
+
+            List<PyObject> models;
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString("PythonFrameworkModels", @"
+from AlgorithmImports import *
+
+class TestAlpha(AlphaModel):
+    def __init__(self):
+        self.changes = 0
+
+    def update(self, algorithm, data):
+        return [Insight.price(symbol, timedelta(1), InsightDirection.UP) for symbol in data.keys()]
+
+    def on_securities_changed(self, algorithm, changes):
+        self.changes += 1
+
+class TestPortfolioConstruction(PortfolioConstructionModel):
+    def __init__(self):
+        super().__init__()
+        self.changes = 0
+
+    def create_targets(self, algorithm, insights):
+        return [PortfolioTarget(insight.symbol, 10) for insight in insights]
+
+    def on_securities_changed(self, algorithm, changes):
+        self.changes += 1
+
+class TestRiskManagement(RiskManagementModel):
+    def __init__(self):
+        self.changes = 0
+
+    def manage_risk(self, algorithm, targets):
+        return [PortfolioTarget(target.symbol, target.quantity / 2) for target in targets]
+
+    def on_securities_changed(self, algorithm, changes):
+        self.changes += 1
+
+class TestExecution(ExecutionModel):
+    def __init__(self):
+        self.executed_targets = []
+        self.changes = 0
+
+    def execute(self, algorithm, targets):
+        self.executed_targets.extend([f'{target.symbol} {target.quantity}' for target in targets])
+
+    def on_securities_changed(self, algorithm, changes):
+        self.changes += 1
+");
+                models = new[] { "TestAlpha", "TestPortfolioConstruction", "TestRiskManagement", "TestExecution" }
+                    .Select(name => module.GetAttr(name).Invoke())
+                    .ToList();
+                algo.SetAlpha(models[0]);
+                algo.SetPortfolioConstruction(models[1]);
+                algo.SetRiskManagement(models[2]);
+                algo.SetExecution(models[3]);
+            }
+
+            var tick = new Tick
+            {
+                Symbol = security.Symbol,
+                Value = 1,
+                Quantity = 2
+            };
+            security.SetMarketPrice(tick);
+
+            // the pipeline runs without the GIL held by the caller, the single scope acquires it
+            algo.OnFrameworkSecuritiesChanged(SecurityChangesTests.AddedNonInternal(security));
+            algo.OnFrameworkData(new Slice(new DateTime(2000, 01, 01), algo.Securities.Select(s => tick), new DateTime(2000, 01, 01)));
+
+            using (Py.GIL())
+            {
+                // each model counts the security changes it got
+                return (insights, models[3].GetAttr("executed_targets").As<List<string>>(), models.Sum(x => x.GetAttr("changes").As<int>()));
+            }
+        }
+
         class FakeAlpha : AlphaModel
         {
             public override IEnumerable<Insight> Update(QCAlgorithm algorithm, Slice data)
@@ -0,0 +1,146 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NUnit.Framework;
+using Python.Runtime;
+using QuantConnect.Algorithm;
+using QuantConnect.Algorithm.Framework.Portfolio;
+using QuantConnect.Algorithm.Framework.Risk;
+using QuantConnect.Data.Fundamental;
+using QuantConnect.Data.Market;
+using QuantConnect.Data.UniverseSelection;
+using QuantConnect.Securities;
+using QuantConnect.Tests.Common.Data.Fundamental;
+using QuantConnect.Tests.Common.Data.UniverseSelection;
+using QuantConnect.Tests.Engine.DataFeeds;
+
+namespace QuantConnect.Tests.Algorithm.Framework.Risk
+{
+    [TestFixture]
+    public class MaximumSectorExposureRiskManagementModelTests
+    {
+        [SetUp]
+        public void SetUp()
+        {
+            // AAPL and IBM are in the 'N' sector, AIG in the 'I' sector
+            FundamentalService.Initialize(TestGlobals.DataProvider, new TestFundamentalDataProvider(), false);
+        }
+
+        [TearDown]
+        public void TearDown()
+        {
+            FundamentalService.Initialize(TestGlobals.DataProvider, new NullFundamentalDataProvider(), false);
+        }
+
+        [Test]
+        public void PythonModelReturnsTheSameTargetsAsTheCSharpModel()
+        {
+            var expected = RunScenario(Language.CSharp);
+            var actual = RunScenario(Language.Python);
+
+            // the sectors exceed the maximum exposure in most steps
+            Assert.Greater(expected.Count(x => x.Count > 0), 3);
+            Assert.AreEqual(expected.Count, actual.Count);
+            for (var step = 0; step < expected.Count; step++)
+            {
+                Assert.AreEqual(expected[step].Select(x => x.Symbol), actual[step].Select(x => x.Symbol), $"Step {step}");
+                for (var i = 0; i < expected[step].Count; i++)
+                {
+                    Assert.AreEqual((double)expected[step][i].Quantity, (double)actual[step][i].Quantity, 1e-6, $"Step {step}");
+                }
+            }
+        }
+
+        private static List<List<IPortfolioTarget>> RunScenario(Language language)
+        {
+            var algorithm = new AlgorithmStub();
+            algorithm.SetDateTime(new DateTime(2014, 6, 5, 14, 0, 0).ConvertToUtc(TimeZones.NewYork));
+            algorithm.SetCash(100000);
+            SetRiskManagement(algorithm, language);
+
+            var aapl = algorithm.AddEquity("AAPL");
+            var ibm = algorithm.AddEquity("IBM");
+            var aig = algorithm.AddEquity("AIG");
+            SetPrice(aapl, 100);
+            SetPrice(ibm, 50);
+            SetPrice(aig, 40);
+
+            var universe = algorithm.UniverseManager.Values.OfType<UserDefinedUniverse>().Single();
+            foreach (var security in new[] { aapl, ibm, aig })
+            {
+                universe.AddMember(algorithm.UtcTime, security, false);
+            }
+            algorithm.RiskManagement.OnSecuritiesChanged(algorithm, SecurityChangesTests.AddedNonInternal(aapl, ibm, aig));
+
+            var results = new List<List<IPortfolioTarget>>();
+            void ManageRisk(params IPortfolioTarget[] targets)
+            {
+                algorithm.Portfolio.InvalidateTotalPortfolioValue();
+                results.Add(algorithm.RiskManagement.ManageRisk(algorithm, targets).OrderBy(x => x.Symbol).ToList());
+            }
+
+            // the targets of the 'N' sector exceed the maximum exposure
+            ManageRisk(new PortfolioTarget(aapl.Symbol, 150), new PortfolioTarget(ibm.Symbol, 200));
+
+            // a fill without a target puts the 'I' sector over the maximum exposure
+            aig.Holdings.SetHoldings(40, 700);
+            ManageRisk();
+
+            // a new target replaces the previous one
+            ManageRisk(new PortfolioTarget(ibm.Symbol, 400));
+
+            // the prices move
+            SetPrice(aapl, 80);
+            SetPrice(aig, 30);
+            ManageRisk();
+
+            // the removed security no longer counts in its sector
+            Assert.IsTrue(universe.RemoveMember(algorithm.UtcTime, ibm));
+            algorithm.RiskManagement.OnSecuritiesChanged(algorithm, SecurityChangesTests.RemovedNonInternal(ibm));
+            ManageRisk();
+
+            // the fill closes the position, and the target closes the other one
+            aig.Holdings.SetHoldings(30, 0);
+            ManageRisk(new PortfolioTarget(aapl.Symbol, 0));
+
+            return results;
+        }
+
+        private static void SetRiskManagement(QCAlgorithm algorithm, Language language)
+        {
+            if (language == Language.CSharp)
+            {
+                algorithm.SetRiskManagement(new MaximumSectorExposureRiskManagementModel());
+                return;
+            }
+
+            using (Py.GIL())
+            {
+                const string name = nameof(MaximumSectorExposureRiskManagementModel);
+                var instance = Py.Import(name).GetAttr(name).Invoke();
+                algorithm.SetRiskManagement(new RiskManagementModelPythonWrapper(instance));
+            }
+        }
+
+        private static void SetPrice(Security security, decimal price)
+        {
+            security.SetMarketPrice(new TradeBar(security.LocalTime, security.Symbol, price, price, price, price, 100));
+        }
+    }
+}
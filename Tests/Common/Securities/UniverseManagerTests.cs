@@ -103,9 +103,44 @@ namespace QuantConnect.Tests.Common.Securities
             manager.Remove(universe.Configuration.Symbol);
         }
 
-        private SubscriptionDataConfig CreateTradeBarConfig()
+        [Test]
+        public void TracksMembershipAcrossUniverses()
+        {
+            var manager = new UniverseManager();
+            var settings = new UniverseSettings(Resolution.Minute, 2, true, false, TimeSpan.Zero);
+            var universe1 = new FuncUniverse(CreateTradeBarConfig(), settings, data => data.Select(x => x.Symbol));
+            var universe2 = new FuncUniverse(CreateTradeBarConfig(Symbols.AAPL), settings, data => data.Select(x => x.Symbol));
+            var security = new Security(
+                SecurityExchangeHours.AlwaysOpen(TimeZones.NewYork),
+                CreateTradeBarConfig(Symbols.IBM),
+                new Cash(Currencies.USD, 0, 1m),
+                SymbolProperties.GetDefault(Currencies.USD),
+                ErrorCurrencyConverter.Instance,
+                RegisteredSecurityDataTypesProvider.Null,
+                new SecurityCache());
+
+            // members added before the universe is registered are indexed on add
+            universe1.AddMember(DateTime.UtcNow, security, false);
+            manager.Add(universe1.Configuration.Symbol, universe1);
+            manager.Add(universe2.Configuration.Symbol, universe2);
+            universe2.AddMember(DateTime.UtcNow, security, false);
+            manager.UpdateMembership(universe2, security.Symbol);
+
+            Assert.IsTrue(manager.ContainsMember(security.Symbol));
+            CollectionAssert.AreEquivalent(new[] { universe1, universe2 }, manager.GetMemberUniverses(security.Symbol));
+
+            manager.Remove(universe1.Configuration.Symbol);
+            Assert.IsTrue(manager.ContainsMember(security.Symbol));
+            CollectionAssert.AreEquivalent(new[] { universe2 }, manager.GetMemberUniverses(security.Symbol));
+
+            manager.Remove(universe2.Configuration.Symbol);
+            Assert.IsFalse(manager.ContainsMember(security.Symbol));
+            Assert.IsEmpty(manager.GetMemberUniverses(security.Symbol));
+        }
+
+        private SubscriptionDataConfig CreateTradeBarConfig(Symbol symbol = null)
         {
-            return new SubscriptionDataConfig(typeof(TradeBar), Symbols.SPY, Resolution.Minute, TimeZones.NewYork, TimeZones.NewYork, false, false, true);
+            return new SubscriptionDataConfig(typeof(TradeBar), symbol ?? Symbols.SPY, Resolution.Minute, TimeZones.NewYork, TimeZones.NewYork, false, false, true);
         }
     }
 }
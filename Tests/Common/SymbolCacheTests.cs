@@ -15,6 +15,7 @@
 */
 
 using System;
+using System.Runtime.InteropServices;
 using NUnit.Framework;
 using QuantConnect.Data.Custom.IconicTypes;
 using Bitcoin = QuantConnect.Algorithm.CSharp.LiveTradingFeaturesAlgorithm.Bitcoin;
@@ -57,6 +58,27 @@ namespace QuantConnect.Tests.Common
             Assert.AreEqual(expected, actual);
         }
 
+        [Test]
+        public void GenerationChangesWhenMappingsChange()
+        {
+            var address = new IntPtr(SymbolCache.GetGenerationAddress());
+            var generation = Marshal.ReadInt64(address);
+
+            SymbolCache.TryGetSymbol("ticker", out _);
+            Assert.AreEqual(generation, Marshal.ReadInt64(address), "Lookups should not change the generation");
+
+            SymbolCache.Set("ticker", Symbols.EURUSD);
+            Assert.Greater(Marshal.ReadInt64(address), generation);
+            generation = Marshal.ReadInt64(address);
+
+            SymbolCache.TryRemove("ticker");
+            Assert.Greater(Marshal.ReadInt64(address), generation);
+            generation = Marshal.ReadInt64(address);
+
+            SymbolCache.Clear();
+            Assert.Greater(Marshal.ReadInt64(address), generation);
+        }
+
         [Test]
         [TestCase(SecurityType.Base)]
         [TestCase(SecurityType.Cfd)]
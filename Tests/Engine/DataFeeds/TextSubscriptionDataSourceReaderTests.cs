@@ -22,6 +22,8 @@ using System.Threading;
 using System.Threading.Tasks;
 using Accord.Math.Comparers;
 using NUnit.Framework;
+using NodaTime;
+using Python.Runtime;
 using QuantConnect.Data;
 using QuantConnect.Data.Market;
 using QuantConnect.Interfaces;
@@ -368,6 +370,48 @@ namespace QuantConnect.Tests.Engine.DataFeeds
             Log.Trace($"Took {timer.ElapsedMilliseconds}ms. Data count {counter}");
         }
 
+        [Test]
+        public void BadLineInPythonReaderBatchOnlyDropsThatLine()
+        {
+            Type type;
+            using (Py.GIL())
+            {
+                var testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def reader(self, config, line, date, is_live):
+        row = line.split(',')
+        data = CustomDataTest()
+        data.symbol = config.symbol
+        data.time = datetime.strptime(row[0], '%Y-%m-%d')
+        data.value = float(row[1])
+        return data
+
+    def reader_batch(self, config, lines, date, is_live):
+        return [self.reader(config, line, date, is_live) for line in lines]");
+                type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
+            }
+
+            var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, DateTimeZone.Utc,
+                DateTimeZone.Utc, false, false, false, isCustom: true);
+            using var dataCacheProvider = new CustomEphemeralDataCacheProvider
+            {
+                IsDataEphemeral = true,
+                Data = string.Join(Environment.NewLine, "2022-05-04,10", "2022-05-05,bad", "2022-05-06,12")
+            };
+            var reader = new TextSubscriptionDataSourceReader(dataCacheProvider, config, _initialDate, false, null);
+            var errors = new List<ReaderErrorEventArgs>();
+            reader.ReaderError += (_, args) => errors.Add(args);
+
+            var data = reader.Read(new SubscriptionDataSource("source", SubscriptionTransportMedium.LocalFile)).ToList();
+
+            CollectionAssert.AreEqual(new[] { 10m, 12m }, data.Select(x => x.Value));
+            Assert.AreEqual(1, errors.Count);
+            Assert.AreEqual("2022-05-05,bad", errors[0].Line);
+        }
+
         private class TestTradeBarFactory : TradeBar
         {
             /// <summary>
@@ -377,6 +377,135 @@ class CustomSimpleMovingAverage(PythonIndicator):
             }
         }
 
+        [Test]
+        public void UpdateBatchMatchesStreamingUpdates()
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(
+                    Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+from collections import deque
+
+class CustomSimpleMovingAverage(PythonIndicator):
+    def __init__(self, name, period):
+        self.name = name
+        self.value = 0
+        self.queue = deque(maxlen=period)
+        self.warm_up_period = period
+
+    def update(self, input):
+        self.queue.appendleft(input.value)
+        count = len(self.queue)
+        self.value = np.sum(self.queue) / count
+        return count == self.queue.maxlen
+
+    def update_batch(self, times, opens, highs, lows, closes, volumes):
+        period = self.queue.maxlen
+        closes = np.concatenate([np.array(self.queue, dtype=float)[::-1], closes])
+        sums = np.cumsum(np.insert(closes, 0, 0))
+        values = np.full(len(closes), np.nan)
+        values[period - 1:] = (sums[period:] - sums[:-period]) / period
+        self.queue.extendleft(closes[-period:])
+        self.value = values[-1]
+        return values[-len(times):]
+"
+                );
+                var streaming = new PythonIndicator(module.GetAttr("CustomSimpleMovingAverage").Invoke("streaming".ToPython(), 5.ToPython()));
+                var batch = new PythonIndicator(module.GetAttr("CustomSimpleMovingAverage").Invoke("batch".ToPython(), 5.ToPython()));
+                Assert.IsTrue(batch.ImplementsUpdateBatch);
+
+                var reference = new DateTime(2000, 1, 1);
+                var inputs = Enumerable.Range(1, 20)
+                    .Select(i => (IBaseData)new TradeBar(reference.AddDays(i), Symbols.SPY, i, i + 1, i - 1, i * 1.5m, 100, Time.OneDay))
+                    .ToList();
+
+                var streamingValues = new List<(decimal Value, long Samples, decimal Previous)>();
+                streaming.Updated += (_, point) =>
+                {
+                    if (streaming.IsReady) streamingValues.Add((point.Value, streaming.Samples, streaming.Previous.Value));
+                };
+                foreach (var input in inputs)
+                {
+                    streaming.Update(input);
+                }
+
+                // the batch state advances with each published value, like the streaming updates
+                var batchValues = new List<(decimal Value, long Samples, decimal Previous)>();
+                batch.Updated += (_, point) =>
+                {
+                    // like the streaming indicator, it's ready at each published value
+                    Assert.IsTrue(batch.IsReady);
+                    batchValues.Add((point.Value, batch.Samples, batch.Previous.Value));
+                };
+                Assert.IsTrue(batch.UpdateBatch(inputs, requireValues: true));
+
+                Assert.AreEqual(inputs.Count, batch.Samples);
+                Assert.AreEqual((double)streaming.Current.Value, (double)batch.Current.Value, 1e-10);
+                Assert.AreEqual(streaming.Current.EndTime, batch.Current.EndTime);
+                Assert.AreEqual(streamingValues.Count, batchValues.Count);
+                for (var i = 0; i < streamingValues.Count; i++)
+                {
+                    Assert.AreEqual((double)streamingValues[i].Value, (double)batchValues[i].Value, 1e-10);
+                    Assert.AreEqual(streamingValues[i].Samples, batchValues[i].Samples);
+                    if (i > 0)
+                    {
+                        // the streaming indicator also publishes the values before it's ready
+                        Assert.AreEqual((double)streamingValues[i].Previous, (double)batchValues[i].Previous, 1e-10);
+                    }
+                }
+            }
+        }
+
+        [Test]
+        public void UpdateBatchCurrentIsTheLastReturnedValue([Values] bool returnsValues)
+        {
+            using (Py.GIL())
+            {
+                var module = PyModule.FromString(
+                    Guid.NewGuid().ToString(),
+                    @"
+from AlgorithmImports import *
+
+class CustomLastClose(PythonIndicator):
+    def __init__(self, returns_values):
+        self.name = 'LastClose'
+        self.value = 0
+        self.returns_values = returns_values
+
+    def update(self, input):
+        self.value = input.value
+        return True
+
+    def update_batch(self, times, opens, highs, lows, closes, volumes):
+        # the value attribute is not kept in sync by the batch update
+        self.value = -1
+        return closes if self.returns_values else None
+"
+                );
+                var indicator = new PythonIndicator(module.GetAttr("CustomLastClose").Invoke(returnsValues.ToPython()));
+
+                var reference = new DateTime(2000, 1, 1);
+                var inputs = Enumerable.Range(1, 3)
+                    .Select(i => (IBaseData)new IndicatorDataPoint(Symbols.SPY, reference.AddDays(i), i))
+                    .ToList();
+
+                if (returnsValues)
+                {
+                    indicator.UpdateBatch(inputs);
+                    Assert.AreEqual(3m, indicator.Current.Value);
+                }
+                else
+                {
+                    Assert.Throws<ArgumentException>(() => indicator.UpdateBatch(inputs, requireValues: true));
+                    indicator.UpdateBatch(inputs);
+                    Assert.AreEqual(-1m, indicator.Current.Value);
+                }
+                Assert.AreEqual(reference.AddDays(3), indicator.Current.EndTime);
+            }
+        }
+
         [Test]
         public void SetDefaultWarmUpPeriodProperly()
         {
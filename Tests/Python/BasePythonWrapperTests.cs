@@ -52,6 +52,72 @@ class PythonTestModel:
             Assert.IsFalse(wrapper.Equals(pyModel));
         }
 
+        [Test]
+        public void CountsMethodCalls()
+        {
+            using var _ = Py.GIL();
+
+            var module = PyModule.FromString("CountsMethodCalls", @"
+class CountsMethodCallsTestModel:
+    def int_return_type_method(self):
+        return 1
+
+    def range(self, min, max):
+        return range(min, max)
+");
+            var statistics = PythonMethodStatistics.Start();
+            try
+            {
+                using var pyModel = module.GetAttr("CountsMethodCallsTestModel").Invoke();
+                using var wrapper = new BasePythonWrapper<RuntimeChecks.InvokingMethod.ITestInvokeMethodModel>(pyModel);
+
+                for (var i = 0; i < 10; i++)
+                {
+                    Assert.AreEqual(1, wrapper.InvokeMethod<int>("IntReturnTypeMethod"));
+                }
+                CollectionAssert.AreEqual(new[] { 5, 6, 7 }, wrapper.InvokeMethodAndEnumerate<int>("Range", 5, 8).ToList());
+
+                var counter = statistics.GetCounter("CountsMethodCallsTestModel.IntReturnTypeMethod");
+                Assert.AreEqual(10, counter.Calls);
+                Assert.Greater(counter.Elapsed, TimeSpan.Zero);
+                var enumerateCounter = statistics.GetCounter("CountsMethodCallsTestModel.Range");
+                Assert.AreEqual(1, enumerateCounter.Calls);
+                Assert.Greater(enumerateCounter.Elapsed, TimeSpan.Zero);
+                StringAssert.Contains("CountsMethodCallsTestModel.IntReturnTypeMethod: 10 calls", statistics.GetSummary(int.MaxValue));
+            }
+            finally
+            {
+                PythonMethodStatistics.Stop();
+            }
+        }
+
+        [Test]
+        public void MethodCallsAreNotCountedByDefault()
+        {
+            using var _ = Py.GIL();
+
+            var module = PyModule.FromString("MethodCallsAreNotCountedByDefault", @"
+class MethodCallsAreNotCountedByDefaultTestModel:
+    def int_return_type_method(self):
+        return 1
+");
+            using var pyModel = module.GetAttr("MethodCallsAreNotCountedByDefaultTestModel").Invoke();
+            using var wrapper = new BasePythonWrapper<RuntimeChecks.InvokingMethod.ITestInvokeMethodModel>(pyModel);
+            Assert.AreEqual(1, wrapper.InvokeMethod<int>("IntReturnTypeMethod"));
+
+            // methods resolved while the statistics are disabled are not tracked, even if they are enabled afterwards
+            var statistics = PythonMethodStatistics.Start();
+            try
+            {
+                Assert.AreEqual(1, wrapper.InvokeMethod<int>("IntReturnTypeMethod"));
+                Assert.IsEmpty(statistics.GetCounters());
+            }
+            finally
+            {
+                PythonMethodStatistics.Stop();
+            }
+        }
+
         [TestFixture]
         public class RuntimeChecks
         {
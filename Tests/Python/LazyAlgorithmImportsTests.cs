@@ -0,0 +1,69 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ *
+*/
+
+using Python.Runtime;
+using NUnit.Framework;
+
+namespace QuantConnect.Tests.Python
+{
+    [TestFixture]
+    public class LazyAlgorithmImportsTests
+    {
+        [TestCase("QCAlgorithm")]
+        [TestCase("Resolution")]
+        [TestCase("Symbol")]
+        [TestCase("TradeBar")]
+        [TestCase("SimpleMovingAverage")]
+        [TestCase("InsightDirection")]
+        [TestCase("OrderStatus")]
+        [TestCase("DateTime")]
+        [TestCase("List")]
+        [TestCase("QCAlgorithmFramework")]
+        public void ResolvesTheSameNamesAsAlgorithmImports(string name)
+        {
+            using (Py.GIL())
+            {
+                using var module = PyModule.FromString("ResolvesTheSameNamesAsAlgorithmImports", @"
+import AlgorithmImports
+import LazyAlgorithmImports
+
+def resolves_the_same(name):
+    return getattr(LazyAlgorithmImports, name) == getattr(AlgorithmImports, name)
+");
+                Assert.IsTrue(module.GetAttr("resolves_the_same").Invoke(name.ToPython()).As<bool>());
+            }
+        }
+
+        [Test]
+        public void ImportsOnlyTheNamespaceOwningTheName()
+        {
+            using (Py.GIL())
+            {
+                using var module = PyModule.FromString("ImportsOnlyTheNamespaceOwningTheName", @"
+from importlib import reload
+import LazyAlgorithmImports
+
+def imported_namespaces(name):
+    lazy = reload(LazyAlgorithmImports)
+    lazy._find(name)
+    return [key for key in lazy.load_times if key not in ('assemblies', 'index')]
+");
+                var namespaces = module.GetAttr("imported_namespaces").Invoke("QCAlgorithm".ToPython()).As<string[]>();
+                CollectionAssert.AreEqual(new[] { "QuantConnect.Algorithm" }, namespaces);
+            }
+        }
+    }
+}
@@ -233,6 +233,105 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void TypedColumnsAreConvertedToNumpyArrays()
+        {
+            var converter = new PandasConverter();
+            var time = new DateTime(2013, 10, 8);
+            var data = new List<Tick>
+            {
+                new Tick(time, Symbols.SPY, 100m, 101m),
+                new Tick(time.AddSeconds(1), Symbols.SPY, string.Empty, "ARCA", 10m, 115m),
+                new Tick(time.AddSeconds(2), Symbols.SPY, 99m, 102m),
+            };
+
+            dynamic dataFrame = converter.GetDataFrame(data);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import numpy as np
+def Test(dataFrame):
+    for column in ['askprice', 'bidprice', 'lastprice', 'quantity']:
+        if dataFrame[column].dtype != np.float64:
+            raise Exception(f'Unexpected dtype for {column}: {dataFrame[column].dtype}')
+    if not np.isnan(dataFrame['askprice'].iloc[1]):
+        raise Exception('Missing quote values should be NaN')
+    if dataFrame['askprice'].iloc[2] != 102:
+        raise Exception(f'Unexpected ask price {dataFrame[""askprice""].iloc[2]}')
+    if dataFrame['exchange'].dtype != object:
+        raise Exception(f'Unexpected dtype for exchange: {dataFrame[""exchange""].dtype}')
+    if dataFrame.index.levels[1].dtype != 'datetime64[ns]':
+        raise Exception(f'Unexpected time index dtype: {dataFrame.index.levels[1].dtype}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(dataFrame));
+            }
+        }
+
+        [Test]
+        public void ColumnarDataKeepsRepeatedTimes()
+        {
+            var time = new DateTime(2013, 10, 8, 9, 31, 0);
+            var pandasData = new PandasData(new TradeBar(time, Symbols.SPY, 1m, 1m, 1m, 1m, 10m, TimeSpan.Zero));
+            pandasData.Add(new TradeBar(time, Symbols.SPY, 1m, 1m, 1m, 1m, 10m, TimeSpan.Zero));
+            pandasData.Add(new TradeBar(time, Symbols.SPY, 2m, 2m, 2m, 2m, 20m, TimeSpan.Zero));
+            pandasData.Add(new QuoteBar(time.AddMinutes(-1), Symbols.SPY, new Bar(3m, 3m, 3m, 3m), 30m, new Bar(4m, 4m, 4m, 4m), 40m, TimeSpan.Zero));
+
+            using (Py.GIL())
+            {
+                using var columns = pandasData.ToColumnarDictionary();
+
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import numpy as np
+def Test(columns):
+    if len(columns['time']) != 3:
+        raise Exception(f'Unexpected times {columns[""time""]}')
+    if not np.array_equal(columns['volume'], [np.nan, 10, 20], equal_nan=True):
+        raise Exception(f'Unexpected volume {columns[""volume""]}')
+    if not np.array_equal(columns['bidclose'], [3, np.nan, np.nan], equal_nan=True):
+        raise Exception(f'Unexpected bid close {columns[""bidclose""]}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(columns));
+            }
+        }
+
+        [Test]
+        public void OptionContractsShareTheTimeLevel()
+        {
+            var time = new DateTime(2016, 1, 4, 9, 31, 0);
+            var slices = Enumerable.Range(0, 3).Select(i =>
+            {
+                var bars = new[] { Symbols.SPY_C_192_Feb19_2016, Symbols.SPY_P_192_Feb19_2016 }
+                    .Select(symbol => (BaseData)new TradeBar(time.AddMinutes(i), symbol, 1m + i, 2m + i, 0.5m + i, 1.5m + i, 10m, Time.OneMinute))
+                    .ToList();
+                return new Slice(time.AddMinutes(i + 1), bars, time.AddMinutes(i + 1));
+            }).ToList();
+
+            dynamic dataFrame = _converter.GetDataFrame(slices);
+
+            using (Py.GIL())
+            {
+                dynamic test = PyModule.FromString("testModule",
+                    @"
+import numpy as np
+def Test(dataFrame, call, put):
+    if list(dataFrame.index.names) != ['expiry', 'strike', 'type', 'symbol', 'time']:
+        raise Exception(f'Unexpected index names {dataFrame.index.names}')
+    if dataFrame.index.levels[4].dtype != 'datetime64[ns]':
+        raise Exception(f'Unexpected time level dtype {dataFrame.index.levels[4].dtype}')
+    if len(dataFrame.index.levels[4]) != 3:
+        raise Exception(f'Unexpected time level {dataFrame.index.levels[4]}')
+    for symbol in [call, put]:
+        closes = dataFrame.xs(symbol, level='symbol')['close'].values
+        if not np.array_equal(closes, [1.5, 2.5, 3.5]):
+            raise Exception(f'Unexpected closes {closes} for {symbol}')").GetAttr("Test");
+
+                Assert.DoesNotThrow(() => test(dataFrame, Symbols.SPY_C_192_Feb19_2016, Symbols.SPY_P_192_Feb19_2016));
+            }
+        }
+
         [Test]
         public void HandlesEmptyEnumerable()
         {
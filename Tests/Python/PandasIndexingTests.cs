@@ -86,6 +86,40 @@ namespace QuantConnect.Tests.Python
             }
         }
 
+        [Test]
+        public void MappedKeyTakesPrecedence()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_mapped_key_takes_precedence();
+
+                Assert.AreEqual(1, result.As<int>());
+            }
+        }
+
+        [Test]
+        public void UnrelatedFrameSkipsMapping()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_unrelated_frame_skips_mapping();
+
+                Assert.IsTrue(result.As<bool>());
+            }
+        }
+
+        [Test]
+        public void NonStringKeyExceptionIsNotRemapped()
+        {
+            using (Py.GIL())
+            {
+                PyObject result = _pandasDataFrameTests.test_non_string_key_exception();
+                var exception = result.As<string>();
+
+                Assert.AreEqual("10", exception);
+            }
+        }
+
         [Test]
         public void ColumnEqualsOnlyMatchingString()
         {
@@ -15,6 +15,7 @@ from AlgorithmImports import *
 from QuantConnect.Tests import *
 from QuantConnect.Tests.Python import *
 from PandasMapper import PandasColumn
+import PandasMapper
 
 # TODO: Rename to PandasResearchTests and keep this class for QB related tests; rename py module to PandasTests
 class PandasIndexingTests():
@@ -59,6 +60,31 @@ class PandasDataFrameTests():
         except KeyError as e:
             return str(e)
 
+    def test_non_string_key_exception(self):
+        # Non string keys can't be mapped, the original pandas exception should be raised
+        df = pd.DataFrame({'spy': [2, 5, 8, 10]})
+        try:
+            df.loc[10]
+        except KeyError as e:
+            return str(e)
+
+    def test_mapped_key_takes_precedence(self):
+        # The ticker is mapped to its Symbol before trying the raw label
+        df = pd.DataFrame({'close': [1, 2]}, index=[self.spy, 'SPY'])
+        return int(df.loc['SPY']['close'])
+
+    def test_unrelated_frame_skips_mapping(self):
+        # Frames holding no Symbol objects are indexed with the raw key, the ticker isn't looked up
+        lookups = []
+        try_get_symbol = PandasMapper.try_get_symbol
+        PandasMapper.try_get_symbol = lambda key: lookups.append(key) or try_get_symbol(key)
+        try:
+            df = pd.DataFrame({'close': [1, 2]}, index=['SPY', 'AAPL'])
+            close = int(df.loc['SPY']['close']) + int(df['close'].sum()) + int('AAPL' in df.index)
+        finally:
+            PandasMapper.try_get_symbol = try_get_symbol
+        return close == 5 and len(lookups) == 0
+
     def test_contains_user_defined_columns_with_spaces(self, column_name):
         # Adds a column, then try accessing it.
         # If the colums has white spaces, it should not fail
@@ -262,6 +262,91 @@ class CustomDataTest(PythonData):
             }
         }
 
+        [TestCase(true)]
+        [TestCase(false)]
+        public void ReaderBatch(bool columnar)
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    $@"
+from AlgorithmImports import *
+import numpy as np
+
+class CustomDataTest(PythonData):
+    def reader(self, config, line, date, is_live):
+        raise ValueError('reader_batch should be used')
+
+    def reader_batch(self, config, lines, date, is_live):
+        rows = [line.split(',') for line in lines]
+        if {(columnar ? "True" : "False")}:
+            return {{
+                'time': np.array([row[0] for row in rows], dtype='datetime64[ns]'),
+                'value': np.array([float(row[1]) for row in rows]),
+                'signal': np.array([row[2] for row in rows]),
+                'volume': np.array([int(row[3]) for row in rows], dtype=np.int64)
+            }}
+        result = []
+        for row in rows:
+            data = CustomDataTest()
+            data.symbol = config.symbol
+            data.time = datetime.strptime(row[0], '%Y-%m-%d')
+            data.value = float(row[1])
+            data['signal'] = row[2]
+            data['volume'] = int(row[3])
+            result.append(data)
+        return result
+
+    def is_buy(self):
+        return self['signal'] == 'buy'");
+
+                var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
+                var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+                var config = new SubscriptionDataConfig(type, Symbols.SPY, Resolution.Daily, DateTimeZone.Utc,
+                    DateTimeZone.Utc, false, false, false, isCustom: true);
+
+                Assert.IsTrue(customDataTest.ImplementsReaderBatch);
+                var lines = new List<string> { "2022-05-05,10.5,buy,9007199254740993", "2022-05-06,11,sell,1" };
+                var data = customDataTest.ReaderBatch(config, lines, DateTime.UtcNow, false);
+
+                Assert.AreEqual(2, data.Count);
+                Assert.AreEqual(new DateTime(2022, 5, 5), data[0].Time);
+                Assert.AreEqual(new DateTime(2022, 5, 6), data[1].EndTime);
+                Assert.AreEqual(10.5m, data[0].Value);
+                Assert.AreEqual(11m, data[1].Value);
+                Assert.AreEqual(Symbols.SPY, data[1].Symbol);
+
+                var pythonData = (PythonData)data[1];
+                Assert.AreEqual("sell", pythonData["signal"]);
+                Assert.IsTrue(pythonData.HasProperty("__typename"));
+                Assert.AreEqual(9007199254740993m, ((PythonData)data[0])["volume"]);
+
+                // the rows are instances of the Python type, holding its methods
+                using var pyData = data[0].ToPython();
+                Assert.IsTrue(pyData.InvokeMethod("is_buy").As<bool>());
+                Assert.AreEqual("CustomDataTest", pyData.GetPythonType().Name);
+            }
+        }
+
+        [Test]
+        public void ReaderBatchIsOptional()
+        {
+            using (Py.GIL())
+            {
+                dynamic testModule = PyModule.FromString("testModule",
+                    @"
+from AlgorithmImports import *
+
+class CustomDataTest(PythonData):
+    def reader(self, config, line, date, is_live):
+        return None");
+
+                var customDataTest = new PythonData(testModule.GetAttr("CustomDataTest")());
+
+                Assert.IsFalse(customDataTest.ImplementsReaderBatch);
+            }
+        }
+
         private static BaseData GetDataFromModule(dynamic testModule)
         {
             var type = Extensions.CreateType(testModule.GetAttr("CustomDataTest"));
@@ -20,6 +20,7 @@ using QuantConnect.Report;
 using QuantConnect.Brokerages;
 using System;
 using System.Collections.Generic;
+using System.IO;
 using System.Linq;
 
 namespace QuantConnect.Tests.Report
@@ -221,5 +222,59 @@ namespace QuantConnect.Tests.Report
             Assert.AreEqual(orderQuantity, holdings[0].Quantity);
             Assert.AreEqual(orderQuantity * orderPrice, holdings[0].HoldingsValue);
         }
+
+        [Test]
+        public void ResumesFromCheckpoint()
+        {
+            var equityPoints = new SortedList<DateTime, double>
+            {
+                { new DateTime(2019, 1, 3, 5, 0, 5), 100000 },
+                { new DateTime(2019, 1, 7, 5, 0, 5), 90000 },
+            };
+            var series = new Series<DateTime, double>(equityPoints);
+            var orders = Enumerable.Range(1, 4).Select(i => CreateFilledOrder(i, i % 2 == 0 ? -1 : 2, 100000m - i * 1000, new DateTime(2019, 1, 3 + i, 5, 0, 5))).ToList();
+            var checkpointPath = Path.GetTempFileName();
+            File.Delete(checkpointPath);
+
+            try
+            {
+                var expected = PortfolioLooper.FromOrders(series, orders).ToList();
+
+                PortfolioLooper.FromOrders(series, orders.Take(2), checkpointPath: checkpointPath).ToList();
+                Assert.IsTrue(File.Exists(checkpointPath));
+
+                var resumed = PortfolioLooper.FromOrders(series, orders, checkpointPath: checkpointPath).ToList();
+
+                Assert.AreEqual(expected.Count, resumed.Count);
+                for (var i = 0; i < expected.Count; i++)
+                {
+                    Assert.AreEqual(expected[i].Time, resumed[i].Time);
+                    Assert.AreEqual(expected[i].Order.Id, resumed[i].Order.Id);
+                    Assert.AreEqual(expected[i].TotalPortfolioValue, resumed[i].TotalPortfolioValue);
+                    Assert.AreEqual(expected[i].Cash, resumed[i].Cash);
+                    Assert.AreEqual(expected[i].Holdings.Single().Quantity, resumed[i].Holdings.Single().Quantity);
+                    Assert.AreEqual(expected[i].Holdings.Single().HoldingsValue, resumed[i].Holdings.Single().HoldingsValue);
+                }
+
+                // a checkpoint written for different orders is ignored
+                orders[0] = CreateFilledOrder(1, 3, 99000m, orders[0].Time);
+                var changed = PortfolioLooper.FromOrders(series, orders, checkpointPath: checkpointPath).ToList();
+                Assert.AreEqual(3, changed[0].Holdings.Single().Quantity);
+            }
+            finally
+            {
+                File.Delete(checkpointPath);
+            }
+        }
+
+        private static Order CreateFilledOrder(int id, decimal quantity, decimal price, DateTime time)
+        {
+            var order = Order.CreateOrder(new SubmitOrderRequest(OrderType.Market, SecurityType.Equity, Symbols.SPY, quantity, 0m, 0m, time, string.Empty));
+            order.LastFillTime = time;
+            order.GetType().GetProperty("Id").SetValue(order, id);
+            order.GetType().GetProperty("Price").SetValue(order, price);
+            order.GetType().GetProperty("Status").SetValue(order, OrderStatus.Filled);
+            return order;
+        }
     }
 }
@@ -0,0 +1,77 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Linq;
+using Deedle;
+using NUnit.Framework;
+using QuantConnect.Report;
+
+namespace QuantConnect.Tests.Report
+{
+    [TestFixture]
+    public class SeriesDownsamplerTests
+    {
+        [Test]
+        public void ReturnsShortSeriesUnchanged()
+        {
+            var series = CreateSeries(100);
+
+            var downsampled = series.Downsample(buckets: 50);
+
+            Assert.AreSame(series, downsampled);
+        }
+
+        [Test]
+        public void KeepsExtremesAndBoundaries()
+        {
+            var series = CreateSeries(100000);
+
+            var downsampled = series.Downsample(buckets: 100);
+
+            Assert.LessOrEqual(downsampled.KeyCount, 2 * 100 + 2);
+            Assert.AreEqual(series.FirstKey(), downsampled.FirstKey());
+            Assert.AreEqual(series.LastKey(), downsampled.LastKey());
+            Assert.AreEqual(series.Values.Min(), downsampled.Values.Min());
+            Assert.AreEqual(series.Values.Max(), downsampled.Values.Max());
+            CollectionAssert.IsOrdered(downsampled.Keys.ToList());
+        }
+
+        [Test]
+        public void KeepsRequestedTimes()
+        {
+            var series = CreateSeries(100000);
+            var keep = new[] { series.GetKeyAt(12345), series.GetKeyAt(54321) };
+
+            var downsampled = series.Downsample(buckets: 100, keep: keep);
+
+            foreach (var time in keep)
+            {
+                Assert.AreEqual(series[time], downsampled[time]);
+            }
+        }
+
+        private static Series<DateTime, double> CreateSeries(int count)
+        {
+            var random = new Random(42);
+            var start = new DateTime(2010, 1, 1);
+            var value = 0d;
+
+            return new Series<DateTime, double>(
+                Enumerable.Range(0, count).Select(i => start.AddMinutes(i)),
+                Enumerable.Range(0, count).Select(_ => value += random.NextDouble() - 0.5));
+        }
+    }
+}
@@ -0,0 +1,199 @@
+/*
+ * QUANTCONNECT.COM - Democratizing Finance, Empowering Individuals.
+ * Lean Algorithmic Trading Engine v2.0. Copyright 2014 QuantConnect Corporation.
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+*/
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using Newtonsoft.Json;
+using NUnit.Framework;
+using QuantConnect.Lean.Engine.Results;
+using QuantConnect.Logging;
+using QuantConnect.Orders;
+using QuantConnect.Packets;
+using QuantConnect.Report;
+
+namespace QuantConnect.Tests.Report
+{
+    [TestFixture]
+    public class StreamingResultReaderTests
+    {
+        [Test]
+        public void ReadsTheSameMembersAsFullDeserialization()
+        {
+            var json = JsonConvert.SerializeObject(CreateResult(points: 100, orders: 10, extraCharts: 2));
+
+            var expected = JsonConvert.DeserializeObject<BacktestResult>(json, new JsonSerializerSettings
+            {
+                Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<BacktestResult>() },
+                FloatParseHandling = FloatParseHandling.Decimal
+            });
+            var actual = StreamingResultReader.Read<BacktestResult>(new StringReader(json));
+
+            CollectionAssert.AreEquivalent(expected.Statistics, actual.Statistics);
+            CollectionAssert.AreEquivalent(expected.AlgorithmConfiguration.Parameters, actual.AlgorithmConfiguration.Parameters);
+            Assert.AreEqual(expected.Orders.Count, actual.Orders.Count);
+            foreach (var (id, order) in expected.Orders)
+            {
+                Assert.AreEqual(order.GetType(), actual.Orders[id].GetType());
+                Assert.AreEqual(order.Symbol, actual.Orders[id].Symbol);
+                Assert.AreEqual(order.Quantity, actual.Orders[id].Quantity);
+                Assert.AreEqual(order.Time, actual.Orders[id].Time);
+            }
+
+            CollectionAssert.AreEqual(ResultsUtil.EquityPoints(expected), ResultsUtil.EquityPoints(actual));
+            CollectionAssert.AreEqual(ResultsUtil.BenchmarkPoints(expected), ResultsUtil.BenchmarkPoints(actual));
+        }
+
+        [Test]
+        public void SkipsMembersChartsAndSeriesNotUsedByTheReport()
+        {
+            var result = CreateResult(points: 10, orders: 1, extraCharts: 3);
+            result.RuntimeStatistics = new Dictionary<string, string> { { "Equity", "$100,000.00" } };
+            result.Charts[BaseResultsHandler.StrategyEquityKey].AddSeries(new Series("Unused"));
+
+            var actual = StreamingResultReader.Read<BacktestResult>(new StringReader(JsonConvert.SerializeObject(result)));
+
+            Assert.IsNull(actual.RuntimeStatistics);
+            CollectionAssert.AreEquivalent(new[] { BaseResultsHandler.StrategyEquityKey, BaseResultsHandler.BenchmarkKey }, actual.Charts.Keys);
+            CollectionAssert.AreEquivalent(new[] { BaseResultsHandler.EquityKey, BaseResultsHandler.ReturnKey },
+                actual.Charts[BaseResultsHandler.StrategyEquityKey].Series.Keys);
+        }
+
+        [Test]
+        public void NullChartPointsAreSkipped()
+        {
+            var json = "{\"Charts\":{\"Strategy Equity\":{\"Name\":\"Strategy Equity\",\"ChartType\":0,\"Series\":{" +
+                "\"Equity\":{\"Name\":\"Equity\",\"Values\":[[1695991900,null,null,null,null],[1695992500,10,11,9,10]],\"SeriesType\":2,\"Index\":0,\"Unit\":\"$\"}," +
+                "\"Return\":{\"Name\":\"Return\",\"Values\":[{\"x\":1695991900,\"y\":null},{\"x\":1695992500,\"y\":1.5}],\"SeriesType\":0,\"Index\":1,\"Unit\":\"%\"}}}}," +
+                "\"Orders\":{},\"RuntimeStatistics\":{}}";
+
+            var actual = StreamingResultReader.Read<LiveResult>(new StringReader(json));
+
+            var series = actual.Charts[BaseResultsHandler.StrategyEquityKey].Series;
+            Assert.AreEqual(1, series[BaseResultsHandler.EquityKey].Values.Count);
+            Assert.AreEqual(1, series[BaseResultsHandler.ReturnKey].Values.Count);
+            Assert.AreEqual(1.5m, ((ChartPoint)series[BaseResultsHandler.ReturnKey].Values[0]).y);
+        }
+
+        [Test]
+        public void NullResultIsReadAsNull()
+        {
+            Assert.IsNull(StreamingResultReader.Read<BacktestResult>(new StringReader("null")));
+        }
+
+        [Test, Explicit("Benchmark")]
+        public void BenchmarkLargeResultFile()
+        {
+            var path = Path.GetTempFileName();
+            try
+            {
+                // ~5 years of minute equity points, plus large charts the report does not use
+                using (var writer = new StreamWriter(path))
+                {
+                    JsonSerializer.CreateDefault().Serialize(writer, CreateResult(points: 500000, orders: 50000, extraCharts: 10));
+                }
+
+                var stopwatch = Stopwatch.StartNew();
+                var allocated = GC.GetTotalAllocatedBytes(true);
+                var full = JsonConvert.DeserializeObject<BacktestResult>(File.ReadAllText(path), new JsonSerializerSettings
+                {
+                    Converters = new List<JsonConverter> { new NullResultValueTypeJsonConverter<BacktestResult>() },
+                    FloatParseHandling = FloatParseHandling.Decimal
+                });
+                var fullMemory = GC.GetTotalMemory(true);
+                Log.Trace($"StreamingResultReaderTests.BenchmarkLargeResultFile(): file {new FileInfo(path).Length / 1024 / 1024}MB. " +
+                    $"Full deserialization took {stopwatch.Elapsed}, allocated {(GC.GetTotalAllocatedBytes(true) - allocated) / 1024 / 1024}MB, " +
+                    $"retained {fullMemory / 1024 / 1024}MB");
+                GC.KeepAlive(full);
+                GC.Collect();
+
+                stopwatch.Restart();
+                allocated = GC.GetTotalAllocatedBytes(true);
+                var streamed = StreamingResultReader.Read<BacktestResult>(path);
+                var streamedMemory = GC.GetTotalMemory(true);
+                Log.Trace($"StreamingResultReaderTests.BenchmarkLargeResultFile(): Streaming read took {stopwatch.Elapsed}, " +
+                    $"allocated {(GC.GetTotalAllocatedBytes(true) - allocated) / 1024 / 1024}MB, retained {streamedMemory / 1024 / 1024}MB");
+
+                Assert.AreEqual(50000, streamed.Orders.Count);
+                Assert.Less(streamedMemory, fullMemory);
+            }
+            finally
+            {
+                File.Delete(path);
+            }
+        }
+
+        private static BacktestResult CreateResult(int points, int orders, int extraCharts)
+        {
+            var start = new DateTime(2015, 1, 1);
+            var random = new Random(42);
+
+            var strategyEquity = new Chart(BaseResultsHandler.StrategyEquityKey);
+            var equity = new CandlestickSeries(BaseResultsHandler.EquityKey);
+            var returns = new Series(BaseResultsHandler.ReturnKey, SeriesType.Bar, "%");
+            strategyEquity.AddSeries(equity);
+            strategyEquity.AddSeries(returns);
+
+            var benchmark = new Chart(BaseResultsHandler.BenchmarkKey);
+            var benchmarkSeries = new Series(BaseResultsHandler.BenchmarkKey);
+            benchmark.AddSeries(benchmarkSeries);
+
+            var charts = new Dictionary<string, Chart>
+            {
+                { strategyEquity.Name, strategyEquity },
+                { benchmark.Name, benchmark }
+            };
+            for (var i = 0; i < extraCharts; i++)
+            {
+                var chart = new Chart($"Custom{i}");
+                chart.AddSeries(new Series($"Series{i}"));
+                charts[chart.Name] = chart;
+            }
+
+            var value = 100000m;
+            for (var i = 0; i < points; i++)
+            {
+                var time = start.AddMinutes(i);
+                var change = (decimal)(random.NextDouble() - 0.5) * 100m;
+                equity.AddPoint(time, value, value + Math.Abs(change), value - Math.Abs(change), value + change);
+                returns.AddPoint(time, change / value);
+                benchmarkSeries.AddPoint(time, 100m + i * 0.001m);
+                foreach (var chart in charts.Values.Skip(2))
+                {
+                    ((Series)chart.Series.Values.Single()).AddPoint(time, change);
+                }
+                value += change;
+            }
+
+            var orderById = new Dictionary<int, Order>();
+            for (var i = 1; i <= orders; i++)
+            {
+                var order = new MarketOrder(Symbols.SPY, i % 2 == 0 ? 10 : -10, start.AddMinutes(i)) { Id = i };
+                orderById[i] = order;
+            }
+
+            return new BacktestResult
+            {
+                Charts = charts,
+                Orders = orderById,
+                Statistics = new Dictionary<string, string> { { "Total Orders", orders.ToStringInvariant() }, { "Sharpe Ratio", "1.5" } },
+                RuntimeStatistics = new Dictionary<string, string>(),
+                AlgorithmConfiguration = new AlgorithmConfiguration { Parameters = new Dictionary<string, string> { { "period", "14" } } }
+            };
+        }
+    }
+}